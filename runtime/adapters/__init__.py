@@ -3,5 +3,14 @@ from .codex import CodexAdapter
 from .gemini import GeminiAdapter
 from .opencode import OpenCodeAdapter
 from .qwen import QwenAdapter
+from .replay import ReplayAdapter, ReplayProfile
 
-__all__ = ["ClaudeAdapter", "CodexAdapter", "GeminiAdapter", "OpenCodeAdapter", "QwenAdapter"]
+__all__ = [
+    "ClaudeAdapter",
+    "CodexAdapter",
+    "GeminiAdapter",
+    "OpenCodeAdapter",
+    "QwenAdapter",
+    "ReplayAdapter",
+    "ReplayProfile",
+]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Optional
 
 from ..contracts import CapabilitySet, NormalizeContext, NormalizedFinding, TaskInput
 from .parsing import normalize_findings_from_text
@@ -32,6 +32,12 @@ class OpenCodeAdapter(ShimAdapterBase):
     def _build_command_for_record(self) -> List[str]:
         return ["opencode", "run", "<prompt>", "--format", "json"]
 
+    def _warm_server_command(self, port: int) -> Optional[List[str]]:
+        return ["opencode", "serve", "--hostname", "127.0.0.1", "--port", str(port)]
+
+    def _build_attached_command(self, input_task: TaskInput, server_url: str) -> List[str]:
+        return ["opencode", "run", "--attach", server_url, input_task.prompt, "--format", "json"]
+
     def normalize(self, raw: Any, ctx: NormalizeContext) -> List[NormalizedFinding]:
         text = raw if isinstance(raw, str) else ""
         return normalize_findings_from_text(text, ctx, "opencode")
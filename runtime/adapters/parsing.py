@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ..contracts import Evidence, NormalizedFinding, NormalizeContext, ProviderId
@@ -11,23 +13,189 @@ ALLOWED_CATEGORY = {"bug", "security", "performance", "maintainability", "test-g
 _FINAL_TEXT_CANDIDATE_LIMIT = 500
 
 
-def _decode_json_fragments(text: str) -> List[Any]:
-    decoder = json.JSONDecoder()
-    payloads: List[Any] = []
-    index = 0
-    while index < len(text):
-        match = re.search(r"[\{\[]", text[index:])
-        if not match:
-            break
-        start = index + match.start()
+_OPEN_RE = re.compile(r"[\{\[]")
+# A complete single-line JSON string, or a lone structural character. A lone quote means the
+# string runs into a newline (never valid JSON) or past the end of the buffer.
+_TOKEN_RE = re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"|[\{\}\[\]"]')
+_STRING_BODY_RE = re.compile(r'[^"\\\n]*(?:\\.[^"\\\n]*)*')
+_CLOSERS = {"}": "{", "]": "["}
+_SPAN_FAILED = -1
+_SPAN_INCOMPLETE = -2
+# Invalid candidates tolerated on the direct-decode fast path before a scanner sticks to bracket matching:
+# each failure may cost a pass over the buffer, which is what made the slice-and-retry decoder quadratic.
+_FAST_PATH_FAILURE_BUDGET = 16
+
+
+@dataclass(frozen=True)
+class JsonFragment:
+    start: int
+    end: int
+    value: Any
+
+
+@dataclass
+class _PendingSpan:
+    start: int
+    cursor: int
+    stack: List[Tuple[str, int]]
+
+
+class JsonFragmentScanner:
+    """
+    Incremental scanner yielding top-level JSON objects/arrays embedded in free text.
+
+    Yields exactly what calling `raw_decode` at every `{`/`[` would, in linear time. Candidates are
+    first decoded in place, which is fastest for the common case of well-formed provider events;
+    one that fails falls back to string-aware bracket matching, which finds where each candidate
+    would end (and which can never decode) before anything is decoded, so a failing candidate
+    costs its own length rather than a scan of the whole buffer. After `_FAST_PATH_FAILURE_BUDGET`
+    such failures the scanner only bracket-matches. While more input may follow, a value cut off
+    at the end of the buffer is held back until it completes.
+    Offsets in yielded fragments are absolute across all fed chunks.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._base = 0
+        self._pos = 0
+        self._spans: Dict[int, int] = {}
+        self._pending: Optional[_PendingSpan] = None
+        self._fast_failures = 0
+
+    def feed(self, chunk: str, final: bool = False) -> List[JsonFragment]:
+        if chunk:
+            self._buffer = self._buffer + chunk if self._buffer else chunk
+        fragments = self._scan(final)
+        self._compact()
+        return fragments
+
+    def close(self) -> List[JsonFragment]:
+        return self.feed("", final=True)
+
+    def _scan(self, final: bool) -> List[JsonFragment]:
+        text = self._buffer
+        fragments: List[JsonFragment] = []
+        while True:
+            pending = self._pending
+            self._pending = None
+            if pending is None:
+                match = _OPEN_RE.search(text, self._pos)
+                if match is None:
+                    self._pos = len(text)
+                    return fragments
+                start = match.start()
+                end = self._spans.get(start)
+                if end is None and self._fast_failures < _FAST_PATH_FAILURE_BUDGET:
+                    fragment = self._decode_in_place(text, start)
+                    if fragment is not None:
+                        fragments.append(fragment)
+                        self._pos = fragment.end - self._base
+                        continue
+                if end is None:
+                    # Match brackets: this tells a truncated value from an invalid one, bounds the
+                    # decode, and records the spans (or dead ends) of nested candidates.
+                    pending = _PendingSpan(start=start, cursor=start + 1, stack=[(text[start], start)])
+            if pending is not None:
+                start = pending.start
+                end = self._match_span(text, pending, final)
+                if end == _SPAN_INCOMPLETE:
+                    self._pending = pending
+                    self._pos = start
+                    return fragments
+            fragment = self._decode(text, start, end) if end >= 0 else None
+            if fragment is not None:
+                fragments.append(fragment)
+                self._pos = fragment.end - self._base
+                continue
+            if pending is not None:
+                # A truncated tail is not counted: it fails the fast path only until the rest arrives.
+                self._fast_failures += 1
+            self._pos = start + 1
+
+    def _decode_in_place(self, text: str, start: int) -> Optional[JsonFragment]:
+        # An object or array ends at its own closing bracket, so a successful decode is final even
+        # while more input may follow.
         try:
-            payload, end = decoder.raw_decode(text, start)
+            value, end = self._decoder.raw_decode(text, start)
         except json.JSONDecodeError:
-            index = start + 1
-            continue
-        payloads.append(payload)
-        index = end
-    return payloads
+            return None
+        return JsonFragment(start=self._base + start, end=self._base + end, value=value)
+
+    def _decode(self, text: str, start: int, end: int) -> Optional[JsonFragment]:
+        # Decoding only the matched span keeps a failure's cost (JSONDecodeError computes the line and
+        # column of the error over the whole document) proportional to the candidate.
+        try:
+            value, stop = self._decoder.raw_decode(text[start:end])
+        except json.JSONDecodeError:
+            return None
+        if stop != end - start:
+            return None
+        return JsonFragment(start=self._base + start, end=self._base + end, value=value)
+
+    def _match_span(self, text: str, pending: _PendingSpan, final: bool) -> int:
+        stack = pending.stack
+        cursor = pending.cursor
+        spans = self._spans
+        while stack:
+            token = _TOKEN_RE.search(text, cursor)
+            if token is None:
+                cursor = len(text)
+                break
+            char = text[token.start()]
+            cursor = token.end()
+            if char == '"':
+                if cursor - token.start() > 1:
+                    continue
+                body_end = _STRING_BODY_RE.match(text, cursor).end()
+                at_end = body_end >= len(text) or (text[body_end] == "\\" and body_end + 1 >= len(text))
+                if at_end and not final:
+                    pending.cursor = token.start()
+                    return _SPAN_INCOMPLETE
+                return self._fail_open(stack)
+            if char in _CLOSERS:
+                if stack[-1][0] != _CLOSERS[char]:
+                    return self._fail_open(stack)
+                _, opened_at = stack.pop()
+                spans[opened_at] = cursor
+            else:
+                stack.append((char, token.start()))
+        if stack:
+            if not final:
+                pending.cursor = cursor
+                return _SPAN_INCOMPLETE
+            return self._fail_open(stack)
+        return spans[pending.start]
+
+    def _fail_open(self, stack: List[Tuple[str, int]]) -> int:
+        # Every bracket still open reaches the same dead end, so none of them can start a value.
+        for _, opened_at in stack:
+            self._spans[opened_at] = _SPAN_FAILED
+        return _SPAN_FAILED
+
+    def _compact(self) -> None:
+        cut = self._pending.start if self._pending is not None else self._pos
+        if cut <= 0:
+            return
+        self._buffer = self._buffer[cut:]
+        self._base += cut
+        self._pos -= cut
+        self._spans = {
+            key - cut: (value - cut if value >= 0 else value) for key, value in self._spans.items() if key >= cut
+        }
+        if self._pending is not None:
+            self._pending.start -= cut
+            self._pending.cursor -= cut
+            self._pending.stack = [(char, opened_at - cut) for char, opened_at in self._pending.stack]
+
+
+def iter_json_fragments(text: str) -> List[JsonFragment]:
+    """Top-level JSON objects/arrays found in `text`, with their source offsets."""
+    return JsonFragmentScanner().feed(text, final=True)
+
+
+def _decode_json_fragments(text: str) -> List[Any]:
+    return [fragment.value for fragment in iter_json_fragments(text)]
 
 
 def _iter_nested_strings(payload: Any) -> List[str]:
@@ -180,16 +348,20 @@ def _collect_final_text_candidates(
                     _append_text_candidate(candidates, seen, item, limit=limit)
 
 
-def extract_final_text_from_output(text: str) -> str:
+def extract_final_text_from_output(text: str, *, payloads: Optional[List[Any]] = None) -> str:
     """
     Best-effort extraction of a user-facing final answer from provider output.
     Falls back to trimmed raw text when no structured candidates are detected.
+    Pass a `ParsedOutput`, or `payloads` from `extract_json_payloads(text)`, to reuse an earlier parse.
     """
+    if payloads is None and isinstance(text, ParsedOutput):
+        return text.final_text
     raw = text.strip()
     if not raw:
         return ""
 
-    payloads = extract_json_payloads(text)
+    if payloads is None:
+        payloads = extract_json_payloads(text)
     if not payloads:
         return raw
 
@@ -201,53 +373,208 @@ def extract_final_text_from_output(text: str) -> str:
     return _select_best_text_candidate(candidates) if candidates else raw
 
 
-def extract_json_payloads(text: str) -> List[Any]:
-    payloads: List[Any] = []
-    seen_signatures = set()
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", flags=re.DOTALL | re.IGNORECASE)
 
-    def add_payload(payload: Any) -> bool:
-        try:
-            signature = json.dumps(payload, sort_keys=True, ensure_ascii=True)
-        except Exception:
-            signature = repr(payload)
-        if signature in seen_signatures:
-            return False
-        seen_signatures.add(signature)
-        payloads.append(payload)
-        return True
 
-    stripped = text.strip()
-    if not stripped:
-        return payloads
-
-    for payload in _decode_json_fragments(stripped):
-        add_payload(payload)
-
-    for match in re.findall(r"```json\s*(.*?)\s*```", text, flags=re.DOTALL | re.IGNORECASE):
-        for payload in _decode_json_fragments(match):
-            add_payload(payload)
+def _windows_with_crossing_fragments(
+    windows: List[Tuple[int, int]],
+    fragments: List[JsonFragment],
+) -> List[Tuple[int, int]]:
+    """
+    Keep only windows that a top-level fragment straddles.
 
-    for line in text.splitlines():
+    Decoding a window on its own can only differ from the whole-text decode where a value
+    from the whole text runs across the window's edge; fragments fully inside a window are
+    found identically and would only be deduplicated away. Both lists are sorted by start.
+    """
+    selected: List[Tuple[int, int]] = []
+    first = 0
+    for window_start, window_end in windows:
+        while first < len(fragments) and fragments[first].end <= window_start:
+            first += 1
+        index = first
+        while index < len(fragments) and fragments[index].start < window_end:
+            fragment = fragments[index]
+            if fragment.start < window_start or fragment.end > window_end:
+                selected.append((window_start, window_end))
+                break
+            index += 1
+    return selected
+
+
+def _fence_windows(text: str) -> List[Tuple[int, int]]:
+    return [(match.start(1), match.end(1)) for match in _JSON_FENCE_RE.finditer(text)]
+
+
+def _line_windows(text: str) -> List[Tuple[int, int]]:
+    windows: List[Tuple[int, int]] = []
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        line_start = offset
+        offset += len(line)
         candidate = line.strip()
         if not candidate:
             continue
-        for payload in _decode_json_fragments(candidate):
-            add_payload(payload)
+        leading = len(line) - len(line.lstrip())
+        windows.append((line_start + leading, line_start + leading + len(candidate)))
+    return windows
+
+
+def extract_json_payloads(text: str) -> List[Any]:
+    """
+    All JSON payloads found in provider output, in discovery order and without duplicates.
+
+    Order: top-level values, then values only recoverable from ```json fences, then from
+    individual lines, then values embedded in string fields of payloads found so far.
+    Duplicates are detected by their source text rather than by re-serializing each value.
+    """
+    if not text.strip():
+        return []
+    return _assemble_payloads(text, iter_json_fragments(text))
+
+
+def _nested_fragments(payload: Any) -> List[Tuple[str, JsonFragment]]:
+    nested: List[Tuple[str, JsonFragment]] = []
+    for nested_text in _iter_nested_strings(payload):
+        if not _looks_like_nested_json_blob(nested_text):
+            continue
+        nested.extend((nested_text, fragment) for fragment in iter_json_fragments(nested_text))
+    return nested
+
+
+def _assemble_payloads(
+    text: str,
+    top_level: List[JsonFragment],
+    nested_by_fragment: Optional[List[List[Tuple[str, JsonFragment]]]] = None,
+) -> List[Any]:
+    """
+    Build the `extract_json_payloads` result from already-decoded top-level fragments.
+    `nested_by_fragment[i]`, when given, holds the pre-decoded nested values of `top_level[i]`.
+    """
+    payloads: List[Any] = []
+    origins: List[int] = []
+    seen_sources: Set[str] = set()
+    seen_values: Set[str] = set()
+
+    def add_fragment(source: str, fragment: JsonFragment, origin: int = -1) -> None:
+        # The same spelling is the common repeat and is cheap to spot; a new spelling may still be an
+        # equal value (other whitespace or key order), so it is compared by its canonical dump.
+        spelling = source[fragment.start:fragment.end]
+        if spelling in seen_sources:
+            return
+        seen_sources.add(spelling)
+        try:
+            signature = json.dumps(fragment.value, sort_keys=True, ensure_ascii=True)
+        except (TypeError, ValueError):
+            signature = repr(fragment.value)
+        if signature in seen_values:
+            return
+        seen_values.add(signature)
+        payloads.append(fragment.value)
+        origins.append(origin)
+
+    for position, fragment in enumerate(top_level):
+        add_fragment(text, fragment, position)
+
+    for windows in (_fence_windows(text), _line_windows(text)):
+        for window_start, window_end in _windows_with_crossing_fragments(windows, top_level):
+            window = text[window_start:window_end]
+            for fragment in iter_json_fragments(window):
+                add_fragment(window, fragment)
 
     # Recursively extract contract payloads from event-stream text fields.
     index = 0
     while index < len(payloads):
         payload = payloads[index]
+        origin = origins[index]
         index += 1
-        for nested_text in _iter_nested_strings(payload):
-            if not _looks_like_nested_json_blob(nested_text):
-                continue
-            for nested_payload in _decode_json_fragments(nested_text):
-                add_payload(nested_payload)
+        if nested_by_fragment is not None and origin >= 0:
+            nested = nested_by_fragment[origin]
+        else:
+            nested = _nested_fragments(payload)
+        for source, fragment in nested:
+            add_fragment(source, fragment)
 
     return payloads
 
 
+class StreamingOutputParser:
+    """
+    Decode provider stdout while it is still being written.
+
+    Top-level JSON values, and the JSON embedded in their string fields, are decoded as chunks
+    arrive; `finish()` only has to assemble them, so the result is available as soon as the
+    process exits and equals `ParsedOutput(full_text)`.
+    """
+
+    def __init__(self) -> None:
+        self._scanner = JsonFragmentScanner()
+        self._chunks: List[str] = []
+        self._fragments: List[JsonFragment] = []
+        self._nested: List[List[Tuple[str, JsonFragment]]] = []
+
+    def feed(self, chunk: str) -> List[JsonFragment]:
+        """Consume more output; returns the top-level fragments completed by this chunk."""
+        if chunk:
+            self._chunks.append(chunk)
+        return self._accept(self._scanner.feed(chunk))
+
+    def fragment_output(self, fragment: JsonFragment) -> "ParsedOutput":
+        """Output holding one fragment returned by `feed` and its nested payloads, to normalize before `finish()`."""
+        for index in range(len(self._fragments) - 1, -1, -1):
+            if self._fragments[index] is fragment:
+                break
+        else:
+            raise ValueError("fragment was not returned by this parser")
+        payloads = [fragment.value]
+        payloads.extend(nested.value for _, nested in self._nested[index])
+        return ParsedOutput.from_payloads(json.dumps(fragment.value), payloads)
+
+    def finish(self) -> "ParsedOutput":
+        self._accept(self._scanner.close())
+        text = "".join(self._chunks)
+        self._chunks = [text] if text else []
+        payloads = _assemble_payloads(text, self._fragments, self._nested) if text.strip() else []
+        return ParsedOutput.from_payloads(text, payloads)
+
+    def _accept(self, fragments: List[JsonFragment]) -> List[JsonFragment]:
+        for fragment in fragments:
+            self._fragments.append(fragment)
+            self._nested.append(_nested_fragments(fragment.value))
+        return fragments
+
+
+class ParsedOutput(str):
+    """
+    Provider output that is parsed at most once.
+
+    A `str` subclass, so adapters whose `normalize(raw, ctx)` expects text keep working;
+    the helpers in this module recognise it and reuse its cached payloads and results.
+    """
+
+    @classmethod
+    def from_payloads(cls, text: str, payloads: List[Any]) -> "ParsedOutput":
+        parsed = cls(text)
+        parsed.__dict__["payloads"] = payloads
+        return parsed
+
+    @cached_property
+    def payloads(self) -> List[Any]:
+        return extract_json_payloads(str(self))
+
+    @cached_property
+    def contract_info(self) -> Dict[str, Any]:
+        return inspect_contract_output(self, payloads=self.payloads)
+
+    @cached_property
+    def final_text(self) -> str:
+        return extract_final_text_from_output(self, payloads=self.payloads)
+
+    @cached_property
+    def token_usage(self) -> Optional[Dict[str, int]]:
+        return extract_token_usage_from_output(self, payloads=self.payloads)
+
+
 def _coerce_non_negative_int(value: Any) -> Optional[int]:
     if isinstance(value, bool):
         return None
@@ -335,12 +662,15 @@ def _token_candidate_score(candidate: Dict[str, int]) -> Tuple[int, int]:
     return (score, int(total_value))
 
 
-def extract_token_usage_from_output(text: str) -> Optional[Dict[str, int]]:
+def extract_token_usage_from_output(text: str, *, payloads: Optional[List[Any]] = None) -> Optional[Dict[str, int]]:
     """
     Best-effort token usage extraction from provider output/event streams.
     Returns normalized keys: prompt_tokens, completion_tokens, total_tokens.
     """
-    payloads = extract_json_payloads(text)
+    if payloads is None and isinstance(text, ParsedOutput):
+        return text.token_usage
+    if payloads is None:
+        payloads = extract_json_payloads(text)
     if not payloads:
         return None
 
@@ -386,14 +716,18 @@ def _validate_finding_item(item: Any) -> Tuple[bool, Optional[Dict[str, Any]]]:
     return (True, item)
 
 
-def inspect_contract_output(text: str) -> Dict[str, Any]:
+def inspect_contract_output(text: str, *, payloads: Optional[List[Any]] = None) -> Dict[str, Any]:
     """
     Strict contract validation for output shaped as:
     {"findings": [ ... ]}.
     """
+    if payloads is None and isinstance(text, ParsedOutput):
+        return text.contract_info
     candidates: List[Dict[str, Any]] = []
+    if payloads is None:
+        payloads = extract_json_payloads(text)
 
-    for index, payload in enumerate(extract_json_payloads(text)):
+    for index, payload in enumerate(payloads):
         if not isinstance(payload, dict):
             continue
         if "findings" not in payload:
@@ -478,18 +812,30 @@ def _as_optional_int(value: Any) -> Optional[int]:
     return None
 
 
-def normalize_findings_from_text(text: str, ctx: NormalizeContext, provider: ProviderId) -> List[NormalizedFinding]:
+def normalize_findings_from_text(
+    text: str,
+    ctx: NormalizeContext,
+    provider: ProviderId,
+    *,
+    payloads: Optional[List[Any]] = None,
+) -> List[NormalizedFinding]:
     normalized: List[NormalizedFinding] = []
     seen_ids = set()
 
-    contract_info = inspect_contract_output(text)
+    if payloads is None and isinstance(text, ParsedOutput):
+        payloads = text.payloads
+        contract_info = text.contract_info
+    else:
+        if payloads is None:
+            payloads = extract_json_payloads(text)
+        contract_info = inspect_contract_output(text, payloads=payloads)
     findings_source = contract_info["findings"] if contract_info["has_contract_envelope"] else []
 
     if findings_source:
         source_items = findings_source
     else:
         source_items = []
-        for payload in extract_json_payloads(text):
+        for payload in payloads:
             source_items.extend(_extract_findings(payload))
 
     for item in source_items:
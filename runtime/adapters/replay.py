@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..artifacts import expected_paths
+from ..contracts import (
+    CapabilitySet,
+    NormalizeContext,
+    NormalizedFinding,
+    ProviderPresence,
+    TaskInput,
+    TaskRunRef,
+    TaskStatus,
+)
+from ..types import ErrorKind
+from .parsing import normalize_findings_from_text
+from .shim import now_iso
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+_PADDING_LINE = "replay: provider log line padding the recorded output\n"
+
+
+@dataclass(frozen=True)
+class ReplayRecording:
+    stdout: str
+    stderr: str = ""
+    source: str = ""
+
+
+@dataclass(frozen=True)
+class ReplayProfile:
+    """
+    How a `ReplayAdapter` behaves. Latency is drawn per run: `fixed` uses `latency_seconds`, `uniform` draws
+    from `latency_seconds ± latency_spread`, `lognormal` uses `latency_seconds` as the median and
+    `latency_spread` as sigma. `failure_rates` maps `ErrorKind` values to per-run probabilities and
+    `stall_rate` is the probability that a run stops writing halfway and never exits.
+    """
+
+    recordings: Tuple[ReplayRecording, ...] = (ReplayRecording(stdout='{"findings":[]}'),)
+    latency: str = "fixed"
+    latency_seconds: float = 0.0
+    latency_spread: float = 0.0
+    stream_chunks: int = 4
+    stdout_padding_bytes: int = 0
+    failure_rates: Mapping[str, float] = field(default_factory=dict)
+    stall_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not self.recordings:
+            raise ValueError("replay profile needs at least one recording")
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"unknown latency distribution: {self.latency}")
+        for kind in self.failure_rates:
+            ErrorKind(kind)
+        if sum(self.failure_rates.values()) + self.stall_rate > 1.0:
+            raise ValueError("failure_rates and stall_rate must sum to at most 1")
+
+
+def _stderr_path(stdout_path: Path) -> Path:
+    return stdout_path.with_name(stdout_path.name.replace("stdout", "stderr"))
+
+
+def load_replay_corpus(paths: Iterable[str]) -> Tuple[ReplayRecording, ...]:
+    """
+    Recordings from `*stdout.log` files, either given directly or found under directories. Both the
+    artifact layout (`raw/<provider>.stdout.log`) and probe captures (`raw/stdout.log`) are accepted;
+    the matching `stderr` log is read when present.
+    """
+    stdout_paths: List[Path] = []
+    for item in paths:
+        path = Path(item)
+        if path.is_dir():
+            stdout_paths.extend(sorted(path.rglob("*stdout.log")))
+        elif path.is_file():
+            stdout_paths.append(path)
+    recordings: List[ReplayRecording] = []
+    for stdout_path in stdout_paths:
+        stderr_path = _stderr_path(stdout_path)
+        recordings.append(
+            ReplayRecording(
+                stdout=stdout_path.read_text(encoding="utf-8", errors="replace"),
+                stderr=stderr_path.read_text(encoding="utf-8", errors="replace") if stderr_path.is_file() else "",
+                source=str(stdout_path),
+            )
+        )
+    return tuple(recordings)
+
+
+@dataclass
+class _ReplayRun:
+    ref: TaskRunRef
+    stdout_path: Path
+    stderr_path: Path
+    provider_result_path: Path
+    chunks: List[str]
+    stderr: str
+    started: float
+    latency: float
+    outcome: str
+    written_chunks: int = 0
+    finished: bool = False
+
+
+class ReplayAdapter:
+    """
+    Provider stand-in that replays recorded output without spawning anything, for load tests and
+    benchmarks of the orchestrator itself. Output is written to the usual `raw/` logs in chunks spread
+    over the drawn latency, so stall detection and streaming parsing see real progress.
+    """
+
+    def __init__(self, provider_id: str, profile: Optional[ReplayProfile] = None) -> None:
+        self.id = provider_id
+        self.profile = profile or ReplayProfile()
+        self._random = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._runs: Dict[str, _ReplayRun] = {}
+
+    def detect(self) -> ProviderPresence:
+        return ProviderPresence(
+            provider=self.id,  # type: ignore[arg-type]
+            detected=True,
+            binary_path=None,
+            version="replay",
+            auth_ok=True,
+            reason="ok",
+        )
+
+    def capabilities(self) -> CapabilitySet:
+        return CapabilitySet(
+            tiers=["C0", "C1", "C2"],
+            supports_native_async=False,
+            supports_poll_endpoint=False,
+            supports_resume_after_restart=False,
+            supports_schema_enforcement=False,
+            min_supported_version="replay",
+            tested_os=["macos", "linux", "windows"],
+        )
+
+    def _draw(self) -> Tuple[ReplayRecording, float, str]:
+        profile = self.profile
+        with self._lock:
+            recording = self._random.choice(profile.recordings)
+            if profile.latency == "uniform":
+                latency = self._random.uniform(
+                    profile.latency_seconds - profile.latency_spread, profile.latency_seconds + profile.latency_spread
+                )
+            elif profile.latency == "lognormal" and profile.latency_seconds > 0:
+                latency = self._random.lognormvariate(math.log(profile.latency_seconds), profile.latency_spread)
+            else:
+                latency = profile.latency_seconds
+            roll = self._random.random()
+        outcome = "success"
+        threshold = 0.0
+        for kind, rate in sorted(profile.failure_rates.items()):
+            threshold += rate
+            if roll < threshold:
+                outcome = kind
+                break
+        else:
+            if roll < threshold + profile.stall_rate:
+                outcome = "stall"
+        return recording, max(0.0, latency), outcome
+
+    def _chunks(self, stdout: str) -> List[str]:
+        padding_bytes = self.profile.stdout_padding_bytes
+        if padding_bytes > 0:
+            stdout = _PADDING_LINE * (padding_bytes // len(_PADDING_LINE) + 1) + stdout
+        count = max(1, self.profile.stream_chunks)
+        size = max(1, math.ceil(len(stdout) / count))
+        return [stdout[index : index + size] for index in range(0, len(stdout), size)] or [""]
+
+    def run(self, input_task: TaskInput) -> TaskRunRef:
+        recording, latency, outcome = self._draw()
+        artifact_root = str(input_task.metadata.get("artifact_root", "/tmp/mco"))
+        paths = expected_paths(artifact_root, input_task.task_id, (self.id,))  # type: ignore[arg-type]
+        paths["providers_dir"].mkdir(parents=True, exist_ok=True)
+        paths["raw_dir"].mkdir(parents=True, exist_ok=True)
+        stdout_path = paths[f"raw/{self.id}.stdout.log"]
+        stderr_path = paths[f"raw/{self.id}.stderr.log"]
+        stdout_path.write_text("", encoding="utf-8")
+        stderr_path.write_text("", encoding="utf-8")
+        failed = outcome not in ("success", "stall")
+        ref = TaskRunRef(
+            task_id=input_task.task_id,
+            provider=self.id,  # type: ignore[arg-type]
+            run_id=f"{self.id}-{uuid.uuid4().hex[:12]}",
+            artifact_path=str(paths["root"]),
+            started_at=now_iso(),
+            pid=None,
+            session_id=None,
+        )
+        replay_run = _ReplayRun(
+            ref=ref,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+            provider_result_path=paths[f"providers/{self.id}.json"],
+            chunks=[] if failed else self._chunks(recording.stdout),
+            stderr=f"replay: injected {outcome}\n" if failed else recording.stderr,
+            started=time.monotonic(),
+            latency=latency,
+            outcome=outcome,
+        )
+        with self._lock:
+            self._runs[ref.run_id] = replay_run
+        return ref
+
+    def _advance(self, replay_run: _ReplayRun) -> None:
+        """Write the output due by now; a stalled run stops after half of it and never finishes."""
+        elapsed = time.monotonic() - replay_run.started
+        total = len(replay_run.chunks)
+        progress = 1.0 if replay_run.latency <= 0 else min(1.0, elapsed / replay_run.latency)
+        if replay_run.outcome == "stall":
+            progress = min(progress, 0.5)
+        due = total if progress >= 1.0 else int(progress * total)
+        if due > replay_run.written_chunks:
+            with replay_run.stdout_path.open("a", encoding="utf-8") as handle:
+                handle.write("".join(replay_run.chunks[replay_run.written_chunks : due]))
+            replay_run.written_chunks = due
+        if replay_run.outcome != "stall" and elapsed >= replay_run.latency and not replay_run.finished:
+            replay_run.stderr_path.write_text(replay_run.stderr, encoding="utf-8")
+            replay_run.finished = True
+
+    def _remaining_seconds(self, replay_run: _ReplayRun) -> Optional[float]:
+        if replay_run.outcome == "stall":
+            return None
+        return max(0.0, replay_run.latency - (time.monotonic() - replay_run.started))
+
+    def poll(self, ref: TaskRunRef) -> TaskStatus:
+        with self._lock:
+            replay_run = self._runs.get(ref.run_id)
+        if replay_run is None:
+            return TaskStatus(
+                task_id=ref.task_id,
+                provider=ref.provider,
+                run_id=ref.run_id,
+                attempt_state="EXPIRED",
+                completed=True,
+                heartbeat_at=None,
+                output_path=None,
+                error_kind=ErrorKind.NON_RETRYABLE_INVALID_INPUT,
+                exit_code=None,
+                message="run_handle_not_found",
+            )
+        self._advance(replay_run)
+        if not replay_run.finished:
+            return TaskStatus(
+                task_id=ref.task_id,
+                provider=ref.provider,
+                run_id=ref.run_id,
+                attempt_state="STARTED",
+                completed=False,
+                heartbeat_at=now_iso(),
+                output_path=str(replay_run.provider_result_path),
+                error_kind=None,
+                exit_code=None,
+                message="running",
+            )
+        success = replay_run.outcome == "success"
+        error_kind = None if success else ErrorKind(replay_run.outcome)
+        replay_run.provider_result_path.write_text(
+            json.dumps(
+                {
+                    "provider": self.id,
+                    "task_id": ref.task_id,
+                    "run_id": ref.run_id,
+                    "command": ["replay"],
+                    "started_at": ref.started_at,
+                    "completed_at": now_iso(),
+                    "exit_code": 0 if success else 1,
+                    "success": success,
+                    "error_kind": error_kind.value if error_kind else None,
+                    "latency_seconds": round(replay_run.latency, 3),
+                },
+                ensure_ascii=True,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        with self._lock:
+            self._runs.pop(ref.run_id, None)
+        return TaskStatus(
+            task_id=ref.task_id,
+            provider=ref.provider,
+            run_id=ref.run_id,
+            attempt_state="SUCCEEDED" if success else "FAILED",
+            completed=True,
+            heartbeat_at=now_iso(),
+            output_path=str(replay_run.provider_result_path),
+            error_kind=error_kind,
+            exit_code=0 if success else 1,
+            message="completed",
+        )
+
+    def _wait_plan(self, ref: TaskRunRef, timeout_seconds: float) -> Tuple[float, bool]:
+        with self._lock:
+            replay_run = self._runs.get(ref.run_id)
+        if replay_run is None:
+            return 0.0, True
+        remaining = self._remaining_seconds(replay_run)
+        if remaining is None or remaining > timeout_seconds:
+            return max(0.0, timeout_seconds), False
+        return remaining, True
+
+    def wait(self, ref: TaskRunRef, timeout_seconds: float) -> bool:
+        """Sleep until the replayed run finishes or the timeout elapses. Returns True once it has finished."""
+        delay, finishes = self._wait_plan(ref, timeout_seconds)
+        time.sleep(delay)
+        return finishes
+
+    async def wait_async(self, ref: TaskRunRef, timeout_seconds: float) -> bool:
+        delay, finishes = self._wait_plan(ref, timeout_seconds)
+        await asyncio.sleep(delay)
+        return finishes
+
+    def cancel(self, ref: TaskRunRef) -> None:
+        with self._lock:
+            self._runs.pop(ref.run_id, None)
+
+    def normalize(self, raw: Any, ctx: NormalizeContext) -> List[NormalizedFinding]:
+        text = raw if isinstance(raw, str) else ""
+        return normalize_findings_from_text(text, ctx, self.id)  # type: ignore[arg-type]
+
+
+def replay_adapters(providers: Sequence[str], profile: ReplayProfile) -> Dict[str, ReplayAdapter]:
+    """One replay adapter per provider name, each with its own random stream derived from the profile seed."""
+    adapters: Dict[str, ReplayAdapter] = {}
+    for index, provider in enumerate(providers):
+        seed = None if profile.seed is None else profile.seed + index
+        adapters[provider] = ReplayAdapter(provider, replace(profile, seed=seed))
+    return adapters
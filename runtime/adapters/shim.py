@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import select
 import shutil
 import signal
 import subprocess
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO
+from typing import Callable, Dict, List, Optional, TextIO, Tuple, TypeVar
 
 from ..artifacts import expected_paths
 from ..contracts import (
@@ -25,12 +28,24 @@ from ..contracts import (
 )
 from ..errors import classify_error, detect_warnings
 from ..types import ErrorKind
+from .warm_pool import WarmServerPool
+
+
+DEFAULT_PROBE_TIMEOUT_SECONDS = 60.0
+
+_T = TypeVar("_T")
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _timed(probe: Callable[[str], _T], binary: str) -> Tuple[_T, int]:
+    started = time.monotonic()
+    result = probe(binary)
+    return result, int((time.monotonic() - started) * 1000)
+
+
 @dataclass
 class ShimRunHandle:
     process: subprocess.Popen[str]
@@ -39,6 +54,9 @@ class ShimRunHandle:
     provider_result_path: Path
     stdout_file: TextIO
     stderr_file: TextIO
+    server_url: Optional[str] = None
+    warm_pool: Optional[WarmServerPool] = None
+    repo_root: str = ""
 
 
 _ENV_VARS_TO_STRIP = (
@@ -54,8 +72,88 @@ def _sanitize_env() -> Dict[str, str]:
     return env
 
 
+def _wait_for_exit(process: subprocess.Popen[str], timeout_seconds: float) -> bool:
+    """
+    Block until the process exits or the timeout elapses, without busy polling.
+    Uses a pidfd where the platform supports it and falls back to Popen.wait otherwise.
+    """
+    if process.poll() is not None:
+        return True
+    timeout = max(0.0, timeout_seconds)
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(process.pid)
+        except OSError:
+            pidfd = -1
+        if pidfd >= 0:
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return bool(readable) or process.poll() is not None
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+
+_ASYNC_FALLBACK_POLL_SECONDS = 0.05
+
+
+async def _wait_for_exit_async(process: subprocess.Popen[str], timeout_seconds: float) -> bool:
+    """
+    Await process exit or the timeout without occupying a thread.
+    A pidfd registered with the event loop wakes the waiter on exit; platforms without
+    pidfd fall back to short asyncio sleeps between polls.
+    """
+    if process.poll() is not None:
+        return True
+    timeout = max(0.0, timeout_seconds)
+    loop = asyncio.get_running_loop()
+    pidfd_open = getattr(os, "pidfd_open", None)
+    pidfd = -1
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(process.pid)
+        except OSError:
+            pidfd = -1
+    if pidfd >= 0:
+        exited = loop.create_future()
+
+        def _on_exit() -> None:
+            if not exited.done():
+                exited.set_result(True)
+
+        try:
+            loop.add_reader(pidfd, _on_exit)
+        except (NotImplementedError, OSError):
+            os.close(pidfd)
+            pidfd = -1
+        else:
+            try:
+                await asyncio.wait_for(asyncio.shield(exited), timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+            return process.poll() is not None
+
+    deadline = loop.time() + timeout
+    while process.poll() is None:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(_ASYNC_FALLBACK_POLL_SECONDS, remaining))
+    return True
+
+
 class ShimAdapterBase:
     id: ProviderId
+    # Per-probe subprocess timeout for detect(); None waits indefinitely.
+    probe_timeout_seconds: Optional[float] = DEFAULT_PROBE_TIMEOUT_SECONDS
 
     def __init__(self, provider_id: ProviderId, binary_name: str, capability_set: CapabilitySet) -> None:
         self.id = provider_id
@@ -64,7 +162,7 @@ class ShimAdapterBase:
         self._runs: Dict[str, ShimRunHandle] = {}
 
     def detect(self) -> ProviderPresence:
-        binary = self._resolve_binary()
+        binary = self.resolve_binary()
         if not binary:
             return ProviderPresence(
                 provider=self.id,
@@ -75,8 +173,12 @@ class ShimAdapterBase:
                 reason="binary_not_found",
             )
 
-        version = self._probe_version(binary)
-        auth_ok, reason = self._probe_auth(binary)
+        # Both probes start a CLI; run them side by side so detection costs one startup, not two.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            version_future = pool.submit(_timed, self._probe_version, binary)
+            auth_future = pool.submit(_timed, self._probe_auth, binary)
+            version, version_ms = version_future.result()
+            (auth_ok, reason), auth_ms = auth_future.result()
         return ProviderPresence(
             provider=self.id,
             detected=True,
@@ -84,6 +186,7 @@ class ShimAdapterBase:
             version=version,
             auth_ok=auth_ok,
             reason=reason,
+            probe_latency_ms={"version": version_ms, "auth": auth_ms},
         )
 
     def capabilities(self) -> CapabilitySet:
@@ -94,7 +197,14 @@ class ShimAdapterBase:
 
     def run(self, input_task: TaskInput) -> TaskRunRef:
         command_override = input_task.metadata.get("command_override")
-        cmd = command_override if isinstance(command_override, list) else self._build_command(input_task)
+        warm_pool = None if isinstance(command_override, list) else self._warm_pool(input_task)
+        server_url = self._warm_server_url(input_task, warm_pool) if warm_pool is not None else None
+        if isinstance(command_override, list):
+            cmd = command_override
+        elif server_url:
+            cmd = self._build_attached_command(input_task, server_url)
+        else:
+            cmd = self._build_command(input_task)
         if not isinstance(cmd, list) or not cmd:
             raise ValueError("adapter run command is empty")
 
@@ -127,7 +237,15 @@ class ShimAdapterBase:
             provider_result_path=provider_result_path,
             stdout_file=stdout_file,
             stderr_file=stderr_file,
+            server_url=server_url,
+            warm_pool=warm_pool if server_url else None,
+            repo_root=input_task.repo_root,
         )
+        if server_url and warm_pool is not None:
+            try:
+                warm_pool.attach(self.id, input_task.repo_root, process.pid)
+            except OSError:
+                pass
         return TaskRunRef(
             task_id=input_task.task_id,
             provider=self.id,
@@ -138,6 +256,17 @@ class ShimAdapterBase:
             session_id=None,
         )
 
+    def _forget(self, ref: TaskRunRef, handle: ShimRunHandle) -> None:
+        """Release a finished run's handle, and its warm server lease."""
+        self._close_io(handle)
+        self._runs.pop(ref.run_id, None)
+        if handle.warm_pool is not None:
+            try:
+                handle.warm_pool.detach(self.id, handle.repo_root, handle.process.pid)
+            except OSError:
+                pass
+            handle.warm_pool = None
+
     @staticmethod
     def _close_io(handle: ShimRunHandle) -> None:
         try:
@@ -203,8 +332,10 @@ class ShimAdapterBase:
             "stdout_path": str(handle.stdout_path),
             "stderr_path": str(handle.stderr_path),
         }
+        if handle.server_url:
+            payload["warm_server_url"] = handle.server_url
         handle.provider_result_path.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
-        self._runs.pop(ref.run_id, None)
+        self._forget(ref, handle)
 
         return TaskStatus(
             task_id=ref.task_id,
@@ -219,60 +350,97 @@ class ShimAdapterBase:
             message="completed",
         )
 
+    def wait(self, ref: TaskRunRef, timeout_seconds: float) -> bool:
+        """Block until the run exits or the timeout elapses. Returns True once the run has exited."""
+        handle = self._runs.get(ref.run_id)
+        if handle is None:
+            return True
+        return _wait_for_exit(handle.process, timeout_seconds)
+
+    async def wait_async(self, ref: TaskRunRef, timeout_seconds: float) -> bool:
+        """Await run exit or the timeout from an event loop. Returns True once the run has exited."""
+        handle = self._runs.get(ref.run_id)
+        if handle is None:
+            return True
+        return await _wait_for_exit_async(handle.process, timeout_seconds)
+
     def cancel(self, ref: TaskRunRef) -> None:
         handle = self._runs.get(ref.run_id)
         if handle is None:
             return
-        if handle.process.poll() is not None:
-            self._close_io(handle)
-            self._runs.pop(ref.run_id, None)
+        if not self._signal_run(ref, handle, signal.SIGTERM):
             return
-        try:
-            os.killpg(os.getpgid(handle.process.pid), signal.SIGTERM)
-        except ProcessLookupError:
-            self._close_io(handle)
-            self._runs.pop(ref.run_id, None)
+        if not _wait_for_exit(handle.process, 0.2):
+            if not self._signal_run(ref, handle, signal.SIGKILL):
+                return
+            _wait_for_exit(handle.process, 0.1)
+        self._release_if_exited(ref, handle)
+
+    async def cancel_async(self, ref: TaskRunRef) -> None:
+        """`cancel` counterpart that awaits the grace periods instead of blocking the loop."""
+        handle = self._runs.get(ref.run_id)
+        if handle is None:
             return
-        time.sleep(0.2)
-        if handle.process.poll() is None:
-            try:
-                os.killpg(os.getpgid(handle.process.pid), signal.SIGKILL)
-            except ProcessLookupError:
-                self._close_io(handle)
-                self._runs.pop(ref.run_id, None)
+        if not self._signal_run(ref, handle, signal.SIGTERM):
+            return
+        if not await _wait_for_exit_async(handle.process, 0.2):
+            if not self._signal_run(ref, handle, signal.SIGKILL):
                 return
-            time.sleep(0.1)
+            await _wait_for_exit_async(handle.process, 0.1)
+        self._release_if_exited(ref, handle)
+
+    def _signal_run(self, ref: TaskRunRef, handle: ShimRunHandle, sig: signal.Signals) -> bool:
+        """Signal the run's process group. Returns False once the run is gone and its handle released."""
         if handle.process.poll() is not None:
-            self._close_io(handle)
-            self._runs.pop(ref.run_id, None)
+            self._release_if_exited(ref, handle)
+            return False
+        try:
+            os.killpg(os.getpgid(handle.process.pid), sig)
+        except ProcessLookupError:
+            self._forget(ref, handle)
+            return False
+        return True
+
+    def _release_if_exited(self, ref: TaskRunRef, handle: ShimRunHandle) -> None:
+        if handle.process.poll() is not None:
+            self._forget(ref, handle)
 
     def normalize(self, raw: object, ctx: NormalizeContext) -> List[NormalizedFinding]:
         raise NotImplementedError
 
-    def _resolve_binary(self) -> Optional[str]:
+    def resolve_binary(self) -> Optional[str]:
+        """Path of the provider binary on the sanitized PATH, without running it."""
         env = _sanitize_env()
         return shutil.which(self.binary_name, path=env.get("PATH"))
 
     def _probe_version(self, binary: str) -> Optional[str]:
-        result = subprocess.run(
-            [binary, "--version"],
-            capture_output=True,
-            text=True,
-            check=False,
-            env=_sanitize_env(),
-        )
+        try:
+            result = subprocess.run(
+                [binary, "--version"],
+                capture_output=True,
+                text=True,
+                check=False,
+                env=_sanitize_env(),
+                timeout=self.probe_timeout_seconds,
+            )
+        except subprocess.TimeoutExpired:
+            return None
         lines = (result.stdout or result.stderr).splitlines()
         return lines[-1].strip() if lines else None
 
     def _probe_auth(self, binary: str) -> tuple[bool, str]:
         cmd = self._auth_check_command(binary)
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-            env=_sanitize_env(),
-        )
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=False,
+                env=_sanitize_env(),
+                timeout=self.probe_timeout_seconds,
+            )
+        except subprocess.TimeoutExpired:
+            return False, "probe_timeout"
         if result.returncode == 0:
             return True, "ok"
 
@@ -294,6 +462,42 @@ class ShimAdapterBase:
     def _build_command_for_record(self) -> List[str]:
         return []
 
+    def _warm_server_command(self, port: int) -> Optional[List[str]]:
+        """Command starting a long-lived server on `port` that runs can attach to; None without a server mode."""
+        _ = port
+        return None
+
+    def _build_attached_command(self, input_task: TaskInput, server_url: str) -> List[str]:
+        raise NotImplementedError
+
+    def _warm_pool(self, input_task: TaskInput) -> Optional[WarmServerPool]:
+        """
+        The warm server pool for this run when the caller enabled pooling (`warm_pool_dir` and
+        `warm_pool_idle_seconds` in the task metadata) and the provider can serve async sessions.
+        """
+        pool_dir = input_task.metadata.get("warm_pool_dir")
+        idle_seconds = input_task.metadata.get("warm_pool_idle_seconds")
+        capabilities = self._capability_set
+        if not pool_dir or not isinstance(idle_seconds, (int, float)) or idle_seconds <= 0:
+            return None
+        if not (capabilities.supports_native_async and capabilities.supports_poll_endpoint):
+            return None
+        if self._warm_server_command(0) is None:
+            return None
+        return WarmServerPool(Path(str(pool_dir)), idle_seconds)
+
+    def _warm_server_url(self, input_task: TaskInput, pool: Optional[WarmServerPool] = None) -> Optional[str]:
+        """URL of a warm server for this run, or None when pooling does not apply or the server is not up."""
+        pool = pool if pool is not None else self._warm_pool(input_task)
+        if pool is None:
+            return None
+        return pool.acquire(
+            self.id,
+            input_task.repo_root,
+            lambda port: self._warm_server_command(port) or [],
+            env=_sanitize_env(),
+        )
+
     def _is_success(self, return_code: int, stdout_text: str, stderr_text: str) -> bool:
         _ = stdout_text
         _ = stderr_text
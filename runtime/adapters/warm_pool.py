@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from ..fingerprint import payload_hash
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms run without the cross-process lock
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 20.0
+_READY_POLL_SECONDS = 0.1
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _stop(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _retire(record: Dict[str, object]) -> None:
+    # A closed port means the server already exited; its pid may since belong to someone else.
+    pid, port = int(record["pid"]), int(record["port"])  # type: ignore[arg-type]
+    if _pid_alive(pid) and _port_open(port):
+        _stop(pid)
+
+
+def _live_leases(record: Dict[str, object]) -> List[int]:
+    # A lease whose run died without detaching (e.g. a killed mco process) lapses with it.
+    leases = record.get("leases")
+    if not isinstance(leases, list):
+        return []
+    return [pid for pid in leases if isinstance(pid, int) and _pid_alive(pid)]
+
+
+class WarmServerPool:
+    """
+    Long-lived provider servers (e.g. `opencode serve`) shared by runs, including runs in later mco processes.
+    One server per provider and repository is recorded as JSON under `root`. A server whose process or port
+    is gone is replaced, and servers idle for longer than `idle_seconds` are stopped by the next `reap`. Runs
+    attached to a server hold a lease (their client pid) so the server is never idle while one is running.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        idle_seconds: float,
+        startup_timeout_seconds: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+    ) -> None:
+        self.root = root
+        self.idle_seconds = idle_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+
+    def _record_path(self, provider: str, repo_root: str) -> Path:
+        key = payload_hash({"provider": provider, "repo_root": str(Path(repo_root).resolve(strict=False))})
+        return self.root / f"{provider}-{key[:16]}.json"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with (self.root / ".lock").open("a") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _load(path: Path) -> Optional[Dict[str, object]]:
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict):
+            return None
+        if not isinstance(record.get("pid"), int) or not isinstance(record.get("port"), int):
+            return None
+        return record
+
+    def _write(self, path: Path, record: Dict[str, object]) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.root), prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(record, handle, ensure_ascii=True)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def _healthy(self, record: Dict[str, object], now: float) -> bool:
+        last_used = record.get("last_used_at")
+        idle = not isinstance(last_used, (int, float)) or now - last_used > self.idle_seconds
+        if idle and not _live_leases(record):
+            return False
+        return _pid_alive(int(record["pid"])) and _port_open(int(record["port"]))  # type: ignore[arg-type]
+
+    def acquire(
+        self,
+        provider: str,
+        repo_root: str,
+        server_command: Callable[[int], List[str]],
+        env: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        URL of a ready server for `provider` in `repo_root`, starting one with `server_command(port)` if needed.
+        Returns None when the server does not come up in time; callers then fall back to a one-shot run.
+        """
+        path = self._record_path(provider, repo_root)
+        with self._locked():
+            now = time.time()
+            record = self._load(path)
+            if record is not None and self._healthy(record, now):
+                record["last_used_at"] = now
+                self._write(path, record)
+                return str(record["url"])
+            if record is not None:
+                _retire(record)
+                path.unlink(missing_ok=True)
+
+            port = _free_port()
+            log_path = self.root / f"{path.stem}.log"
+            with log_path.open("w", encoding="utf-8") as log:
+                try:
+                    process = subprocess.Popen(
+                        server_command(port),
+                        cwd=repo_root,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        stdin=subprocess.DEVNULL,
+                        text=True,
+                        start_new_session=True,
+                        env=env,
+                    )
+                except OSError:
+                    return None
+            deadline = time.monotonic() + self.startup_timeout_seconds
+            while not _port_open(port):
+                if process.poll() is not None or time.monotonic() >= deadline:
+                    _stop(process.pid)
+                    return None
+                time.sleep(_READY_POLL_SECONDS)
+            url = f"http://127.0.0.1:{port}"
+            self._write(
+                path,
+                {
+                    "provider": provider,
+                    "repo_root": repo_root,
+                    "pid": process.pid,
+                    "port": port,
+                    "url": url,
+                    "started_at": now,
+                    "last_used_at": time.time(),
+                },
+            )
+            return url
+
+    def attach(self, provider: str, repo_root: str, client_pid: int) -> None:
+        """Lease the server to the run `client_pid`; `reap` leaves it alone while that process is alive."""
+        path = self._record_path(provider, repo_root)
+        with self._locked():
+            record = self._load(path)
+            if record is None:
+                return
+            record["leases"] = _live_leases(record) + [client_pid]
+            self._write(path, record)
+
+    def detach(self, provider: str, repo_root: str, client_pid: int) -> None:
+        """Drop the lease of a finished run; the server's idle time counts from now."""
+        path = self._record_path(provider, repo_root)
+        with self._locked():
+            record = self._load(path)
+            if record is None:
+                return
+            record["leases"] = [pid for pid in _live_leases(record) if pid != client_pid]
+            record["last_used_at"] = time.time()
+            self._write(path, record)
+
+    def reap(self) -> List[str]:
+        """Stop servers that are idle or dead; returns the providers whose servers were stopped."""
+        if not self.root.is_dir():
+            return []
+        stopped: List[str] = []
+        with self._locked():
+            now = time.time()
+            for path in sorted(self.root.glob("*.json")):
+                record = self._load(path)
+                if record is not None and self._healthy(record, now):
+                    continue
+                if record is not None:
+                    _retire(record)
+                    stopped.append(str(record.get("provider", "")))
+                path.unlink(missing_ok=True)
+        return stopped
@@ -9,12 +9,23 @@ from .contracts import ProviderId
 ARTIFACT_LAYOUT_VERSION = "stage-a-v1"
 ROOT_FILES = ("summary.md", "decision.md", "findings.json", "run.json")
 ROOT_DIRS = ("providers", "raw")
+STATE_DIR_NAME = ".mco"
 
 
 def task_artifact_root(base_dir: str, task_id: str) -> Path:
     return Path(base_dir) / task_id
 
 
+def state_dir(base_dir: str) -> Path:
+    """Directory for state kept across runs (caches, indexes), beside the task directories."""
+    return Path(base_dir) / STATE_DIR_NAME
+
+
+def hedge_artifact_base(base_dir: str, task_id: str, provider: str) -> Path:
+    """Artifact base for the backup run hedging `provider`, kept apart from the task's own raw logs."""
+    return task_artifact_root(base_dir, task_id) / "hedge" / provider
+
+
 def provider_artifact_name(provider: ProviderId) -> str:
     return f"{provider}.json"
 
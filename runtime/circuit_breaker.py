@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .concurrency import exclusive_file_lock
+
+BREAKERS_FILE_NAME = "breakers.json"
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breakers persisted in one JSON file, shared by every mco process using the same
+    artifact base. `threshold` consecutive tripping failures open a provider's breaker; after `cooldown_seconds`
+    one caller is let through as a half-open probe, whose success closes the breaker and whose failure reopens it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        threshold: int,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.threshold = threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock_path = path.with_suffix(".lock")
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        return {str(key): value for key, value in payload.items() if isinstance(value, dict)}
+
+    def _save(self, breakers: Dict[str, Dict[str, object]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.path.parent), prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(breakers, handle, ensure_ascii=True, sort_keys=True)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def allow(self, provider: str) -> Optional[Dict[str, object]]:
+        """
+        None when `provider` may run, otherwise its breaker entry plus `retry_after_seconds`. Taking the half-open
+        probe is recorded, so concurrent reviews keep skipping the provider until the probe reports back.
+        """
+        with exclusive_file_lock(self._lock_path):
+            breakers = self._load()
+            entry = breakers.get(provider)
+            if entry is None or entry.get("state") == STATE_CLOSED:
+                return None
+            now = self._clock()
+            since = entry.get("probe_started_at") if entry.get("state") == STATE_HALF_OPEN else entry.get("opened_at")
+            elapsed = now - since if isinstance(since, (int, float)) else self.cooldown_seconds
+            if elapsed < self.cooldown_seconds:
+                return {**entry, "retry_after_seconds": round(self.cooldown_seconds - elapsed, 3)}
+            # Cooldown over, or a probe that never reported back: this caller becomes the probe.
+            breakers[provider] = {**entry, "state": STATE_HALF_OPEN, "probe_started_at": now}
+            self._save(breakers)
+            return None
+
+    def record(self, provider: str, success: Optional[bool], error: str = "") -> None:
+        """
+        Report a run admitted by `allow`: True closes the breaker, False counts a tripping failure and None (a
+        run that said nothing about provider health, e.g. a cancellation) only frees a half-open probe.
+        """
+        with exclusive_file_lock(self._lock_path):
+            breakers = self._load()
+            entry = breakers.get(provider, {"state": STATE_CLOSED, "consecutive_failures": 0})
+            now = self._clock()
+            if success is None:
+                if entry.get("state") != STATE_HALF_OPEN:
+                    return
+                entry = {**entry, "probe_started_at": now - self.cooldown_seconds}
+            elif success:
+                if entry.get("state") == STATE_CLOSED and not entry.get("consecutive_failures"):
+                    return
+                entry = {"state": STATE_CLOSED, "consecutive_failures": 0}
+            else:
+                previous = entry.get("consecutive_failures")
+                failures = (previous if isinstance(previous, int) else 0) + 1
+                state = entry.get("state", STATE_CLOSED)
+                entry = {"state": state, "consecutive_failures": failures, "last_error": error}
+                if state == STATE_HALF_OPEN or failures >= self.threshold:
+                    entry.update(state=STATE_OPEN, opened_at=now)
+            breakers[provider] = entry
+            self._save(breakers)
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import argparse
 import json
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Mapping
+from typing import Dict, List, Mapping, Optional
 
 from .adapters import ClaudeAdapter, CodexAdapter, GeminiAdapter, OpenCodeAdapter, QwenAdapter
+from .adapters.shim import DEFAULT_PROBE_TIMEOUT_SECONDS
+from .artifacts import state_dir
 from .config import ReviewConfig, ReviewPolicy
 from .contracts import ProviderPresence
+from .detection_cache import DetectionCache, detect_with_cache
 from .formatters import format_markdown_pr, format_sarif
+from .history_store import DEFAULT_STATS_WINDOW, HISTORY_FILE_NAME, HistoryStore
 from .review_engine import ReviewRequest, run_review
 
 SUPPORTED_PROVIDERS = ("claude", "codex", "gemini", "opencode", "qwen")
@@ -35,7 +42,8 @@ TOP_LEVEL_EPILOG = (
     "Examples:\n"
     "  mco doctor --json\n"
     "  mco run --repo . --prompt \"Summarize this repo.\" --providers claude,codex\n"
-    "  mco review --repo . --prompt \"Review for bugs.\" --providers claude,codex,qwen --json\n\n"
+    "  mco review --repo . --prompt \"Review for bugs.\" --providers claude,codex,qwen --json\n"
+    "  mco stats --json\n\n"
     "Use `mco doctor -h`, `mco run -h`, or `mco review -h` for full command options."
 )
 
@@ -73,6 +81,16 @@ DOCTOR_EPILOG = (
     "  2 = invalid input"
 )
 
+STATS_EPILOG = (
+    "Examples:\n"
+    "  mco stats\n"
+    "  mco stats --providers codex --since-days 7 --json\n\n"
+    "Reads the history recorded by `mco run/review --record-history`.\n\n"
+    "Exit codes:\n"
+    "  0 = command completed (an empty history prints no providers)\n"
+    "  2 = invalid input or unreadable history"
+)
+
 
 def _doctor_adapter_registry() -> Mapping[str, object]:
     return {
@@ -84,27 +102,38 @@ def _doctor_adapter_registry() -> Mapping[str, object]:
     }
 
 
-def _doctor_provider_presence(providers: List[str]) -> Dict[str, ProviderPresence]:
+def _doctor_probe(adapter: object, provider: str, detection_cache: Optional[DetectionCache]) -> ProviderPresence:
+    try:
+        return detect_with_cache(adapter, detection_cache)
+    except Exception as exc:
+        return ProviderPresence(
+            provider=provider,  # type: ignore[arg-type]
+            detected=False,
+            binary_path=None,
+            version=None,
+            auth_ok=False,
+            reason=f"probe_error:{exc.__class__.__name__}",
+        )
+
+
+def _doctor_provider_presence(
+    providers: List[str],
+    detection_cache: Optional[DetectionCache] = None,
+    probe_timeout_seconds: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+) -> Dict[str, ProviderPresence]:
     adapters = _doctor_adapter_registry()
-    presence: Dict[str, ProviderPresence] = {}
-    for provider in providers:
-        adapter = adapters.get(provider)
-        if adapter is None:
-            continue
-        try:
-            probe = adapter.detect()
-        except Exception as exc:
-            presence[provider] = ProviderPresence(
-                provider=provider,  # type: ignore[arg-type]
-                detected=False,
-                binary_path=None,
-                version=None,
-                auth_ok=False,
-                reason=f"probe_error:{exc.__class__.__name__}",
-            )
-            continue
-        presence[provider] = probe
-    return presence
+    selected = [(provider, adapters[provider]) for provider in providers if provider in adapters]
+    if not selected:
+        return {}
+    for _, adapter in selected:
+        if hasattr(adapter, "probe_timeout_seconds"):
+            adapter.probe_timeout_seconds = probe_timeout_seconds or None  # type: ignore[attr-defined]
+    # Providers are independent; probing them together bounds doctor by the slowest provider.
+    with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+        futures = {
+            provider: pool.submit(_doctor_probe, adapter, provider, detection_cache) for provider, adapter in selected
+        }
+        return {provider: future.result() for provider, future in futures.items()}
 
 
 def _doctor_payload(providers: List[str], presence_map: Dict[str, ProviderPresence]) -> Dict[str, object]:
@@ -127,6 +156,7 @@ def _doctor_payload(providers: List[str], presence_map: Dict[str, ProviderPresen
             "auth_ok": bool(presence.auth_ok),
             "reason": presence.reason,
             "ready": ready,
+            "probe_latency_ms": dict(presence.probe_latency_ms),
         }
     return {
         "command": "doctor",
@@ -156,6 +186,55 @@ def _render_doctor_report(payload: Dict[str, object]) -> str:
         lines.append(f"  detected={bool(details.get('detected'))} auth_ok={bool(details.get('auth_ok'))}")
         lines.append(f"  binary_path={details.get('binary_path')}")
         lines.append(f"  version={details.get('version')}")
+        latency = details.get("probe_latency_ms")
+        if isinstance(latency, dict) and latency:
+            lines.append("  probe_latency_ms=" + " ".join(f"{name}={value}" for name, value in sorted(latency.items())))
+    return "\n".join(lines)
+
+
+def _stats_payload(
+    artifact_base: str, providers: Optional[List[str]], window: int, since_days: float
+) -> Dict[str, object]:
+    since = time.time() - since_days * 86400 if since_days > 0 else None
+    path = state_dir(artifact_base) / HISTORY_FILE_NAME
+    stats = HistoryStore(path).provider_stats(providers, window=window, since=since)
+    return {
+        "command": "stats",
+        "history_path": str(path),
+        "window": window,
+        "since_days": since_days,
+        "providers": stats,
+    }
+
+
+def _render_stats_report(payload: Dict[str, object]) -> str:
+    lines: List[str] = ["Provider Stats", ""]
+    lines.append(f"- history: {payload.get('history_path')}")
+    lines.append(f"- window: last {payload.get('window')} runs per provider")
+    providers = payload.get("providers", {})
+    if not isinstance(providers, dict) or not providers:
+        lines.append("")
+        lines.append("No recorded runs. Record them with `mco review --record-history`.")
+        return "\n".join(lines)
+
+    def seconds(value: object) -> str:
+        return f"{value:.1f}s" if isinstance(value, (int, float)) else "-"
+
+    lines.append("")
+    for provider in sorted(providers.keys()):
+        details = providers[provider]
+        latency = details.get("wall_clock_seconds", {})
+        lines.append(
+            f"- {provider}: runs={details.get('runs')} success_rate={details.get('success_rate')} "
+            f"mean_attempts={details.get('mean_attempts')}"
+        )
+        percentiles = " ".join(f"{name}={seconds(latency.get(name))}" for name in ("p50", "p95", "p99"))
+        lines.append(f"  wall_clock {percentiles}")
+        tokens = details.get("total_tokens_p50")
+        lines.append(f"  output_bytes_p50={details.get('output_bytes_p50')} total_tokens_p50={tokens or '-'}")
+        errors = details.get("errors")
+        if isinstance(errors, dict) and errors:
+            lines.append("  errors=" + " ".join(f"{name}={count}" for name, count in errors.items()))
     return "\n".join(lines)
 
 
@@ -269,6 +348,48 @@ def _parse_provider_timeouts(raw: str) -> Dict[str, int]:
     return result
 
 
+def _parse_hedge_providers(raw: str) -> Dict[str, str]:
+    result: Dict[str, str] = {}
+    if not raw.strip():
+        return result
+    for chunk in raw.split(","):
+        pair = chunk.strip()
+        if not pair:
+            continue
+        if "=" not in pair:
+            raise ValueError(f"invalid hedge entry: {pair}")
+        provider, backup = (item.strip() for item in pair.split("=", 1))
+        if provider not in SUPPORTED_PROVIDERS or backup not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"invalid hedge entry: {pair}")
+        if provider == backup:
+            raise ValueError(f"hedge backup must differ from provider '{provider}'")
+        result[provider] = backup
+    return result
+
+
+def _parse_provider_slots(raw: str) -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    if not raw.strip():
+        return result
+    for chunk in raw.split(","):
+        pair = chunk.strip()
+        if not pair:
+            continue
+        if "=" not in pair:
+            raise ValueError(f"invalid provider slots entry: {pair}")
+        provider, count_text = (item.strip() for item in pair.split("=", 1))
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"invalid provider slots entry: {pair}")
+        try:
+            count = int(count_text)
+        except Exception:
+            raise ValueError(f"invalid slot count for provider '{provider}': {count_text}") from None
+        if count <= 0:
+            raise ValueError(f"slot count must be > 0 for provider '{provider}'")
+        result[provider] = count
+    return result
+
+
 def _parse_paths(raw: str) -> List[str]:
     paths = [item.strip() for item in raw.split(",") if item.strip()]
     return paths if paths else ["."]
@@ -323,6 +444,11 @@ def _add_common_execution_args(parser: argparse.ArgumentParser) -> None:
         help="Comma-separated providers. Supported: claude,codex,gemini,opencode,qwen",
     )
     scope.add_argument("--target-paths", default=".", help="Comma-separated task scope paths")
+    scope.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Review mode: only review files changed since the last completed review and carry over other findings",
+    )
     scope.add_argument("--task-id", default="", help="Optional stable task id")
 
     timeouts = parser.add_argument_group("Timeout and Parallelism")
@@ -332,6 +458,28 @@ def _add_common_execution_args(parser: argparse.ArgumentParser) -> None:
         default=DEFAULT_POLICY.max_provider_parallelism,
         help="Provider fan-out concurrency. 0 means full parallelism",
     )
+    timeouts.add_argument(
+        "--provider-slots",
+        default="",
+        help="Host-wide cap on concurrent runs per provider across all mco processes, e.g. claude=2,codex=1",
+    )
+    timeouts.add_argument(
+        "--adaptive-timeouts",
+        action="store_true",
+        help="Derive per-provider stall and hard timeouts from the p99 latency of recent runs under --artifact-base",
+    )
+    timeouts.add_argument(
+        "--circuit-breaker",
+        type=int,
+        default=DEFAULT_POLICY.circuit_breaker_threshold,
+        help="Skip a provider after N consecutive auth or timeout failures until a probe succeeds (0 disables)",
+    )
+    timeouts.add_argument(
+        "--circuit-breaker-cooldown",
+        type=int,
+        default=DEFAULT_POLICY.circuit_breaker_cooldown_seconds,
+        help="Seconds an open circuit breaker skips its provider before letting one probe run through",
+    )
     timeouts.add_argument(
         "--provider-timeouts",
         default="",
@@ -347,7 +495,39 @@ def _add_common_execution_args(parser: argparse.ArgumentParser) -> None:
         "--poll-interval",
         type=float,
         default=DEFAULT_POLICY.poll_interval_seconds,
-        help="Provider status polling interval in seconds",
+        help="Fallback status polling interval in seconds for adapters without exit notification",
+    )
+    timeouts.add_argument(
+        "--stream-parse",
+        action="store_true",
+        help="Parse provider stdout while it is written; stalled providers keep findings emitted so far",
+    )
+    timeouts.add_argument(
+        "--optimistic-detect",
+        action="store_true",
+        help="Start providers right away and validate presence/auth alongside; a failed check cancels the run",
+    )
+    timeouts.add_argument(
+        "--warm-pool-idle",
+        type=int,
+        default=DEFAULT_POLICY.warm_pool_idle_seconds,
+        help="Keep an opencode server warm for runs to attach to; stop it after N idle seconds (0 disables)",
+    )
+    timeouts.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Review mode: cancel remaining providers once a critical finding makes the decision FAIL",
+    )
+    timeouts.add_argument(
+        "--quorum",
+        type=int,
+        default=DEFAULT_POLICY.quorum,
+        help="Finish once K providers succeed and cancel the rest (0 waits for all providers)",
+    )
+    timeouts.add_argument(
+        "--hedge",
+        default="",
+        help="Start a backup provider once a provider outlives its p90 latency from previous runs, e.g. claude=gemini",
     )
     timeouts.add_argument(
         "--review-hard-timeout",
@@ -389,12 +569,39 @@ def _add_common_execution_args(parser: argparse.ArgumentParser) -> None:
         default="",
         help="Provider to run synthesis pass (must be included in --providers). Defaults to claude when available",
     )
+    output.add_argument(
+        "--result-cache-ttl",
+        type=int,
+        default=DEFAULT_POLICY.result_cache_ttl_seconds,
+        help="Reuse successful provider results for unchanged prompt/scope/version/permissions for N seconds (0 disables)",
+    )
+    output.add_argument(
+        "--detect-cache-ttl",
+        type=int,
+        default=DEFAULT_POLICY.detection_cache_ttl_seconds,
+        help="Skip provider version/auth probes for N seconds after a ready probe of the same binary (0 disables)",
+    )
+    output.add_argument(
+        "--trace-export",
+        default=DEFAULT_POLICY.trace_export,
+        help="Export OTLP/JSON review spans to an http(s):// collector endpoint or append them to a file (default: off)",
+    )
+    output.add_argument(
+        "--record-history",
+        action="store_true",
+        help="Append per-provider latency and outcome to <artifact-base>/.mco/history.sqlite3 for `mco stats`",
+    )
     output.add_argument(
         "--save-artifacts",
         action="store_true",
         help="Force artifact writes when result-mode is stdout",
     )
     output.add_argument("--json", action="store_true", help="Print machine-readable JSON output")
+    output.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print NDJSON events while providers run (started/progress/finished/finding/decision), ending with a result event",
+    )
 
     access = parser.add_argument_group("Access and Contracts")
     access.add_argument("--allow-paths", default=".", help="Comma-separated allowed paths under repo root")
@@ -437,8 +644,56 @@ def build_parser() -> argparse.ArgumentParser:
         default=",".join(DEFAULT_CONFIG.providers),
         help="Comma-separated providers. Supported: claude,codex,gemini,opencode,qwen",
     )
+    doctor.add_argument(
+        "--artifact-base",
+        default=DEFAULT_CONFIG.artifact_base,
+        help="Artifact base directory holding the provider detection cache",
+    )
+    doctor.add_argument(
+        "--detect-cache-ttl",
+        type=int,
+        default=DEFAULT_POLICY.detection_cache_ttl_seconds,
+        help="Reuse ready probes younger than N seconds and record new ones for later runs (0 always probes)",
+    )
+    doctor.add_argument(
+        "--probe-timeout",
+        type=float,
+        default=DEFAULT_PROBE_TIMEOUT_SECONDS,
+        help="Per-probe timeout in seconds for version/auth checks; a hung auth probe reports probe_timeout (0 disables)",
+    )
     doctor.add_argument("--json", action="store_true", help="Print machine-readable JSON output")
 
+    stats = subparsers.add_parser(
+        "stats",
+        help="Report provider latency and outcome percentiles from recorded history",
+        description="Summarize per-provider wall clock (p50/p95/p99), success rate, attempts and errors.",
+        epilog=STATS_EPILOG,
+        formatter_class=_HelpFormatter,
+    )
+    stats.add_argument(
+        "--providers",
+        default="",
+        help="Comma-separated providers to report (default: every recorded provider)",
+    )
+    stats.add_argument(
+        "--artifact-base",
+        default=DEFAULT_CONFIG.artifact_base,
+        help="Artifact base directory holding the history store",
+    )
+    stats.add_argument(
+        "--window",
+        type=int,
+        default=DEFAULT_STATS_WINDOW,
+        help="Number of most recent runs per provider to summarize",
+    )
+    stats.add_argument(
+        "--since-days",
+        type=float,
+        default=0.0,
+        help="Only include runs recorded in the last N days (0 includes all)",
+    )
+    stats.add_argument("--json", action="store_true", help="Print machine-readable JSON output")
+
     run = subparsers.add_parser(
         "run",
         help="Run general multi-provider task execution",
@@ -480,6 +735,25 @@ def _resolve_config(args: argparse.Namespace) -> ReviewConfig:
         args.review_hard_timeout if args.review_hard_timeout >= 0 else cfg.policy.review_hard_timeout_seconds
     )
     enforce_findings_contract = bool(args.strict_contract)
+    if args.quorum < 0:
+        raise ValueError(f"--quorum must be >= 0, got {args.quorum}")
+    quorum = args.quorum or cfg.policy.quorum
+    if quorum > len(providers):
+        raise ValueError(f"--quorum must be <= the number of providers ({len(providers)}), got {quorum}")
+    if args.result_cache_ttl < 0:
+        raise ValueError(f"--result-cache-ttl must be >= 0, got {args.result_cache_ttl}")
+    if args.warm_pool_idle < 0:
+        raise ValueError(f"--warm-pool-idle must be >= 0, got {args.warm_pool_idle}")
+    if args.detect_cache_ttl < 0:
+        raise ValueError(f"--detect-cache-ttl must be >= 0, got {args.detect_cache_ttl}")
+    if args.circuit_breaker < 0:
+        raise ValueError(f"--circuit-breaker must be >= 0, got {args.circuit_breaker}")
+    if args.circuit_breaker_cooldown <= 0:
+        raise ValueError(f"--circuit-breaker-cooldown must be > 0, got {args.circuit_breaker_cooldown}")
+    hedge_providers = dict(cfg.policy.hedge_providers)
+    hedge_providers.update(_parse_hedge_providers(args.hedge))
+    provider_slots = dict(cfg.policy.provider_slots)
+    provider_slots.update(_parse_provider_slots(args.provider_slots))
 
     policy = ReviewPolicy(
         timeout_seconds=cfg.policy.timeout_seconds,
@@ -495,10 +769,29 @@ def _resolve_config(args: argparse.Namespace) -> ReviewConfig:
         allow_paths=allow_paths,
         provider_permissions=provider_permissions,
         enforcement_mode=enforcement_mode,
+        stream_parse=bool(args.stream_parse) or cfg.policy.stream_parse,
+        fail_fast=bool(args.fail_fast) or cfg.policy.fail_fast,
+        quorum=quorum,
+        hedge_providers=hedge_providers,
+        result_cache_ttl_seconds=args.result_cache_ttl or cfg.policy.result_cache_ttl_seconds,
+        incremental=bool(args.incremental) or cfg.policy.incremental,
+        detection_cache_ttl_seconds=args.detect_cache_ttl or cfg.policy.detection_cache_ttl_seconds,
+        optimistic_detect=bool(args.optimistic_detect) or cfg.policy.optimistic_detect,
+        warm_pool_idle_seconds=args.warm_pool_idle or cfg.policy.warm_pool_idle_seconds,
+        trace_export=args.trace_export.strip() or cfg.policy.trace_export,
+        provider_slots=provider_slots,
+        record_history=bool(args.record_history) or cfg.policy.record_history,
+        adaptive_timeouts=bool(args.adaptive_timeouts) or cfg.policy.adaptive_timeouts,
+        circuit_breaker_threshold=args.circuit_breaker or cfg.policy.circuit_breaker_threshold,
+        circuit_breaker_cooldown_seconds=args.circuit_breaker_cooldown,
     )
     return ReviewConfig(providers=providers, artifact_base=artifact_base, policy=policy)
 
 
+def _print_stream_event(event: Dict[str, object]) -> None:
+    print(json.dumps(event, ensure_ascii=True), flush=True)
+
+
 def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -507,13 +800,44 @@ def main(argv: List[str] | None = None) -> int:
         if not providers:
             print("No valid providers selected.", file=sys.stderr)
             return 2
-        payload = _doctor_payload(providers, _doctor_provider_presence(providers))
+        if args.detect_cache_ttl < 0:
+            print(f"Configuration error: --detect-cache-ttl must be >= 0, got {args.detect_cache_ttl}", file=sys.stderr)
+            return 2
+        if args.probe_timeout < 0:
+            print(f"Configuration error: --probe-timeout must be >= 0, got {args.probe_timeout}", file=sys.stderr)
+            return 2
+        detection_cache = (
+            DetectionCache(state_dir(args.artifact_base) / "detection", args.detect_cache_ttl)
+            if args.detect_cache_ttl > 0
+            else None
+        )
+        presence = _doctor_provider_presence(providers, detection_cache, args.probe_timeout)
+        payload = _doctor_payload(providers, presence)
         if args.json:
             print(json.dumps(payload, ensure_ascii=True))
         else:
             print(_render_doctor_report(payload))
         return 0
 
+    if args.command == "stats":
+        if args.window <= 0:
+            print(f"Configuration error: --window must be > 0, got {args.window}", file=sys.stderr)
+            return 2
+        if args.since_days < 0:
+            print(f"Configuration error: --since-days must be >= 0, got {args.since_days}", file=sys.stderr)
+            return 2
+        selected = _parse_providers(args.providers) if args.providers.strip() else None
+        try:
+            payload = _stats_payload(args.artifact_base, selected, args.window, args.since_days)
+        except sqlite3.Error as exc:
+            print(f"History error: {exc}", file=sys.stderr)
+            return 2
+        if args.json:
+            print(json.dumps(payload, ensure_ascii=True))
+        else:
+            print(_render_stats_report(payload))
+        return 0
+
     if args.command not in ("run", "review"):
         parser.error("unsupported command")
         return 2
@@ -554,8 +878,9 @@ def main(argv: List[str] | None = None) -> int:
     if args.save_artifacts and effective_result_mode == "stdout":
         effective_result_mode = "both"
     write_artifacts = effective_result_mode in ("artifact", "both")
+    on_event = _print_stream_event if args.stream else None
     try:
-        result = run_review(req, review_mode=review_mode, write_artifacts=write_artifacts)
+        result = run_review(req, review_mode=review_mode, write_artifacts=write_artifacts, on_event=on_event)
     except ValueError as exc:
         print(f"Input error: {exc}", file=sys.stderr)
         return 2
@@ -578,7 +903,19 @@ def main(argv: List[str] | None = None) -> int:
         payload["token_usage_summary"] = result.token_usage_summary
     if result.synthesis is not None:
         payload["synthesis"] = result.synthesis
-    if effective_result_mode == "artifact":
+    if result.early_exit is not None:
+        payload["early_exit"] = result.early_exit
+    if result.incremental is not None:
+        payload["incremental"] = result.incremental
+    if result.phase_timings_ms is not None:
+        payload["phase_timings_ms"] = result.phase_timings_ms
+    if args.stream:
+        stream_payload: Dict[str, object] = {"event": "result", **payload}
+        if effective_result_mode != "artifact":
+            stream_payload["result_mode"] = effective_result_mode
+            stream_payload["provider_results"] = result.provider_results
+        _print_stream_event(stream_payload)
+    elif effective_result_mode == "artifact":
         if args.json:
             print(json.dumps(payload, ensure_ascii=True))
         else:
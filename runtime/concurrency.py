@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms run without the host-wide limit
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_SLOT_POLL_SECONDS = 0.25
+
+
+@contextmanager
+def exclusive_file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on `path` (created if missing) for the block; a no-op without `fcntl`."""
+    if fcntl is None:  # pragma: no cover - non-POSIX platforms
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+class SlotLease:
+    """A held provider slot; the lock is dropped on `release` or, if the process dies, by the kernel."""
+
+    def __init__(self, fd: int, path: Path) -> None:
+        self._fd: Optional[int] = fd
+        self.path = path
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+
+class ProviderSlots:
+    """
+    Host-wide cap on concurrently running CLIs per provider, shared by every mco process using `root`.
+    Each provider has `limits[provider]` lock files; holding an flock on one of them is holding a slot.
+    Providers without a positive limit are not limited.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        limits: Mapping[str, int],
+        poll_seconds: float = DEFAULT_SLOT_POLL_SECONDS,
+    ) -> None:
+        self.root = root
+        self.limits = {provider: count for provider, count in limits.items() if count > 0}
+        self.poll_seconds = poll_seconds
+
+    def limited(self, provider: str) -> bool:
+        return fcntl is not None and provider in self.limits
+
+    def try_acquire(self, provider: str) -> Optional[SlotLease]:
+        """A free slot for `provider`, or None when all of them are held."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        slots = list(range(self.limits[provider]))
+        # Start at a random slot so waiters do not all contend for slot 0.
+        offset = random.randrange(len(slots))
+        for index in slots[offset:] + slots[:offset]:
+            path = self.root / f"{provider}.{index}.lock"
+            fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            return SlotLease(fd, path)
+        return None
+
+    def _next_poll(self) -> float:
+        return self.poll_seconds * random.uniform(0.5, 1.5)
+
+    def acquire(self, provider: str, abort: Callable[[], str] = lambda: "") -> Optional[SlotLease]:
+        """
+        Wait for a slot. Returns None without waiting when `provider` is unlimited, and None once `abort()`
+        returns a reason; callers tell the two apart with `limited`.
+        """
+        if not self.limited(provider):
+            return None
+        while True:
+            lease = self.try_acquire(provider)
+            if lease is not None or abort():
+                return lease
+            time.sleep(self._next_poll())
+
+    async def acquire_async(self, provider: str, abort: Callable[[], str] = lambda: "") -> Optional[SlotLease]:
+        """`acquire` for the event loop; lock attempts never block, so only the wait between them is awaited."""
+        if not self.limited(provider):
+            return None
+        while True:
+            lease = self.try_acquire(provider)
+            if lease is not None or abort():
+                return lease
+            await asyncio.sleep(self._next_poll())
@@ -22,6 +22,23 @@ class ReviewPolicy:
     allow_paths: List[str] = field(default_factory=lambda: ["."])
     provider_permissions: Dict[str, Dict[str, str]] = field(default_factory=dict)
     enforcement_mode: str = "strict"
+    stream_parse: bool = False
+    fail_fast: bool = False
+    quorum: int = 0
+    hedge_providers: Dict[str, str] = field(default_factory=dict)
+    result_cache_ttl_seconds: int = 0
+    incremental: bool = False
+    detection_cache_ttl_seconds: int = 0
+    optimistic_detect: bool = False
+    warm_pool_idle_seconds: int = 0
+    trace_export: str = ""
+    provider_slots: Dict[str, int] = field(default_factory=dict)
+    record_history: bool = False
+    adaptive_timeouts: bool = False
+    adaptive_timeout_floor_seconds: int = 60
+    adaptive_timeout_ceiling_seconds: int = 1800
+    circuit_breaker_threshold: int = 0
+    circuit_breaker_cooldown_seconds: int = 300
 
 
 @dataclass(frozen=True)
@@ -33,6 +33,8 @@ class ProviderPresence:
     version: Optional[str]
     auth_ok: bool
     reason: str = ""
+    # Wall-clock milliseconds per probe ("version", "auth"); empty when nothing was probed.
+    probe_latency_ms: Dict[str, int] = field(default_factory=dict, compare=False)
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .contracts import ProviderPresence
+
+DETECTION_FORMAT_VERSION = 1
+
+
+def binary_fingerprint(binary_path: str) -> Optional[Dict[str, object]]:
+    """Identity of an installed binary; an upgrade or reinstall changes it and invalidates cached probes."""
+    try:
+        resolved = os.path.realpath(binary_path)
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return {"path": resolved, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class DetectionCache:
+    """
+    Ready provider presences stored as one JSON file per provider under `root`.
+    An entry is reused while it is younger than `ttl_seconds` and the binary on PATH still has the
+    fingerprint it had when probed. Failed probes are never stored, so fixing auth takes effect at once, and
+    a run failing on auth or a missing binary drops the entry.
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float) -> None:
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, provider: str) -> Path:
+        return self.root / f"{provider}.json"
+
+    def get(self, provider: str, binary_path: str) -> Optional[ProviderPresence]:
+        fingerprint = binary_fingerprint(binary_path)
+        if fingerprint is None:
+            return None
+        try:
+            entry = json.loads(self._path(provider).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != DETECTION_FORMAT_VERSION:
+            return None
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, (int, float)) or time.time() - stored_at > self.ttl_seconds:
+            return None
+        if entry.get("binary") != fingerprint:
+            return None
+        presence = entry.get("presence")
+        if not isinstance(presence, dict):
+            return None
+        return ProviderPresence(
+            provider=provider,  # type: ignore[arg-type]
+            detected=True,
+            binary_path=binary_path,
+            version=presence.get("version") if isinstance(presence.get("version"), str) else None,
+            auth_ok=True,
+            reason=str(presence.get("reason", "ok")),
+        )
+
+    def invalidate(self, provider: str) -> None:
+        """Forget the provider's entry, e.g. after a run showed its auth or binary is broken."""
+        try:
+            self._path(provider).unlink()
+        except FileNotFoundError:
+            pass
+
+    def put(self, presence: ProviderPresence) -> None:
+        if not (presence.detected and presence.auth_ok and presence.binary_path):
+            return
+        fingerprint = binary_fingerprint(presence.binary_path)
+        if fingerprint is None:
+            return
+        entry = {
+            "version": DETECTION_FORMAT_VERSION,
+            "stored_at": time.time(),
+            "binary": fingerprint,
+            "presence": {"version": presence.version, "reason": presence.reason},
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.root), prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, ensure_ascii=True)
+            os.replace(tmp_name, self._path(presence.provider))
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+def cached_presence(adapter: object, cache: Optional[DetectionCache]) -> Optional[ProviderPresence]:
+    """The fresh cached presence for `adapter`, without probing. Adapters lacking `resolve_binary` never hit."""
+    resolve_binary = getattr(adapter, "resolve_binary", None)
+    if cache is None or resolve_binary is None:
+        return None
+    binary = resolve_binary()
+    return cache.get(str(adapter.id), binary) if binary else None  # type: ignore[attr-defined]
+
+
+def detect_with_cache(adapter: object, cache: Optional[DetectionCache]) -> ProviderPresence:
+    """`adapter.detect()`, skipping the version and auth probes when `cache` holds a fresh entry."""
+    cached = cached_presence(adapter, cache)
+    if cached is not None:
+        return cached
+    presence = adapter.detect()  # type: ignore[attr-defined]
+    if cache is not None:
+        try:
+            cache.put(presence)
+        except OSError:
+            pass
+    return presence
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import List
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
 
 from .types import ErrorKind, WarningKind
 
@@ -41,3 +44,85 @@ def classify_error(exit_code: int, stderr: str) -> ErrorKind:
 
     return ErrorKind.NORMALIZATION_ERROR
 
+
+_DURATION_UNITS = (
+    ("ms", 0.001),
+    ("millisecond", 0.001),
+    ("h", 3600.0),
+    ("hr", 3600.0),
+    ("hour", 3600.0),
+    ("m", 60.0),
+    ("min", 60.0),
+    ("minute", 60.0),
+    ("s", 1.0),
+    ("sec", 1.0),
+    ("second", 1.0),
+)
+_DURATION_PART = r"(\d+(?:\.\d+)?)\s*(milliseconds?|ms|hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s)(?![a-z])"
+_DURATION_RE = re.compile(rf"(?:{_DURATION_PART}\s*)+", re.IGNORECASE)
+_DURATION_PART_RE = re.compile(_DURATION_PART, re.IGNORECASE)
+_RETRY_AFTER_HEADER_RE = re.compile(r"retry-after\s*[:=]\s*\"?([^\"\r\n]+)", re.IGNORECASE)
+_RETRY_DELAY_FIELD_RE = re.compile(r"\"retry_?delay\"\s*:\s*\"?(\d+(?:\.\d+)?)s?\"?", re.IGNORECASE)
+_RETRY_IN_RE = re.compile(
+    r"(?:retry|try again|resets?|available)\s+(?:after|in)\s+((?:\d+(?:\.\d+)?\s*[a-z]+\s*)+)", re.IGNORECASE
+)
+_RESET_AT_RE = re.compile(
+    r"(?:resets?|available)\s+at\s+(\d{4}-\d{2}-\d{2}[t ][\d:.]+(?:z|[+-]\d{2}:?\d{2})?)", re.IGNORECASE
+)
+_LIMIT_EPOCH_RE = re.compile(r"limit reached\|(\d{10})\b", re.IGNORECASE)
+
+
+def _duration_seconds(text: str) -> Optional[float]:
+    match = _DURATION_RE.match(text.strip())
+    if match is None:
+        return None
+    total = 0.0
+    for amount, unit in _DURATION_PART_RE.findall(match.group(0)):
+        unit = unit.lower()
+        factor = next((value for name, value in _DURATION_UNITS if unit in (name, f"{name}s")), None)
+        if factor is None:
+            return None
+        total += float(amount) * factor
+    return total
+
+
+def _seconds_until(moment: datetime, now: float) -> float:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp() - now
+
+
+def parse_retry_after(text: str, now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds until a provider's rate limit resets, from hints CLIs print on stderr: a `Retry-After` header
+    (seconds or HTTP date), a `retryDelay` field, "retry/try again/resets in 1m30s", "resets at <ISO time>"
+    or a `limit reached|<epoch>` marker. None when there is no hint.
+    """
+    current = time.time() if now is None else now
+    for match in _RETRY_AFTER_HEADER_RE.finditer(text):
+        value = match.group(1).strip()
+        if re.fullmatch(r"\d+(?:\.\d+)?", value):
+            return float(value)
+        try:
+            return max(0.0, _seconds_until(parsedate_to_datetime(value), current))
+        except (TypeError, ValueError):
+            continue
+    match = _RETRY_DELAY_FIELD_RE.search(text)
+    if match is not None:
+        return float(match.group(1))
+    for match in _RETRY_IN_RE.finditer(text):
+        seconds = _duration_seconds(match.group(1))
+        if seconds is not None:
+            return seconds
+    match = _RESET_AT_RE.search(text)
+    if match is not None:
+        try:
+            moment = datetime.fromisoformat(match.group(1).replace("Z", "+00:00").replace("z", "+00:00"))
+        except ValueError:
+            moment = None
+        if moment is not None:
+            return max(0.0, _seconds_until(moment, current))
+    match = _LIMIT_EPOCH_RE.search(text)
+    if match is not None:
+        return max(0.0, float(match.group(1)) - current)
+    return None
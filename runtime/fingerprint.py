@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional
+
+IGNORED_DIR_NAMES = frozenset({".git", ".hg", ".svn", "__pycache__"})
+_READ_CHUNK_BYTES = 1 << 20
+
+
+def payload_hash(payload: object) -> str:
+    serialized = json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_scope_files(
+    repo_root: str,
+    target_paths: Iterable[str],
+    exclude: Iterable[str] = (),
+) -> Iterator[Path]:
+    """
+    Regular files under `target_paths` (relative to `repo_root`), each yielded once in sorted order.
+    VCS metadata and any directory in `exclude` (e.g. an artifact base inside the repo) are skipped.
+    """
+    root = Path(repo_root).resolve(strict=False)
+    excluded = {Path(item).resolve(strict=False) for item in exclude}
+    seen = set()
+    for target in sorted(set(target_paths) or {"."}):
+        start = (root / target).resolve(strict=False)
+        if start.is_file():
+            candidates: Iterable[Path] = [start]
+        elif start.is_dir():
+            candidates = _walk_files(start, excluded)
+        else:
+            continue
+        for path in candidates:
+            if path in seen:
+                continue
+            seen.add(path)
+            yield path
+
+
+def _walk_files(start: Path, excluded: set) -> Iterator[Path]:
+    for current, dir_names, file_names in os.walk(start):
+        current_path = Path(current)
+        dir_names[:] = sorted(
+            name
+            for name in dir_names
+            if name not in IGNORED_DIR_NAMES and (current_path / name).resolve(strict=False) not in excluded
+        )
+        for name in sorted(file_names):
+            path = current_path / name
+            if path.is_file():
+                yield path
+
+
+def scope_file_hashes(
+    repo_root: str,
+    target_paths: Iterable[str],
+    exclude: Iterable[str] = (),
+    previous: Optional[Mapping[str, Mapping[str, object]]] = None,
+) -> Dict[str, Dict[str, object]]:
+    """
+    `{relative_path: {"sha256", "size", "mtime_ns"}}` for every file in scope.
+    Entries from `previous` whose size and mtime are unchanged are reused without re-reading the file.
+    """
+    root = Path(repo_root).resolve(strict=False)
+    hashes: Dict[str, Dict[str, object]] = {}
+    for path in iter_scope_files(repo_root, target_paths, exclude):
+        try:
+            stat = path.stat()
+            rel_path = path.relative_to(root).as_posix()
+        except (OSError, ValueError):
+            continue
+        known = previous.get(rel_path) if previous else None
+        if known and known.get("size") == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns:
+            hashes[rel_path] = dict(known)
+            continue
+        try:
+            digest = file_digest(path)
+        except OSError:
+            continue
+        hashes[rel_path] = {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return hashes
+
+
+def scope_content_hash(file_hashes: Mapping[str, Mapping[str, object]]) -> str:
+    """Single digest over paths and contents; metadata such as mtime does not affect it."""
+    return payload_hash(sorted((path, str(entry.get("sha256", ""))) for path, entry in file_hashes.items()))
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_MAX_RUNS = 200
+EARLY_EXIT_REASONS = ("fail_fast", "quorum")
+
+
+def iter_run_payloads(artifact_base: str, max_runs: int = DEFAULT_MAX_RUNS) -> Iterator[Mapping[str, object]]:
+    """Yield `run.json` payloads under `artifact_base`, most recent first."""
+    root = Path(artifact_base)
+    if not root.is_dir():
+        return
+    candidates = []
+    for path in root.glob("*/run.json"):
+        try:
+            candidates.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    candidates.sort(reverse=True)
+    for _, path in candidates[:max_runs]:
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(payload, dict):
+            yield payload
+
+
+def provider_was_launched(details: Mapping[str, object]) -> bool:
+    """
+    Whether a recorded provider result comes from actually running the provider: results served from the result
+    cache and skips that never launched it (no changes, early exit, open circuit, unavailable CLI) do not.
+    """
+    return "cache" not in details and not details.get("reason")
+
+
+def provider_cut_short_by_early_exit(details: Mapping[str, object]) -> bool:
+    """
+    Whether the review cancelled a provider run because it no longer needed it (a fail-fast or quorum early exit);
+    such a result says nothing about the provider's health or latency.
+    """
+    return details.get("final_error") == "cancelled" and details.get("cancel_reason") in EARLY_EXIT_REASONS
+
+
+def provider_latency_samples(
+    artifact_base: str,
+    providers: Optional[Iterable[str]] = None,
+    max_runs: int = DEFAULT_MAX_RUNS,
+    mode: Optional[str] = None,
+) -> Dict[str, List[float]]:
+    """
+    Wall-clock seconds of successful provider runs recorded in previous `run.json` files, optionally only those
+    of one `mode` ("review" or "run"). Cache hits, skips and runs won by a hedge backup are left out, since their
+    wall clock either repeats an earlier run or measures another provider.
+    """
+    wanted = set(providers) if providers is not None else None
+    samples: Dict[str, List[float]] = {}
+    for payload in iter_run_payloads(artifact_base, max_runs):
+        if mode is not None and payload.get("mode") != mode:
+            continue
+        provider_results = payload.get("provider_results")
+        if not isinstance(provider_results, dict):
+            continue
+        for provider, details in provider_results.items():
+            if wanted is not None and provider not in wanted:
+                continue
+            if not isinstance(details, dict) or not details.get("success") or not provider_was_launched(details):
+                continue
+            if provider_cut_short_by_early_exit(details):
+                continue
+            hedge = details.get("hedge")
+            if isinstance(hedge, dict) and hedge.get("winner") not in (None, provider):
+                continue
+            try:
+                seconds = float(details.get("wall_clock_seconds", 0.0))
+            except (TypeError, ValueError):
+                continue
+            if seconds > 0:
+                samples.setdefault(str(provider), []).append(seconds)
+    return samples
+
+
+def percentile(values: Iterable[float], fraction: float) -> float:
+    """Nearest-rank percentile, `fraction` in (0, 1]."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile of empty sample")
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def provider_latency_percentiles(
+    artifact_base: str,
+    providers: Iterable[str],
+    fraction: float,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+    mode: Optional[str] = None,
+) -> Dict[str, float]:
+    """Per-provider latency percentile; providers with fewer than `min_samples` runs are omitted."""
+    samples = provider_latency_samples(artifact_base, providers, mode=mode)
+    return {
+        provider: percentile(values, fraction)
+        for provider, values in samples.items()
+        if len(values) >= max(1, min_samples)
+    }
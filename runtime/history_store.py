@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from .history import percentile, provider_cut_short_by_early_exit, provider_was_launched
+
+HISTORY_FILE_NAME = "history.sqlite3"
+DEFAULT_STATS_WINDOW = 500
+STATS_PERCENTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS provider_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    task_id TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    final_error TEXT,
+    cancel_reason TEXT NOT NULL,
+    wall_clock_seconds REAL NOT NULL,
+    output_bytes INTEGER NOT NULL,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    total_tokens INTEGER
+);
+CREATE INDEX IF NOT EXISTS provider_runs_by_provider ON provider_runs (provider, id);
+"""
+
+
+def _optional_int(value: object) -> Optional[int]:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _history_row(
+    recorded_at: float, task_id: str, mode: str, provider: str, details: Mapping[str, object]
+) -> tuple:
+    usage = details.get("token_usage")
+    usage = usage if isinstance(usage, dict) else {}
+    try:
+        wall_clock_seconds = float(details.get("wall_clock_seconds") or 0.0)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        wall_clock_seconds = 0.0
+    attempts = details.get("attempts")
+    final_error = details.get("final_error")
+    return (
+        recorded_at,
+        task_id,
+        mode,
+        provider,
+        1 if details.get("success") else 0,
+        attempts if isinstance(attempts, int) else 0,
+        str(final_error) if final_error else None,
+        str(details.get("cancel_reason") or ""),
+        wall_clock_seconds,
+        len(str(details.get("output_text") or "").encode("utf-8")),
+        _optional_int(usage.get("prompt_tokens")),
+        _optional_int(usage.get("completion_tokens")),
+        _optional_int(usage.get("total_tokens")),
+    )
+
+
+class HistoryStore:
+    """
+    Append-only SQLite log of provider outcomes, one row per provider per review, shared by every mco process
+    using the same artifact base. Token counts are only present for runs made with token usage enabled.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=_BUSY_TIMEOUT_SECONDS)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record(
+        self,
+        task_id: str,
+        mode: str,
+        provider_results: Mapping[str, Mapping[str, object]],
+        recorded_at: Optional[float] = None,
+    ) -> int:
+        """
+        Append the outcome of each provider in `provider_results` that actually ran; cache hits, skips and runs an
+        early exit cancelled are left out so they do not dilute latency and success rates. Returns the number of
+        rows written.
+        """
+        stamp = time.time() if recorded_at is None else recorded_at
+        rows = [
+            _history_row(stamp, task_id, mode, provider, details)
+            for provider, details in provider_results.items()
+            if isinstance(details, Mapping)
+            and provider_was_launched(details)
+            and not provider_cut_short_by_early_exit(details)
+        ]
+        if not rows:
+            return 0
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO provider_runs (recorded_at, task_id, mode, provider, success, attempts, final_error, "
+                "cancel_reason, wall_clock_seconds, output_bytes, prompt_tokens, completion_tokens, total_tokens) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def provider_stats(
+        self,
+        providers: Optional[Iterable[str]] = None,
+        window: int = DEFAULT_STATS_WINDOW,
+        since: Optional[float] = None,
+    ) -> Dict[str, Dict[str, object]]:
+        """
+        Per-provider summary of the latest `window` recorded runs (optionally only those at or after `since`).
+        Latency percentiles cover successful runs, the ones a timeout has to leave room for.
+        """
+        if not self.path.is_file():
+            return {}
+        wanted = sorted(set(providers)) if providers is not None else None
+        with closing(self._connect()) as connection:
+            names: Sequence[str] = wanted if wanted is not None else [
+                row[0] for row in connection.execute("SELECT DISTINCT provider FROM provider_runs ORDER BY provider")
+            ]
+            stats: Dict[str, Dict[str, object]] = {}
+            for provider in names:
+                rows = connection.execute(
+                    "SELECT success, attempts, final_error, wall_clock_seconds, output_bytes, total_tokens "
+                    "FROM provider_runs WHERE provider = ? AND recorded_at >= ? ORDER BY id DESC LIMIT ?",
+                    (provider, since if since is not None else 0.0, max(1, window)),
+                ).fetchall()
+                if rows:
+                    stats[provider] = _summarize(rows)
+        return stats
+
+
+def _summarize(rows: List[tuple]) -> Dict[str, object]:
+    latencies = [row[3] for row in rows if row[0] and row[3] > 0]
+    errors: Dict[str, int] = {}
+    for row in rows:
+        if not row[0]:
+            key = row[2] or "unknown"
+            errors[key] = errors.get(key, 0) + 1
+    tokens = [row[5] for row in rows if row[5] is not None]
+    return {
+        "runs": len(rows),
+        "successes": len(rows) - sum(errors.values()),
+        "success_rate": round((len(rows) - sum(errors.values())) / len(rows), 3),
+        "mean_attempts": round(sum(row[1] for row in rows) / len(rows), 2),
+        "wall_clock_seconds": {
+            name: (round(percentile(latencies, fraction), 3) if latencies else None)
+            for name, fraction in STATS_PERCENTILES
+        },
+        "output_bytes_p50": percentile([row[4] for row in rows], 0.5),
+        "total_tokens_p50": percentile(tokens, 0.5) if tokens else None,
+        "errors": dict(sorted(errors.items(), key=lambda item: (-item[1], item[0]))),
+    }
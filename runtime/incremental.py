@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .artifacts import state_dir
+from .fingerprint import payload_hash, scope_file_hashes
+
+INDEX_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class IncrementalPlan:
+    """What changed in the review scope since the last completed review with the same inputs."""
+
+    index_path: Path
+    repo_root: str
+    file_hashes: Dict[str, Dict[str, object]]
+    has_baseline: bool
+    changed_files: List[str]
+    deleted_files: List[str]
+    carried_findings: List[Dict[str, object]]
+
+    @property
+    def unchanged(self) -> bool:
+        return self.has_baseline and not self.changed_files
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "baseline": self.has_baseline,
+            "changed_files": list(self.changed_files),
+            "deleted_files": list(self.deleted_files),
+            "carried_findings_count": len(self.carried_findings),
+        }
+
+
+def incremental_index_path(
+    artifact_base: str,
+    repo_root: str,
+    prompt: str,
+    providers: Iterable[str],
+    target_paths: Iterable[str],
+) -> Path:
+    """One index per review identity: findings only carry over between reviews asking the same question."""
+    key = payload_hash(
+        {
+            "repo_root": str(Path(repo_root).resolve(strict=False)),
+            "prompt": prompt,
+            "providers": sorted(set(providers)),
+            "target_paths": sorted(set(target_paths)),
+        }
+    )
+    return state_dir(artifact_base) / "incremental" / f"{key}.json"
+
+
+def finding_file(finding: Mapping[str, object], repo_root: str) -> str:
+    """Repo-relative POSIX path of a finding's evidence file, or an empty string."""
+    evidence = finding.get("evidence")
+    raw = str(evidence.get("file", "")).strip() if isinstance(evidence, dict) else ""
+    if not raw:
+        return ""
+    raw = raw.replace("\\", "/")
+    path = Path(raw)
+    if path.is_absolute():
+        try:
+            return path.resolve(strict=False).relative_to(Path(repo_root).resolve(strict=False)).as_posix()
+        except ValueError:
+            return ""
+    while raw.startswith("./"):
+        raw = raw[2:]
+    return raw
+
+
+def _load_index(index_path: Path) -> Optional[Dict[str, object]]:
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_FORMAT_VERSION:
+        return None
+    if not isinstance(payload.get("files"), dict) or not isinstance(payload.get("findings"), list):
+        return None
+    return payload
+
+
+def plan_incremental(
+    index_path: Path,
+    repo_root: str,
+    target_paths: Iterable[str],
+    exclude: Iterable[str] = (),
+) -> IncrementalPlan:
+    index = _load_index(index_path)
+    previous_files: Dict[str, Dict[str, object]] = index["files"] if index else {}  # type: ignore[assignment]
+    current = scope_file_hashes(repo_root, target_paths, exclude=exclude, previous=previous_files)
+    if index is None:
+        return IncrementalPlan(
+            index_path=index_path,
+            repo_root=repo_root,
+            file_hashes=current,
+            has_baseline=False,
+            changed_files=sorted(current),
+            deleted_files=[],
+            carried_findings=[],
+        )
+
+    changed = sorted(
+        path
+        for path, entry in current.items()
+        if previous_files.get(path, {}).get("sha256") != entry.get("sha256")
+    )
+    deleted = sorted(path for path in previous_files if path not in current)
+    changed_set = set(changed)
+    carried = [
+        finding
+        for finding in index["findings"]  # type: ignore[union-attr]
+        if isinstance(finding, dict)
+        and finding_file(finding, repo_root) in current
+        and finding_file(finding, repo_root) not in changed_set
+    ]
+    return IncrementalPlan(
+        index_path=index_path,
+        repo_root=repo_root,
+        file_hashes=current,
+        has_baseline=True,
+        changed_files=changed,
+        deleted_files=deleted,
+        carried_findings=carried,
+    )
+
+
+def save_incremental_index(plan: IncrementalPlan, findings: List[Dict[str, object]]) -> None:
+    """Record the reviewed scope and its findings as the baseline for the next incremental review."""
+    payload = {
+        "version": INDEX_FORMAT_VERSION,
+        "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "files": plan.file_hashes,
+        "findings": findings,
+    }
+    plan.index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(plan.index_path.parent), prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=True)
+        os.replace(tmp_name, plan.index_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import random
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Set
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
 from .retry import RetryPolicy
-from .types import AttemptResult, ErrorKind, RunResult, TaskState
+from .timing import PhaseRecorder
+from .types import AttemptResult, ErrorKind, RunResult, TaskState, WarningKind
+
+
+# How often a backoff wakes up to check whether the run should stop instead of retrying.
+ABORT_POLL_SECONDS = 0.05
 
 
 RETRYABLE_ERRORS = {
@@ -37,6 +45,42 @@ VALID_TRANSITIONS: Dict[TaskState, Set[TaskState]] = {
 }
 
 
+def _never_abort() -> str:
+    return ""
+
+
+def _backoff_pauses(delay: float, abort: Optional[Callable[[], str]]) -> Iterator[float]:
+    """Split a backoff into `ABORT_POLL_SECONDS` slices when it can be aborted; sleep it whole otherwise."""
+    if abort is None:
+        yield delay
+        return
+    remaining = delay
+    while remaining > 0:
+        pause = min(remaining, ABORT_POLL_SECONDS)
+        yield pause
+        remaining -= pause
+
+
+def _aborted_run(
+    task_id: str,
+    provider: str,
+    attempts: int,
+    delays: List[float],
+    all_warnings: List[WarningKind],
+    reason: str,
+) -> RunResult:
+    return RunResult(
+        task_id=task_id,
+        provider=provider,
+        success=False,
+        attempts=attempts,
+        delays_seconds=delays,
+        output={"cancel_reason": reason, "findings": []},
+        final_error=ErrorKind.CANCELLED,
+        warnings=all_warnings,
+    )
+
+
 @dataclass
 class TaskStateMachine:
     state: TaskState = TaskState.DRAFT
@@ -52,68 +96,142 @@ class OrchestratorRuntime:
         self,
         retry_policy: Optional[RetryPolicy] = None,
         sleep_fn: Optional[Callable[[float], None]] = None,
+        async_sleep_fn: Optional[Callable[[float], Awaitable[None]]] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         self.retry_policy = retry_policy or RetryPolicy()
         self.sleep_fn = sleep_fn or time.sleep
+        self.async_sleep_fn = async_sleep_fn or asyncio.sleep
+        self.rng = rng
 
     def run_with_retry(
         self,
         task_id: str,
         provider: str,
         runner: Callable[[int], AttemptResult],
+        phases: Optional[PhaseRecorder] = None,
+        abort: Optional[Callable[[], str]] = None,
     ) -> RunResult:
+        """
+        Run attempts until one settles the run. With `abort`, a backoff is checked every `ABORT_POLL_SECONDS` and a
+        returned reason ends the run as cancelled instead of waiting out the delay.
+        """
         attempts = 0
         delays: List[float] = []
-        all_warnings = []
-        final_error: Optional[ErrorKind] = None
-        output = None
+        all_warnings: List[WarningKind] = []
 
         while True:
             attempts += 1
             result = runner(attempts)
-            all_warnings.extend(result.warnings)
-
-            if result.success:
-                output = result.output
-                final = RunResult(
-                    task_id=task_id,
-                    provider=provider,
-                    success=True,
-                    attempts=attempts,
-                    delays_seconds=delays,
-                    output=output,
-                    final_error=None,
-                    warnings=all_warnings,
-                )
+            final = self._settle_attempt(task_id, provider, attempts, delays, all_warnings, result)
+            if final is not None:
                 return final
+            with phases.span("retry_backoff") if phases is not None else nullcontext():
+                stop = abort if abort is not None else _never_abort
+                for pause in _backoff_pauses(delays[-1], abort):
+                    reason = stop()
+                    if reason:
+                        break
+                    self.sleep_fn(pause)
+                else:
+                    reason = stop()
+            if reason:
+                return _aborted_run(task_id, provider, attempts, delays, all_warnings, reason)
+
+    async def run_with_retry_async(
+        self,
+        task_id: str,
+        provider: str,
+        runner: Callable[[int], Awaitable[AttemptResult]],
+        phases: Optional[PhaseRecorder] = None,
+        abort: Optional[Callable[[], str]] = None,
+    ) -> RunResult:
+        """Same retry semantics as `run_with_retry`, awaiting the runner and backing off without blocking the loop."""
+        attempts = 0
+        delays: List[float] = []
+        all_warnings: List[WarningKind] = []
 
-            final_error = result.error_kind or ErrorKind.NORMALIZATION_ERROR
-            should_retry = final_error in RETRYABLE_ERRORS and attempts <= self.retry_policy.max_retries
-            if not should_retry:
-                final = RunResult(
-                    task_id=task_id,
-                    provider=provider,
-                    success=False,
-                    attempts=attempts,
-                    delays_seconds=delays,
-                    output=result.output,
-                    final_error=final_error,
-                    warnings=all_warnings,
-                )
+        while True:
+            attempts += 1
+            result = await runner(attempts)
+            final = self._settle_attempt(task_id, provider, attempts, delays, all_warnings, result)
+            if final is not None:
                 return final
-
-            retry_index = attempts
-            delay_seconds = self.retry_policy.compute_delay(retry_index)
-            delays.append(delay_seconds)
-            self.sleep_fn(delay_seconds)
-
-    def evaluate_terminal_state(self, required_provider_success: Dict[str, bool]) -> TaskState:
-        if not required_provider_success:
+            with phases.span("retry_backoff") if phases is not None else nullcontext():
+                stop = abort if abort is not None else _never_abort
+                for pause in _backoff_pauses(delays[-1], abort):
+                    reason = stop()
+                    if reason:
+                        break
+                    await self.async_sleep_fn(pause)
+                else:
+                    reason = stop()
+            if reason:
+                return _aborted_run(task_id, provider, attempts, delays, all_warnings, reason)
+
+    def _settle_attempt(
+        self,
+        task_id: str,
+        provider: str,
+        attempts: int,
+        delays: List[float],
+        all_warnings: List[WarningKind],
+        result: AttemptResult,
+    ) -> Optional[RunResult]:
+        """Return the final RunResult, or None after recording the backoff delay for another attempt."""
+        all_warnings.extend(result.warnings)
+
+        if result.success:
+            return RunResult(
+                task_id=task_id,
+                provider=provider,
+                success=True,
+                attempts=attempts,
+                delays_seconds=delays,
+                output=result.output,
+                final_error=None,
+                warnings=all_warnings,
+            )
+
+        final_error = result.error_kind or ErrorKind.NORMALIZATION_ERROR
+        delay: Optional[float] = None
+        if final_error in RETRYABLE_ERRORS and attempts <= self.retry_policy.max_retries:
+            # retry_index starts at 1 for the first retry.
+            delay = self.retry_policy.next_delay(
+                attempts,
+                previous_delay=delays[-1] if delays else None,
+                retry_after_seconds=result.retry_after_seconds,
+                rng=self.rng,
+            )
+        if delay is None:
+            return RunResult(
+                task_id=task_id,
+                provider=provider,
+                success=False,
+                attempts=attempts,
+                delays_seconds=delays,
+                output=result.output,
+                final_error=final_error,
+                warnings=all_warnings,
+            )
+
+        delays.append(delay)
+        return None
+
+    def evaluate_terminal_state(
+        self,
+        required_provider_success: Dict[str, bool],
+        cancelled_providers: Iterable[str] = (),
+    ) -> TaskState:
+        """`cancelled_providers` were stopped because they were no longer needed (quorum) and are left out."""
+        cancelled = set(cancelled_providers)
+        considered = [ok for provider, ok in required_provider_success.items() if provider not in cancelled]
+        if not considered:
             return TaskState.FAILED
-        successes = sum(1 for ok in required_provider_success.values() if ok)
+        successes = sum(1 for ok in considered if ok)
         if successes == 0:
             return TaskState.FAILED
-        if successes == len(required_provider_success):
+        if successes == len(considered):
             return TaskState.COMPLETED
         return TaskState.PARTIAL_SUCCESS
 
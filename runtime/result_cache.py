@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .fingerprint import payload_hash
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FORMAT_VERSION = 1
+
+
+def result_cache_key(
+    provider: str,
+    provider_version: Optional[str],
+    prompt: str,
+    scope_hash: str,
+    permissions: Mapping[str, object],
+    settings: Mapping[str, object],
+) -> str:
+    """
+    Content address of one provider run. `settings` carries whatever else changes the stored
+    outcome (review vs run mode, contract enforcement, token usage reporting).
+    """
+    return payload_hash(
+        {
+            "format": CACHE_FORMAT_VERSION,
+            "provider": provider,
+            "provider_version": provider_version or "",
+            "prompt_sha256": payload_hash(prompt),
+            "scope_sha256": scope_hash,
+            "permissions_sha256": payload_hash(permissions),
+            "settings": settings,
+        }
+    )
+
+
+class ResultCache:
+    """
+    Provider outcomes stored as one JSON file per key under `root`.
+    Entries expire after `ttl_seconds`; once the directory exceeds `max_bytes` the least recently
+    read entries are evicted. Reads refresh the entry mtime, which doubles as the LRU clock.
+    """
+
+    def __init__(self, root: Path, ttl_seconds: float, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, object]]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        stored_at = entry.get("stored_at") if isinstance(entry, dict) else None
+        if not isinstance(stored_at, (int, float)) or time.time() - stored_at > self.ttl_seconds:
+            self._discard(path)
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        value = entry.get("value")
+        return value if isinstance(value, dict) else None
+
+    def put(self, key: str, value: Mapping[str, object]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = {"stored_at": time.time(), "value": value}
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.root), prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, ensure_ascii=True)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            self._discard(Path(tmp_name))
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        now = time.time()
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.root.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for mtime, size, path in entries:
+            expired = now - mtime > self.ttl_seconds
+            if not expired and total <= self.max_bytes:
+                continue
+            self._discard(path)
+            total -= size
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -8,8 +10,37 @@ class RetryPolicy:
     max_retries: int = 2
     base_delay_seconds: float = 1.0
     backoff_multiplier: float = 2.0
+    # Upper bound for any single delay; 0 leaves delays uncapped.
+    max_delay_seconds: float = 0.0
+    # Decorrelated jitter (delay drawn from [base, 3 * previous delay]) so concurrent providers do not retry in step.
+    jitter: bool = False
 
     def compute_delay(self, retry_index: int) -> float:
         # retry_index starts at 1 for the first retry.
-        return self.base_delay_seconds * (self.backoff_multiplier ** (retry_index - 1))
+        return self._capped(self.base_delay_seconds * (self.backoff_multiplier ** (retry_index - 1)))
 
+    def _capped(self, delay: float) -> float:
+        return min(delay, self.max_delay_seconds) if self.max_delay_seconds > 0 else delay
+
+    def next_delay(
+        self,
+        retry_index: int,
+        previous_delay: Optional[float] = None,
+        retry_after_seconds: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[float]:
+        """
+        Delay before retry `retry_index`. A provider reset hint (`retry_after_seconds`) wins over backoff, with up to
+        one base delay of jitter added when jitter is on; a hint beyond `max_delay_seconds` returns None because
+        an earlier retry would only be rejected again.
+        """
+        draw = rng.uniform if rng is not None else random.uniform
+        if retry_after_seconds is not None:
+            if self.max_delay_seconds > 0 and retry_after_seconds > self.max_delay_seconds:
+                return None
+            spread = draw(0.0, self.base_delay_seconds) if self.jitter else 0.0
+            return self._capped(max(0.0, retry_after_seconds) + spread)
+        if not self.jitter:
+            return self.compute_delay(retry_index)
+        previous = previous_delay if previous_delay and previous_delay > 0 else self.base_delay_seconds
+        return self._capped(draw(self.base_delay_seconds, max(self.base_delay_seconds, previous * 3)))
@@ -1,23 +1,52 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
+import io
 import json
+import math
 import re
+import sqlite3
 import tempfile
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Set, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
+from . import __version__
 from .adapters import ClaudeAdapter, CodexAdapter, GeminiAdapter, OpenCodeAdapter, QwenAdapter
-from .adapters.parsing import extract_final_text_from_output, extract_token_usage_from_output, inspect_contract_output
-from .artifacts import expected_paths, task_artifact_root
+from .adapters.parsing import JsonFragment, ParsedOutput, StreamingOutputParser
+from .adapters.warm_pool import WarmServerPool
+from .artifacts import expected_paths, hedge_artifact_base, state_dir, task_artifact_root
+from .circuit_breaker import BREAKERS_FILE_NAME, CircuitBreaker
+from .concurrency import ProviderSlots, SlotLease
 from .config import ReviewPolicy
-from .contracts import Evidence, NormalizeContext, NormalizedFinding, ProviderAdapter, ProviderId, TaskInput
+from .contracts import (
+    Evidence,
+    NormalizeContext,
+    NormalizedFinding,
+    ProviderAdapter,
+    ProviderId,
+    ProviderPresence,
+    TaskInput,
+    TaskRunRef,
+    TaskStatus,
+)
+from .fingerprint import scope_content_hash, scope_file_hashes
+from .detection_cache import DetectionCache, cached_presence, detect_with_cache
+from .errors import parse_retry_after
+from .history import provider_latency_percentiles
+from .history_store import HISTORY_FILE_NAME, HistoryStore
+from .incremental import IncrementalPlan, incremental_index_path, plan_incremental, save_incremental_index
 from .orchestrator import OrchestratorRuntime
+from .result_cache import ResultCache, result_cache_key
 from .retry import RetryPolicy
-from .types import AttemptResult, ErrorKind, TaskState
+from .timing import PhaseRecorder
+from .tracing import NOOP_SPAN, NOOP_TRACER, Span, Tracer, build_tracer
+from .types import AttemptResult, ErrorKind, RunResult, TaskState
 
 
 STRICT_JSON_CONTRACT = (
@@ -29,6 +58,25 @@ STRICT_JSON_CONTRACT = (
 )
 REVIEW_FINDINGS_SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "review_findings.schema.json"
 
+ReviewEventCallback = Callable[[Dict[str, object]], None]
+_DEADLINE_SLACK_SECONDS = 0.01
+_DEADLINE_CANCEL_REASONS = ("stall_timeout", "hard_deadline_exceeded")
+_HEDGE_LATENCY_PERCENTILE = 0.9
+# Adaptive timeouts: stall and hard deadlines are multiples of the p99 wall clock of the provider's recent
+# successful runs in the same mode, clamped to the policy floor/ceiling, once enough runs are on record.
+_ADAPTIVE_LATENCY_PERCENTILE = 0.99
+_ADAPTIVE_MIN_SAMPLES = 10
+_ADAPTIVE_STALL_MULTIPLIER = 2.0
+_ADAPTIVE_HARD_MULTIPLIER = 3.0
+# Failures that open a provider's circuit breaker; other failures say nothing about the provider's health.
+_CIRCUIT_TRIPPING_ERRORS = (ErrorKind.NON_RETRYABLE_AUTH.value, ErrorKind.RETRYABLE_TIMEOUT.value)
+# Exit codes a shell or `env` shebang returns when the command cannot be executed or is not found.
+_MISSING_BINARY_EXIT_CODES = (126, 127)
+# Longest wait before a retry; a rate-limit reset further out ends the retries instead.
+_MAX_RETRY_DELAY_SECONDS = 120.0
+# Rate-limit hints are looked for in stderr and at the end of stdout.
+_RETRY_HINT_TAIL_CHARS = 4096
+
 
 @dataclass(frozen=True)
 class ReviewRequest:
@@ -59,6 +107,9 @@ class ReviewResult:
     findings: List[Dict[str, object]] = field(default_factory=list)
     token_usage_summary: Optional[Dict[str, object]] = None
     synthesis: Optional[Dict[str, object]] = None
+    early_exit: Optional[Dict[str, object]] = None
+    incremental: Optional[Dict[str, object]] = None
+    phase_timings_ms: Optional[Dict[str, int]] = None
 
 
 def _sha(value: str) -> str:
@@ -109,10 +160,6 @@ def _write_text(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
-def _output_text(stdout_text: str, stderr_text: str) -> str:
-    return stdout_text if stdout_text.strip() else stderr_text
-
-
 def _response_quality(success: bool, output_text: str, final_text: str) -> Tuple[bool, str]:
     if not success:
         return (False, "provider_failed")
@@ -247,6 +294,8 @@ class _ProviderExecutionOutcome:
     dropped_count: int
     findings: List[NormalizedFinding]
     provider_result: Dict[str, object]
+    # The run failed in a way a cached ready presence hides: bad auth or a binary that no longer executes.
+    presence_stale: bool = False
 
 
 def _safe_resolve(repo_root: Path, raw_path: str) -> Path:
@@ -313,6 +362,29 @@ def _provider_stall_timeout_seconds(policy: ReviewPolicy, provider: str) -> int:
     return value if value > 0 else policy.stall_timeout_seconds
 
 
+def _adaptive_timeouts(
+    policy: ReviewPolicy, artifact_base: str, providers: List[str], review_mode: bool
+) -> Dict[str, Tuple[int, int]]:
+    """(stall, hard) seconds per provider learned from earlier `run.json` files; omits providers without history."""
+    floor = max(1, policy.adaptive_timeout_floor_seconds)
+    ceiling = max(floor, policy.adaptive_timeout_ceiling_seconds)
+    latencies = provider_latency_percentiles(
+        artifact_base,
+        providers,
+        _ADAPTIVE_LATENCY_PERCENTILE,
+        min_samples=_ADAPTIVE_MIN_SAMPLES,
+        mode="review" if review_mode else "run",
+    )
+
+    def clamp(seconds: float) -> int:
+        return min(ceiling, max(floor, math.ceil(seconds)))
+
+    return {
+        provider: (clamp(latency * _ADAPTIVE_STALL_MULTIPLIER), clamp(latency * _ADAPTIVE_HARD_MULTIPLIER))
+        for provider, latency in latencies.items()
+    }
+
+
 def _poll_interval_seconds(policy: ReviewPolicy) -> float:
     try:
         value = float(policy.poll_interval_seconds)
@@ -334,6 +406,78 @@ def _raw_output_size_snapshot(artifact_path: str, provider: str) -> Tuple[int, i
     return (stdout_size, stderr_size)
 
 
+def _raw_output_last_modified(artifact_path: str, provider: str) -> float:
+    root = Path(artifact_path) / "raw"
+    latest = 0.0
+    for path in (root / f"{provider}.stdout.log", root / f"{provider}.stderr.log"):
+        try:
+            latest = max(latest, path.stat().st_mtime)
+        except OSError:
+            continue
+    return latest
+
+
+class _StdoutTail:
+    """Reads a provider's stdout log as it grows and feeds it to a streaming parser."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offset = 0
+        # Universal newlines, like Path.read_text, so the parsed text matches a full read.
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        self._parser = StreamingOutputParser()
+
+    def read(self, final: bool = False) -> List[JsonFragment]:
+        """Feed what was written since the last read; returns the top-level values it completed."""
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self.offset)
+                data = handle.read()
+        except OSError:
+            data = b""
+        self.offset += len(data)
+        text = self._decoder.decode(data, final=final)
+        return self._parser.feed(text) if text else []
+
+    def fragment_output(self, fragment: JsonFragment) -> ParsedOutput:
+        return self._parser.fragment_output(fragment)
+
+    def finish(self) -> ParsedOutput:
+        self.read(final=True)
+        return self._parser.finish()
+
+
+def _supports_completion_wait(adapter: ProviderAdapter, asynchronous: bool = False) -> bool:
+    return callable(getattr(adapter, "wait_async" if asynchronous else "wait", None))
+
+
+def _wait_for_provider(adapter: ProviderAdapter, run_ref: TaskRunRef, timeout_seconds: float) -> None:
+    """
+    Block until the provider run exits or the timeout elapses.
+    Adapters exposing `wait(ref, timeout_seconds)` are woken on process exit; others fall back to sleeping.
+    """
+    if _supports_completion_wait(adapter):
+        try:
+            adapter.wait(run_ref, timeout_seconds)  # type: ignore[attr-defined]
+            return
+        except Exception:
+            pass
+    time.sleep(timeout_seconds)
+
+
+async def _wait_for_provider_async(adapter: ProviderAdapter, run_ref: TaskRunRef, timeout_seconds: float) -> None:
+    """Event-loop counterpart of `_wait_for_provider`, using `wait_async(ref, timeout_seconds)` when available."""
+    if _supports_completion_wait(adapter, asynchronous=True):
+        try:
+            await adapter.wait_async(run_ref, timeout_seconds)  # type: ignore[attr-defined]
+            return
+        except Exception:
+            pass
+    await asyncio.sleep(timeout_seconds)
+
+
 def _ensure_provider_artifacts(artifact_base: str, task_id: str, provider: str) -> None:
     paths = expected_paths(artifact_base, task_id, (provider,))
     provider_json = paths[f"providers/{provider}.json"]
@@ -454,58 +598,254 @@ def _merge_findings_across_providers(findings: List[NormalizedFinding]) -> List[
     return merged_findings
 
 
-def _run_provider(
-    request: ReviewRequest,
-    runtime: OrchestratorRuntime,
-    adapter_map: Mapping[str, ProviderAdapter],
-    resolved_task_id: str,
-    runtime_artifact_base: str,
-    persist_artifacts: bool,
-    full_prompt: str,
-    target_paths: List[str],
-    allow_paths: List[str],
-    review_mode: bool,
-    provider: str,
-) -> _ProviderExecutionOutcome:
-    def _ensure_if_persisting() -> None:
-        if persist_artifacts:
-            _ensure_provider_artifacts(runtime_artifact_base, resolved_task_id, provider)
-
-    adapter = adapter_map.get(provider)
-    if adapter is None:
-        _ensure_if_persisting()
-        return _ProviderExecutionOutcome(
-            provider=provider,
-            success=False,
-            parse_ok=False,
-            schema_valid_count=0,
-            dropped_count=0,
-            findings=[],
-            provider_result={"success": False, "reason": "adapter_not_implemented"},
+class _ReviewEvents:
+    """
+    Delivers progress events to a `run_review(on_event=...)` callback, one call at a time.
+    Findings are reported when their provider finishes (with stream parsing, as soon as a complete
+    value carrying them is written), once per cross-provider dedupe key, in the merged-finding
+    shape used by the final result.
+    """
+
+    def __init__(self, task_id: str, callback: ReviewEventCallback) -> None:
+        self.task_id = task_id
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._reported_findings: Set[str] = set()
+
+    def emit(self, event: str, **fields: object) -> None:
+        payload: Dict[str, object] = {"event": event, "task_id": self.task_id, "at": _timestamp_to_iso(time.time())}
+        payload.update(fields)
+        with self._lock:
+            try:
+                self._callback(payload)
+            except Exception:
+                # A failing consumer must not abort the review or leave providers running.
+                pass
+
+    def provider_finished(self, outcome: _ProviderExecutionOutcome) -> None:
+        provider_result = outcome.provider_result
+        self.emit(
+            "provider_finished",
+            provider=outcome.provider,
+            success=outcome.success,
+            reason=str(provider_result.get("reason") or provider_result.get("final_error") or ""),
+            cancel_reason=str(provider_result.get("cancel_reason", "")),
+            wall_clock_seconds=provider_result.get("wall_clock_seconds"),
+            findings_count=len(outcome.findings),
         )
-
-    presence = adapter.detect()
-    if not presence.detected or not presence.auth_ok:
-        _ensure_if_persisting()
-        return _ProviderExecutionOutcome(
-            provider=provider,
-            success=False,
-            parse_ok=False,
-            schema_valid_count=0,
-            dropped_count=0,
-            findings=[],
-            provider_result={
-                "success": False,
-                "reason": "provider_unavailable",
-                "detected": presence.detected,
-                "auth_ok": presence.auth_ok,
-                "presence_reason": presence.reason,
-                "binary_path": presence.binary_path,
-                "version": presence.version,
-            },
+        self.findings(outcome.provider, outcome.findings)
+
+    def findings(self, provider: str, findings: List[NormalizedFinding]) -> None:
+        with self._lock:
+            new_findings = [item for item in findings if _finding_dedupe_key(item) not in self._reported_findings]
+            self._reported_findings.update(_finding_dedupe_key(item) for item in new_findings)
+        for finding in _merge_findings_across_providers(new_findings):
+            self.emit("finding", provider=provider, finding=finding)
+
+    def decision(self, aggregate: _ReviewAggregate) -> None:
+        self.emit(
+            "decision",
+            decision=aggregate.decision,
+            terminal_state=aggregate.terminal_state.value,
+            findings_count=len(aggregate.merged_findings),
+            severity_counts=dict(aggregate.severity_counts),
         )
 
-    requested_permissions = request.policy.provider_permissions.get(provider, {})
+
+class _EarlyExit:
+    """Set once the review outcome can no longer change; running and queued providers are then cut short."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reason = ""
+        self.trigger_provider = ""
+        self.success_count = 0
+
+    def record_success(self) -> int:
+        with self._lock:
+            self.success_count += 1
+            return self.success_count
+
+    def trigger(self, reason: str, provider: str) -> bool:
+        """Record the first trigger; returns False when the review was already cut short."""
+        with self._lock:
+            if self.reason:
+                return False
+            self.reason = reason
+            self.trigger_provider = provider
+            return True
+
+
+class _PresenceCheck:
+    """Provider detection running on a background thread while the provider itself is already running."""
+
+    def __init__(self, adapter: ProviderAdapter, cache: Optional[DetectionCache]) -> None:
+        self._adapter = adapter
+        self._cache = cache
+        self._done = threading.Event()
+        self.presence: Optional[ProviderPresence] = None
+        threading.Thread(target=self._detect, name=f"mco-detect-{adapter.id}", daemon=True).start()
+
+    def _detect(self) -> None:
+        try:
+            self.presence = detect_with_cache(self._adapter, self._cache)
+        except Exception as exc:
+            self.presence = ProviderPresence(
+                provider=self._adapter.id,
+                detected=False,
+                binary_path=None,
+                version=None,
+                auth_ok=False,
+                reason=f"probe_error:{exc.__class__.__name__}",
+            )
+        finally:
+            self._done.set()
+
+    @property
+    def failed(self) -> bool:
+        presence = self.presence if self._done.is_set() else None
+        return presence is not None and not (presence.detected and presence.auth_ok)
+
+    def wait(self) -> ProviderPresence:
+        self._done.wait()
+        assert self.presence is not None
+        return self.presence
+
+
+@dataclass(frozen=True)
+class _ReviewContext:
+    request: ReviewRequest
+    adapter_map: Mapping[str, ProviderAdapter]
+    runtime: OrchestratorRuntime
+    task_id: str
+    artifact_root: Optional[str]
+    runtime_artifact_base: str
+    write_artifacts: bool
+    full_prompt: str
+    target_paths: List[str]
+    allow_paths: List[str]
+    review_mode: bool
+    provider_order: List[str]
+    events: Optional[_ReviewEvents] = None
+    early_exit: Optional[_EarlyExit] = None
+    hedge_after_seconds: Mapping[str, float] = field(default_factory=dict)
+    result_cache: Optional[ResultCache] = None
+    scope_hash: str = ""
+    incremental: Optional[IncrementalPlan] = None
+    detection_cache: Optional[DetectionCache] = None
+    tracer: Tracer = NOOP_TRACER
+    trace_span: Span = NOOP_SPAN
+    provider_slots: Optional[ProviderSlots] = None
+    adaptive_timeouts: Mapping[str, Tuple[int, int]] = field(default_factory=dict)
+    circuit_breaker: Optional[CircuitBreaker] = None
+
+    @property
+    def root_path(self) -> Optional[Path]:
+        return Path(self.artifact_root) if self.artifact_root else None
+
+
+@dataclass(frozen=True)
+class _ProviderContext:
+    review: _ReviewContext
+    provider: str
+    adapter: ProviderAdapter
+    requested_permissions: Dict[str, str]
+    effective_permissions: Dict[str, str]
+    unknown_permission_keys: List[str]
+    stall_timeout_seconds: int
+    poll_interval_seconds: float
+    hard_timeout_seconds: int
+    event_driven_wait: bool
+    stream_parse: bool
+    hedge: Optional[_ProviderContext] = None
+    hedge_after_seconds: float = 0.0
+    presence_check: Optional[_PresenceCheck] = None
+    phases: PhaseRecorder = field(default_factory=PhaseRecorder)
+    trace_span: Span = NOOP_SPAN
+
+
+@dataclass(frozen=True)
+class _ReviewAggregate:
+    provider_results: Dict[str, Dict[str, object]]
+    required_provider_success: Dict[str, bool]
+    merged_findings: List[Dict[str, object]]
+    parse_success_count: int
+    parse_failure_count: int
+    schema_valid_count: int
+    dropped_findings_count: int
+    token_usage_summary: Optional[Dict[str, object]]
+    terminal_state: TaskState
+    severity_counts: Dict[str, int]
+    decision: str
+
+
+def _warm_pool_dir(request: ReviewRequest) -> Path:
+    return state_dir(request.artifact_base) / "warm"
+
+
+def _early_exit_reason(review: _ReviewContext) -> str:
+    return review.early_exit.reason if review.early_exit is not None else ""
+
+
+def _abort_reason(ctx: _ProviderContext) -> str:
+    """Why a provider run must stop regardless of its own progress: an early exit or failed optimistic detection."""
+    reason = _early_exit_reason(ctx.review)
+    if not reason and ctx.presence_check is not None and ctx.presence_check.failed:
+        reason = "provider_unavailable"
+    return reason
+
+
+def _ensure_artifacts_if_persisting(review: _ReviewContext, provider: str) -> None:
+    if review.write_artifacts:
+        _ensure_provider_artifacts(review.runtime_artifact_base, review.task_id, provider)
+
+
+def _failed_outcome(review: _ReviewContext, provider: str, provider_result: Dict[str, object]) -> _ProviderExecutionOutcome:
+    _ensure_artifacts_if_persisting(review, provider)
+    return _ProviderExecutionOutcome(
+        provider=provider,
+        success=False,
+        parse_ok=False,
+        schema_valid_count=0,
+        dropped_count=0,
+        findings=[],
+        provider_result=provider_result,
+    )
+
+
+def _unavailable_outcome(
+    review: _ReviewContext,
+    provider: str,
+    presence: ProviderPresence,
+) -> Optional[_ProviderExecutionOutcome]:
+    if presence.detected and presence.auth_ok:
+        return None
+    return _failed_outcome(
+        review,
+        provider,
+        {
+            "success": False,
+            "reason": "provider_unavailable",
+            "detected": presence.detected,
+            "auth_ok": presence.auth_ok,
+            "presence_reason": presence.reason,
+            "binary_path": presence.binary_path,
+            "version": presence.version,
+        },
+    )
+
+
+def _prepare_provider(
+    review: _ReviewContext,
+    provider: str,
+    adapter: ProviderAdapter,
+    asynchronous: bool,
+    phases: Optional[PhaseRecorder] = None,
+    trace_span: Span = NOOP_SPAN,
+) -> Union[_ProviderContext, _ProviderExecutionOutcome]:
+    """Resolve permissions and timeouts for a detected provider, or return the outcome that stops it early."""
+    policy = review.request.policy
+    requested_permissions = policy.provider_permissions.get(provider, {})
     requested_permissions = requested_permissions if isinstance(requested_permissions, dict) else {}
     supported_keys = _supported_permission_keys(adapter)
     unknown_permission_keys = sorted(
@@ -516,182 +856,624 @@ def _run_provider(
         for key, value in requested_permissions.items()
         if str(key).strip() in supported_keys
     }
-    if unknown_permission_keys and request.policy.enforcement_mode == "strict":
-        _ensure_if_persisting()
-        return _ProviderExecutionOutcome(
-            provider=provider,
-            success=False,
-            parse_ok=False,
-            schema_valid_count=0,
-            dropped_count=0,
-            findings=[],
-            provider_result={
+    if unknown_permission_keys and policy.enforcement_mode == "strict":
+        return _failed_outcome(
+            review,
+            provider,
+            {
                 "success": False,
                 "reason": "permission_enforcement_failed",
-                "enforcement_mode": request.policy.enforcement_mode,
+                "enforcement_mode": policy.enforcement_mode,
                 "requested_permissions": requested_permissions,
                 "supported_permission_keys": sorted(supported_keys),
                 "unknown_permission_keys": unknown_permission_keys,
             },
         )
 
-    provider_stall_timeout = _provider_stall_timeout_seconds(request.policy, provider)
-    poll_interval_seconds = _poll_interval_seconds(request.policy)
-    review_hard_timeout_seconds = request.policy.review_hard_timeout_seconds if review_mode else 0
+    stall_timeout_seconds = _provider_stall_timeout_seconds(policy, provider)
+    hard_timeout_seconds = policy.review_hard_timeout_seconds if review.review_mode else 0
+    learned = review.adaptive_timeouts.get(provider)
+    if learned is not None:
+        # An explicit per-provider timeout wins; the review hard timeout stays an upper bound. Run mode has no
+        # hard deadline, and learning one must not add it, so there only the stall timeout is learned.
+        if provider not in policy.provider_timeouts:
+            stall_timeout_seconds = learned[0]
+        if review.review_mode:
+            hard_timeout_seconds = min(hard_timeout_seconds, learned[1]) if hard_timeout_seconds > 0 else learned[1]
+
+    return _ProviderContext(
+        review=review,
+        provider=provider,
+        adapter=adapter,
+        requested_permissions=requested_permissions,
+        effective_permissions=effective_permissions,
+        unknown_permission_keys=unknown_permission_keys,
+        stall_timeout_seconds=stall_timeout_seconds,
+        poll_interval_seconds=_poll_interval_seconds(policy),
+        hard_timeout_seconds=hard_timeout_seconds,
+        event_driven_wait=_supports_completion_wait(adapter, asynchronous),
+        stream_parse=policy.stream_parse,
+        phases=phases if phases is not None else PhaseRecorder(),
+        trace_span=trace_span,
+    )
+
 
-    def runner(_attempt: int) -> AttemptResult:
-        run_ref = None
+class _ProviderAttempt:
+    """
+    One provider attempt split into start/step so the blocking and asyncio runners share
+    the stall and hard-deadline bookkeeping and differ only in how they wait and cancel.
+    """
+
+    def __init__(self, ctx: _ProviderContext, span: Span = NOOP_SPAN) -> None:
+        self.ctx = ctx
+        self.span = span
+        self.run_ref: Optional[TaskRunRef] = None
+        self.status: Optional[TaskStatus] = None
+        self.started = 0.0
+        self.checked_at = 0.0
+        self.running_since: Optional[float] = None
+        self.last_progress_at = 0.0
+        self.last_snapshot: Tuple[int, int] = (0, 0)
+        self.stdout_tail: Optional[_StdoutTail] = None
+        self.hedge: Optional[_ProviderAttempt] = None
+        self.hedge_info: Optional[Dict[str, object]] = None
+        self._abandoned_hedges: List[_ProviderAttempt] = []
+        self.lease: Optional[SlotLease] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.status is not None and self.status.completed
+
+    def hedge_due(self) -> bool:
+        ctx = self.ctx
+        return (
+            ctx.hedge is not None
+            and self.hedge_info is None
+            and (time.time() - self.started) >= ctx.hedge_after_seconds
+        )
+
+    def start_hedge(self) -> None:
+        """Launch the backup provider on the same prompt; a backup that fails to start is dropped."""
+        ctx = self.ctx
+        assert ctx.hedge is not None
+        self.hedge_info = {
+            "backup_provider": ctx.hedge.provider,
+            "threshold_seconds": round(ctx.hedge_after_seconds, 3),
+            "started_after_seconds": round(time.time() - self.started, 3),
+            "backup_cancel_reason": "",
+        }
+        slots = ctx.review.provider_slots
+        lease: Optional[SlotLease] = None
+        if slots is not None and slots.limited(ctx.hedge.provider):
+            # A backup is only worth starting right away; it never queues behind other runs.
+            lease = slots.try_acquire(ctx.hedge.provider)
+            if lease is None:
+                self.hedge_info["backup_cancel_reason"] = "slot_unavailable"
+                return
+        hedge_span = ctx.review.tracer.start_span("mco.attempt", self.span, provider=ctx.hedge.provider, hedge=True)
+        hedge = _ProviderAttempt(ctx.hedge, hedge_span)
+        hedge.lease = lease
         try:
-            metadata = {
-                "artifact_root": runtime_artifact_base,
-                "allow_paths": allow_paths,
-                "provider_permissions": effective_permissions,
-                "enforcement_mode": request.policy.enforcement_mode,
-            }
-            if review_mode and provider == "codex" and REVIEW_FINDINGS_SCHEMA_PATH.exists():
-                metadata["output_schema_path"] = str(REVIEW_FINDINGS_SCHEMA_PATH)
-            input_task = TaskInput(
-                task_id=resolved_task_id,
-                prompt=full_prompt,
-                repo_root=request.repo_root,
-                target_paths=target_paths,
-                timeout_seconds=provider_stall_timeout,
-                metadata=metadata,
+            hedge.start()
+        except Exception as exc:
+            self.hedge_info["backup_cancel_reason"] = f"start_failed: {exc}"
+            hedge_span.fail("start_failed")
+            hedge_span.end()
+            hedge.release_lease()
+            return
+        self.hedge = hedge
+        if ctx.review.events is not None:
+            ctx.review.events.emit("hedge_started", provider=ctx.provider, backup_provider=ctx.hedge.provider)
+
+    def step_hedge(self) -> Optional[AttemptResult]:
+        """Poll the running backup; returns its result once it has succeeded first."""
+        hedge = self.hedge
+        if hedge is None:
+            return None
+        cancel_reason = hedge.step()
+        if hedge.completed:
+            self.hedge = None
+            with self.ctx.phases.span("parse"), self.ctx.review.tracer.span("mco.parse", hedge.span) as parse_span:
+                result = hedge.completed_result(parse_span)
+            _traced_attempt(hedge.span, result)
+            hedge.span.end()
+            hedge.release_lease()
+            if result.success:
+                self.record_running()
+                return self._with_hedge_info(result, winner=hedge.ctx.provider)
+            # The backup failed; keep waiting for the primary.
+            assert self.hedge_info is not None
+            self.hedge_info["backup_cancel_reason"] = "backup_failed"
+        elif cancel_reason:
+            self.hedge = None
+            self._abandoned_hedges.append(hedge)
+            assert self.hedge_info is not None
+            self.hedge_info["backup_cancel_reason"] = cancel_reason
+            hedge.span.set(cancel_reason=cancel_reason)
+            hedge.span.end()
+        return None
+
+    def release_lease(self) -> None:
+        lease, self.lease = self.lease, None
+        if lease is not None:
+            lease.release()
+
+    def release_hedges(self) -> List[Tuple[ProviderAdapter, TaskRunRef]]:
+        """Backup runs that are still alive and must be cancelled now that the attempt is over."""
+        pending = self._abandoned_hedges + ([self.hedge] if self.hedge is not None else [])
+        self._abandoned_hedges = []
+        self.hedge = None
+        for item in pending:
+            item.span.end()
+            item.release_lease()
+        return [(item.ctx.adapter, item.run_ref) for item in pending if item.run_ref is not None]
+
+    def _with_hedge_info(self, result: AttemptResult, winner: str) -> AttemptResult:
+        if self.hedge_info is not None and isinstance(result.output, dict):
+            result.output["hedge"] = dict(self.hedge_info, winner=winner)
+        return result
+
+    def start(self) -> TaskRunRef:
+        ctx = self.ctx
+        review = ctx.review
+        metadata = {
+            "artifact_root": review.runtime_artifact_base,
+            "allow_paths": review.allow_paths,
+            "provider_permissions": ctx.effective_permissions,
+            "enforcement_mode": review.request.policy.enforcement_mode,
+        }
+        if review.review_mode and ctx.provider == "codex" and REVIEW_FINDINGS_SCHEMA_PATH.exists():
+            metadata["output_schema_path"] = str(REVIEW_FINDINGS_SCHEMA_PATH)
+        warm_pool_idle_seconds = review.request.policy.warm_pool_idle_seconds
+        if warm_pool_idle_seconds > 0:
+            metadata["warm_pool_dir"] = str(_warm_pool_dir(review.request))
+            metadata["warm_pool_idle_seconds"] = warm_pool_idle_seconds
+        input_task = TaskInput(
+            task_id=review.task_id,
+            prompt=review.full_prompt,
+            repo_root=review.request.repo_root,
+            target_paths=review.target_paths,
+            timeout_seconds=ctx.stall_timeout_seconds,
+            metadata=metadata,
+        )
+        with ctx.phases.span("spawn"):
+            run_ref = ctx.adapter.run(input_task)
+        self.run_ref = run_ref
+        self.running_since = ctx.phases.now()
+        self.span.set(run_id=run_ref.run_id)
+        self.started = time.time()
+        self.checked_at = self.started
+        self.last_progress_at = self.started
+        self.last_snapshot = _raw_output_size_snapshot(run_ref.artifact_path, ctx.provider)
+        if ctx.stream_parse:
+            self.stdout_tail = _StdoutTail(Path(run_ref.artifact_path) / "raw" / f"{ctx.provider}.stdout.log")
+        if review.events is not None:
+            review.events.emit("provider_started", provider=ctx.provider, run_id=run_ref.run_id)
+        return run_ref
+
+    def step(self) -> str:
+        """Poll once. Returns the cancel reason when a deadline has passed, otherwise an empty string."""
+        assert self.run_ref is not None
+        ctx = self.ctx
+        previous_check = self.checked_at
+        self.status = ctx.adapter.poll(self.run_ref)
+        now = time.time()
+        self.checked_at = now
+        if self.status.completed:
+            self.record_running(previous_check)
+            return ""
+        abort_reason = _abort_reason(ctx)
+        if abort_reason:
+            self.record_running()
+            return abort_reason
+
+        current_snapshot = _raw_output_size_snapshot(self.run_ref.artifact_path, ctx.provider)
+        if current_snapshot != self.last_snapshot:
+            self.last_snapshot = current_snapshot
+            if self.stdout_tail is not None:
+                fragments = self.stdout_tail.read()
+                if fragments and ctx.review.events is not None:
+                    self.report_streamed_findings(fragments)
+            if ctx.review.events is not None:
+                ctx.review.events.emit(
+                    "provider_progress",
+                    provider=ctx.provider,
+                    stdout_bytes=current_snapshot[0],
+                    stderr_bytes=current_snapshot[1],
+                )
+            if ctx.event_driven_wait:
+                # Woken only at deadlines, so take the real write time from the log mtime.
+                modified_at = _raw_output_last_modified(self.run_ref.artifact_path, ctx.provider)
+                self.last_progress_at = max(self.last_progress_at, min(now, modified_at)) if modified_at else now
+            else:
+                self.last_progress_at = now
+
+        if ctx.hard_timeout_seconds > 0 and (now - self.started) > ctx.hard_timeout_seconds:
+            self.record_running()
+            return "hard_deadline_exceeded"
+        if (now - self.last_progress_at) > ctx.stall_timeout_seconds:
+            self.record_running()
+            return "stall_timeout"
+        return ""
+
+    def report_streamed_findings(self, fragments: List[JsonFragment]) -> None:
+        assert self.stdout_tail is not None and self.ctx.review.events is not None
+        for fragment in fragments:
+            output = self.stdout_tail.fragment_output(fragment)
+            if not output.contract_info["has_contract_envelope"]:
+                continue
+            try:
+                findings, _ = self.normalize(output, self.span)
+            except Exception:
+                # The full output is normalized at exit; a value the adapter cannot read alone is reported then.
+                continue
+            self.ctx.review.events.findings(self.ctx.provider, findings)
+
+    def record_running(self, previous_check: Optional[float] = None) -> None:
+        """
+        Book the time since spawn as model time, once. When the exit was found by a blind poll
+        (`previous_check` given), the exit is assumed to follow both the previous poll and the last
+        output write, and the time from there to this poll is booked as poll slack instead.
+        """
+        if self.running_since is None:
+            return
+        ctx = self.ctx
+        running = ctx.phases.now() - self.running_since
+        self.running_since = None
+        slack = 0.0
+        if previous_check is not None and not ctx.event_driven_wait and self.run_ref is not None:
+            exited_after = max(previous_check, _raw_output_last_modified(self.run_ref.artifact_path, ctx.provider))
+            slack = min(running, max(0.0, self.checked_at - exited_after))
+        ctx.phases.add("model", running - slack)
+        ctx.phases.add("poll_slack", slack)
+
+    def wait_seconds(self) -> float:
+        ctx = self.ctx
+        review = ctx.review
+        now = time.time()
+        if ctx.event_driven_wait:
+            next_deadline = self.last_progress_at + ctx.stall_timeout_seconds
+            if ctx.hard_timeout_seconds > 0:
+                next_deadline = min(next_deadline, self.started + ctx.hard_timeout_seconds)
+            wait = max(0.0, next_deadline - now) + _DEADLINE_SLACK_SECONDS
+            # Streaming, early exit, pending detection and a running backup must look between deadlines;
+            # exit still wakes the wait early.
+            watching = (
+                ctx.stream_parse
+                or review.events is not None
+                or review.early_exit is not None
+                or ctx.presence_check is not None
+                or self.hedge is not None
+            )
+            if watching:
+                wait = min(wait, ctx.poll_interval_seconds)
+        else:
+            wait = ctx.poll_interval_seconds
+        if ctx.hedge is not None and self.hedge_info is None:
+            wait = min(wait, max(0.0, self.started + ctx.hedge_after_seconds - now) + _DEADLINE_SLACK_SECONDS)
+        return wait
+
+    def read_stdout(self) -> ParsedOutput:
+        assert self.run_ref is not None
+        if self.stdout_tail is not None:
+            return self.stdout_tail.finish()
+        return ParsedOutput(_read_text(Path(self.run_ref.artifact_path) / "raw" / f"{self.ctx.provider}.stdout.log"))
+
+    def normalize(
+        self,
+        raw_stdout: ParsedOutput,
+        parent: Span = NOOP_SPAN,
+    ) -> Tuple[List[NormalizedFinding], Dict[str, object]]:
+        ctx = self.ctx
+        review = ctx.review
+        with review.tracer.span("mco.normalize", parent, provider=ctx.provider) as span:
+            findings = ctx.adapter.normalize(
+                raw_stdout,
+                NormalizeContext(
+                    task_id=review.task_id,
+                    provider=ctx.provider,  # type: ignore[arg-type]
+                    repo_root=review.request.repo_root,
+                    raw_ref=f"raw/{ctx.provider}.stdout.log",
+                ),
+            )
+            span.set(findings_count=len(findings))
+        return findings, raw_stdout.contract_info
+
+    def timeout_result(self, cancel_reason: str, parent: Span = NOOP_SPAN) -> AttemptResult:
+        assert self.run_ref is not None and self.status is not None
+        provider = self.ctx.provider
+        raw_dir = Path(self.run_ref.artifact_path) / "raw"
+        timeout_stdout = self.read_stdout()
+        timeout_stderr = _read_text(raw_dir / f"{provider}.stderr.log")
+        timeout_output = timeout_stdout if timeout_stdout.strip() else ParsedOutput(timeout_stderr)
+        timeout_payload = {
+            "cancel_reason": cancel_reason,
+            "wall_clock_seconds": round(self.checked_at - self.started, 3),
+            "last_progress_at": _timestamp_to_iso(self.last_progress_at),
+            "output_text": str(timeout_output),
+            "final_text": timeout_output.final_text,
+            "parse_ok": False,
+            "parse_reason": "",
+            "schema_valid_count": 0,
+            "dropped_count": 0,
+            "findings": [],
+            "run_ref": asdict(self.run_ref),
+            "status": asdict(self.status),
+        }
+        if self.stdout_tail is not None and self.ctx.review.review_mode and timeout_stdout.strip():
+            # Keep the findings the provider had already emitted before it was cut off.
+            findings, contract_info = self.normalize(timeout_stdout, parent)
+            timeout_payload.update(
+                {
+                    "parse_ok": bool(contract_info["parse_ok"]),
+                    "parse_reason": str(contract_info.get("parse_reason", "")),
+                    "schema_valid_count": int(contract_info["schema_valid_count"]),
+                    "dropped_count": int(contract_info["dropped_count"]),
+                    "findings": [asdict(item) for item in findings],
+                }
+            )
+        if self.ctx.review.request.include_token_usage:
+            timeout_payload["token_usage"] = timeout_output.token_usage
+        result = AttemptResult(
+            success=False,
+            output=timeout_payload,
+            # Deadlines are worth another attempt; an early exit is final.
+            error_kind=ErrorKind.RETRYABLE_TIMEOUT if cancel_reason in _DEADLINE_CANCEL_REASONS else ErrorKind.CANCELLED,
+            stderr=cancel_reason,
+        )
+        return self._with_hedge_info(result, winner=self.ctx.provider)
+
+    def completed_result(self, parent: Span = NOOP_SPAN) -> AttemptResult:
+        assert self.run_ref is not None and self.status is not None
+        ctx = self.ctx
+        review = ctx.review
+        provider = ctx.provider
+        status = self.status
+        raw_dir = Path(self.run_ref.artifact_path) / "raw"
+        raw_stdout = self.read_stdout()
+        raw_stderr = _read_text(raw_dir / f"{provider}.stderr.log")
+        # Parsed once and shared by normalize, contract inspection, final text and token usage.
+        output = raw_stdout if raw_stdout.strip() else ParsedOutput(raw_stderr)
+        findings: List[NormalizedFinding] = []
+        parse_ok = False
+        parse_reason = "not_applicable"
+        schema_valid_count = 0
+        dropped_count = 0
+        success = status.attempt_state == "SUCCEEDED"
+        if review.review_mode:
+            findings, contract_info = self.normalize(raw_stdout, parent)
+            parse_ok = bool(contract_info["parse_ok"])
+            parse_reason = str(contract_info.get("parse_reason", ""))
+            schema_valid_count = int(contract_info["schema_valid_count"])
+            dropped_count = int(contract_info["dropped_count"])
+            if review.request.policy.enforce_findings_contract:
+                success = status.attempt_state == "SUCCEEDED" and parse_ok
+                if review.request.policy.require_non_empty_findings and success and len(findings) == 0:
+                    success = False
+
+        payload = {
+            "provider": provider,
+            "status": asdict(status),
+            "run_ref": asdict(self.run_ref),
+            "cancel_reason": "",
+            "wall_clock_seconds": round(time.time() - self.started, 3),
+            "last_progress_at": _timestamp_to_iso(self.last_progress_at),
+            "output_text": str(output),
+            "parse_ok": parse_ok,
+            "parse_reason": parse_reason,
+            "schema_valid_count": schema_valid_count,
+            "dropped_count": dropped_count,
+            "findings": [asdict(item) for item in findings],
+            "final_text": output.final_text,
+        }
+        if review.request.include_token_usage:
+            payload["token_usage"] = output.token_usage
+        if success:
+            result = AttemptResult(success=True, output=payload)
+        else:
+            error_kind = status.error_kind or ErrorKind.NORMALIZATION_ERROR
+            retry_after_seconds = None
+            if error_kind == ErrorKind.RETRYABLE_RATE_LIMIT:
+                retry_after_seconds = parse_retry_after(f"{raw_stderr}\n{raw_stdout[-_RETRY_HINT_TAIL_CHARS:]}")
+            result = AttemptResult(
+                success=False, output=payload, error_kind=error_kind, retry_after_seconds=retry_after_seconds
             )
-            run_ref = adapter.run(input_task)
-            started = time.time()
-            last_progress_at = started
-            last_snapshot = _raw_output_size_snapshot(run_ref.artifact_path, provider)
-            status = None
+        return self._with_hedge_info(result, winner=provider)
+
+
+def _cancel_quietly(adapter: ProviderAdapter, run_ref: TaskRunRef) -> None:
+    try:
+        adapter.cancel(run_ref)
+    except Exception:
+        pass
+
+
+async def _cancel_quietly_async(adapter: ProviderAdapter, run_ref: TaskRunRef) -> None:
+    cancel_async = getattr(adapter, "cancel_async", None)
+    try:
+        if callable(cancel_async):
+            await cancel_async(run_ref)
+        else:
+            await asyncio.to_thread(adapter.cancel, run_ref)
+    except Exception:
+        pass
+
+
+def _spawn_failure(attempt: _ProviderAttempt, exc: Exception) -> Optional[Dict[str, object]]:
+    """Output recording that the provider binary could not be executed, when that is why the attempt failed."""
+    if attempt.run_ref is None and isinstance(exc, (FileNotFoundError, PermissionError)):
+        return {"spawn_error": f"{exc.__class__.__name__}: {exc}"}
+    return None
+
+
+def _cancelled_before_start(reason: str) -> AttemptResult:
+    return AttemptResult(
+        success=False,
+        output={"cancel_reason": reason, "findings": []},
+        error_kind=ErrorKind.CANCELLED,
+        stderr=reason,
+    )
+
+
+def _traced_attempt(span: Span, result: AttemptResult) -> AttemptResult:
+    output = result.output if isinstance(result.output, dict) else {}
+    span.set(
+        success=result.success,
+        error_kind=result.error_kind.value if result.error_kind else None,
+        cancel_reason=str(output.get("cancel_reason", "")) or None,
+    )
+    if not result.success:
+        span.fail(result.error_kind.value if result.error_kind else "failed")
+    return result
+
+
+def _run_attempt(ctx: _ProviderContext, number: int = 1) -> AttemptResult:
+    with ctx.review.tracer.span("mco.attempt", ctx.trace_span, provider=ctx.provider, attempt=number) as span:
+        return _traced_attempt(span, _attempt_loop(ctx, span))
+
+
+async def _run_attempt_async(ctx: _ProviderContext, number: int = 1) -> AttemptResult:
+    with ctx.review.tracer.span("mco.attempt", ctx.trace_span, provider=ctx.provider, attempt=number) as span:
+        return _traced_attempt(span, await _attempt_loop_async(ctx, span))
+
+
+def _slot_wait_needed(ctx: _ProviderContext) -> bool:
+    slots = ctx.review.provider_slots
+    return slots is not None and slots.limited(ctx.provider)
+
+
+def _acquire_slot(ctx: _ProviderContext, span: Span) -> Tuple[Optional[SlotLease], str]:
+    """Wait for a host-wide slot for the provider; returns the lease, or the abort reason that ended the wait."""
+    if not _slot_wait_needed(ctx):
+        return None, ""
+    assert ctx.review.provider_slots is not None
+    with ctx.phases.span("queue"), ctx.review.tracer.span("mco.queue", span):
+        lease = ctx.review.provider_slots.acquire(ctx.provider, abort=lambda: _abort_reason(ctx))
+    return lease, "" if lease is not None else _abort_reason(ctx)
+
+
+async def _acquire_slot_async(ctx: _ProviderContext, span: Span) -> Tuple[Optional[SlotLease], str]:
+    if not _slot_wait_needed(ctx):
+        return None, ""
+    assert ctx.review.provider_slots is not None
+    with ctx.phases.span("queue"), ctx.review.tracer.span("mco.queue", span):
+        lease = await ctx.review.provider_slots.acquire_async(ctx.provider, abort=lambda: _abort_reason(ctx))
+    return lease, "" if lease is not None else _abort_reason(ctx)
+
+
+def _attempt_loop(ctx: _ProviderContext, span: Span) -> AttemptResult:
+    abort_reason = _abort_reason(ctx)
+    if abort_reason:
+        return _cancelled_before_start(abort_reason)
+    lease, abort_reason = _acquire_slot(ctx, span)
+    if abort_reason:
+        return _cancelled_before_start(abort_reason)
+    tracer = ctx.review.tracer
+    attempt = _ProviderAttempt(ctx, span)
+    attempt.lease = lease
+    try:
+        run_ref = attempt.start()
+        try:
             while True:
-                status = adapter.poll(run_ref)
-                now = time.time()
-                if status.completed:
-                    break
-
-                current_snapshot = _raw_output_size_snapshot(run_ref.artifact_path, provider)
-                if current_snapshot != last_snapshot:
-                    last_snapshot = current_snapshot
-                    last_progress_at = now
-
-                cancel_reason = ""
-                if review_hard_timeout_seconds > 0 and (now - started) > review_hard_timeout_seconds:
-                    cancel_reason = "hard_deadline_exceeded"
-                elif (now - last_progress_at) > provider_stall_timeout:
-                    cancel_reason = "stall_timeout"
+                cancel_reason = attempt.step()
+                if attempt.completed:
+                    with ctx.phases.span("parse"), tracer.span("mco.parse", span) as parse_span:
+                        return attempt.completed_result(parse_span)
+                hedge_result = attempt.step_hedge()
+                if hedge_result is not None:
+                    with ctx.phases.span("cancel"):
+                        _cancel_quietly(ctx.adapter, run_ref)
+                    return hedge_result
+                if cancel_reason:
+                    with ctx.phases.span("cancel"):
+                        _cancel_quietly(ctx.adapter, run_ref)
+                    with ctx.phases.span("parse"), tracer.span("mco.parse", span) as parse_span:
+                        return attempt.timeout_result(cancel_reason, parse_span)
+                if attempt.hedge_due():
+                    attempt.start_hedge()
+                _wait_for_provider(ctx.adapter, run_ref, attempt.wait_seconds())
+        finally:
+            for adapter, hedge_ref in attempt.release_hedges():
+                _cancel_quietly(adapter, hedge_ref)
+    except Exception as exc:  # pragma: no cover - guarded by contract tests
+        return AttemptResult(
+            success=False,
+            output=_spawn_failure(attempt, exc),
+            error_kind=ErrorKind.NORMALIZATION_ERROR,
+            stderr=str(exc),
+        )
+    finally:
+        attempt.release_lease()
+
 
+async def _start_attempt_async(adapter: ProviderAdapter, attempt: _ProviderAttempt) -> TaskRunRef:
+    spawn = asyncio.ensure_future(asyncio.to_thread(attempt.start))
+    try:
+        return await asyncio.shield(spawn)
+    except asyncio.CancelledError:
+        # The spawn finishes in its thread regardless; stop whatever it started before giving up.
+        try:
+            run_ref = await spawn
+        except Exception:
+            pass
+        else:
+            await _cancel_quietly_async(adapter, run_ref)
+        raise
+
+
+async def _attempt_loop_async(ctx: _ProviderContext, span: Span) -> AttemptResult:
+    abort_reason = _abort_reason(ctx)
+    if abort_reason:
+        return _cancelled_before_start(abort_reason)
+    lease, abort_reason = await _acquire_slot_async(ctx, span)
+    if abort_reason:
+        return _cancelled_before_start(abort_reason)
+    tracer = ctx.review.tracer
+    attempt = _ProviderAttempt(ctx, span)
+    attempt.lease = lease
+    try:
+        # Spawning (and, for warm-pool providers, waiting for a server) blocks, so it runs in a worker thread.
+        run_ref = await _start_attempt_async(ctx.adapter, attempt)
+        try:
+            while True:
+                cancel_reason = attempt.step()
+                if attempt.completed:
+                    # Reading and parsing large provider output must not stall the other reviews on the loop.
+                    with ctx.phases.span("parse"), tracer.span("mco.parse", span) as parse_span:
+                        return await asyncio.to_thread(attempt.completed_result, parse_span)
+                hedge_result = await asyncio.to_thread(attempt.step_hedge)
+                if hedge_result is not None:
+                    with ctx.phases.span("cancel"):
+                        await _cancel_quietly_async(ctx.adapter, run_ref)
+                    return hedge_result
                 if cancel_reason:
-                    if run_ref is not None:
-                        try:
-                            adapter.cancel(run_ref)
-                        except Exception:
-                            pass
-                    raw_dir = Path(run_ref.artifact_path) / "raw"
-                    timeout_stdout = _read_text(raw_dir / f"{provider}.stdout.log")
-                    timeout_stderr = _read_text(raw_dir / f"{provider}.stderr.log")
-                    timeout_output_text = _output_text(timeout_stdout, timeout_stderr)
-                    timeout_payload = {
-                        "cancel_reason": cancel_reason,
-                        "wall_clock_seconds": round(now - started, 3),
-                        "last_progress_at": _timestamp_to_iso(last_progress_at),
-                        "output_text": timeout_output_text,
-                        "final_text": extract_final_text_from_output(timeout_output_text),
-                        "parse_ok": False,
-                        "parse_reason": "",
-                        "schema_valid_count": 0,
-                        "dropped_count": 0,
-                        "findings": [],
-                        "run_ref": asdict(run_ref),
-                        "status": asdict(status),
-                    }
-                    return AttemptResult(
-                        success=False,
-                        output=timeout_payload,
-                        error_kind=ErrorKind.RETRYABLE_TIMEOUT,
-                        stderr=cancel_reason,
-                    )
-
-                time.sleep(poll_interval_seconds)
-
-            if status is None or not status.completed:
-                if run_ref is not None:
-                    try:
-                        adapter.cancel(run_ref)
-                    except Exception:
-                        pass
-                fallback_payload = {
-                    "cancel_reason": "provider_poll_timeout",
-                    "wall_clock_seconds": round(time.time() - started, 3),
-                    "last_progress_at": _timestamp_to_iso(last_progress_at),
-                    "output_text": "",
-                    "parse_ok": False,
-                    "parse_reason": "",
-                    "schema_valid_count": 0,
-                    "dropped_count": 0,
-                    "findings": [],
-                    "run_ref": asdict(run_ref) if run_ref is not None else None,
-                    "status": asdict(status) if status is not None else None,
-                }
-                return AttemptResult(
-                    success=False,
-                    output=fallback_payload,
-                    error_kind=ErrorKind.RETRYABLE_TIMEOUT,
-                    stderr="provider_poll_timeout",
-                )
+                    with ctx.phases.span("cancel"):
+                        await _cancel_quietly_async(ctx.adapter, run_ref)
+                    with ctx.phases.span("parse"), tracer.span("mco.parse", span) as parse_span:
+                        return await asyncio.to_thread(attempt.timeout_result, cancel_reason, parse_span)
+                if attempt.hedge_due():
+                    await asyncio.to_thread(attempt.start_hedge)
+                await _wait_for_provider_async(ctx.adapter, run_ref, attempt.wait_seconds())
+        except asyncio.CancelledError:
+            # The caller gave up on the review; do not leave the provider process behind.
+            await asyncio.shield(_cancel_quietly_async(ctx.adapter, run_ref))
+            raise
+        finally:
+            for adapter, hedge_ref in attempt.release_hedges():
+                await asyncio.shield(_cancel_quietly_async(adapter, hedge_ref))
+    except Exception as exc:  # pragma: no cover - guarded by contract tests
+        return AttemptResult(
+            success=False,
+            output=_spawn_failure(attempt, exc),
+            error_kind=ErrorKind.NORMALIZATION_ERROR,
+            stderr=str(exc),
+        )
+    finally:
+        attempt.release_lease()
 
-            raw_dir = Path(run_ref.artifact_path) / "raw"
-            raw_stdout = _read_text(raw_dir / f"{provider}.stdout.log")
-            raw_stderr = _read_text(raw_dir / f"{provider}.stderr.log")
-            findings: List[NormalizedFinding] = []
-            parse_ok = False
-            parse_reason = "not_applicable"
-            schema_valid_count = 0
-            dropped_count = 0
-            success = status.attempt_state == "SUCCEEDED"
-            if review_mode:
-                findings = adapter.normalize(
-                    raw_stdout,
-                    NormalizeContext(
-                        task_id=resolved_task_id,
-                        provider=provider,
-                        repo_root=request.repo_root,
-                        raw_ref=f"raw/{provider}.stdout.log",
-                    ),
-                )
-                contract_info = inspect_contract_output(raw_stdout)
-                parse_ok = bool(contract_info["parse_ok"])
-                parse_reason = str(contract_info.get("parse_reason", ""))
-                schema_valid_count = int(contract_info["schema_valid_count"])
-                dropped_count = int(contract_info["dropped_count"])
-                if request.policy.enforce_findings_contract:
-                    success = status.attempt_state == "SUCCEEDED" and parse_ok
-                    if request.policy.require_non_empty_findings and success and len(findings) == 0:
-                        success = False
-
-            payload = {
-                "provider": provider,
-                "status": asdict(status),
-                "run_ref": asdict(run_ref),
-                "cancel_reason": "",
-                "wall_clock_seconds": round(time.time() - started, 3),
-                "last_progress_at": _timestamp_to_iso(last_progress_at),
-                "output_text": _output_text(raw_stdout, raw_stderr),
-                "parse_ok": parse_ok,
-                "parse_reason": parse_reason,
-                "schema_valid_count": schema_valid_count,
-                "dropped_count": dropped_count,
-                "findings": [asdict(item) for item in findings],
-            }
-            payload["final_text"] = extract_final_text_from_output(str(payload.get("output_text", "")))
-            if success:
-                return AttemptResult(success=True, output=payload)
-            if status.error_kind:
-                return AttemptResult(success=False, output=payload, error_kind=status.error_kind)
-            return AttemptResult(success=False, output=payload, error_kind=ErrorKind.NORMALIZATION_ERROR)
-        except Exception as exc:  # pragma: no cover - guarded by contract tests
-            return AttemptResult(success=False, error_kind=ErrorKind.NORMALIZATION_ERROR, stderr=str(exc))
-
-    run_result = runtime.run_with_retry(resolved_task_id, provider, runner)
+
+def _finalize_provider(ctx: _ProviderContext, run_result: RunResult) -> _ProviderExecutionOutcome:
+    request = ctx.review.request
     output = run_result.output if isinstance(run_result.output, dict) else {}
     parse_ok = bool(output.get("parse_ok", False))
     provider_schema_valid = int(output.get("schema_valid_count", 0))
@@ -700,7 +1482,7 @@ def _run_provider(
     output_text = str(output.get("output_text", ""))
     final_text = str(output.get("final_text", ""))
     response_ok, response_reason = _response_quality(run_result.success, output_text, final_text)
-    token_usage = extract_token_usage_from_output(output_text) if request.include_token_usage else None
+    token_usage = output.get("token_usage") if request.include_token_usage else None
     token_usage_completeness = _token_usage_completeness(token_usage) if request.include_token_usage else None
 
     wall_clock_value = output.get("wall_clock_seconds")
@@ -727,366 +1509,1125 @@ def _run_provider(
         "findings_count": len(findings),
         "output_path": (
             output.get("status", {}).get("output_path")
-            if persist_artifacts and isinstance(output.get("status"), dict)
+            if ctx.review.write_artifacts and isinstance(output.get("status"), dict)
             else None
         ),
-        "requested_permissions": requested_permissions,
-        "applied_permissions": effective_permissions,
-        "unknown_permission_keys": unknown_permission_keys,
+        "requested_permissions": ctx.requested_permissions,
+        "applied_permissions": ctx.effective_permissions,
+        "unknown_permission_keys": ctx.unknown_permission_keys,
         "enforcement_mode": request.policy.enforcement_mode,
     }
     if request.include_token_usage:
         provider_result["token_usage"] = token_usage
         provider_result["token_usage_completeness"] = token_usage_completeness
-    _ensure_if_persisting()
+    if isinstance(output.get("hedge"), dict):
+        provider_result["hedge"] = output["hedge"]
+    if ctx.provider in ctx.review.adaptive_timeouts:
+        provider_result["adaptive_timeouts"] = {
+            "stall_timeout_seconds": ctx.stall_timeout_seconds,
+            "hard_timeout_seconds": ctx.hard_timeout_seconds,
+        }
+    with ctx.phases.span("artifacts"):
+        _ensure_artifacts_if_persisting(ctx.review, ctx.provider)
     return _ProviderExecutionOutcome(
-        provider=provider,
+        provider=ctx.provider,
         success=run_result.success,
         parse_ok=parse_ok,
         schema_valid_count=provider_schema_valid,
         dropped_count=provider_dropped,
         findings=findings,
         provider_result=provider_result,
+        presence_stale=_presence_went_stale(run_result, output),
     )
 
 
-def run_review(
+def _presence_went_stale(run_result: RunResult, output: Mapping[str, object]) -> bool:
+    if run_result.success:
+        return False
+    if run_result.final_error == ErrorKind.NON_RETRYABLE_AUTH or "spawn_error" in output:
+        return True
+    status = output.get("status")
+    return isinstance(status, dict) and status.get("exit_code") in _MISSING_BINARY_EXIT_CODES
+
+
+def _hedge_plan(review: _ReviewContext, provider: str) -> Optional[Tuple[str, ProviderAdapter]]:
+    """Backup provider and adapter for `provider`, when hedging is configured and its latency history is known."""
+    backup = review.request.policy.hedge_providers.get(provider)
+    if not backup or backup == provider or provider not in review.hedge_after_seconds:
+        return None
+    adapter = review.adapter_map.get(backup)
+    return (backup, adapter) if adapter is not None else None
+
+
+def _attach_hedge(
+    ctx: _ProviderContext,
+    backup: str,
+    adapter: ProviderAdapter,
+    presence: ProviderPresence,
+    asynchronous: bool,
+) -> _ProviderContext:
+    if not (presence.detected and presence.auth_ok):
+        return ctx
+    review = ctx.review
+    hedge_review = replace(
+        review,
+        artifact_root=None,
+        runtime_artifact_base=str(hedge_artifact_base(review.runtime_artifact_base, review.task_id, ctx.provider)),
+        write_artifacts=False,
+        events=None,
+    )
+    hedge = _prepare_provider(hedge_review, backup, adapter, asynchronous)
+    if isinstance(hedge, _ProviderExecutionOutcome):
+        return ctx
+    return replace(ctx, hedge=hedge, hedge_after_seconds=review.hedge_after_seconds[ctx.provider])
+
+
+def _result_cache_key(ctx: _ProviderContext, presence: ProviderPresence) -> str:
+    review = ctx.review
+    policy = review.request.policy
+    return result_cache_key(
+        provider=ctx.provider,
+        provider_version=presence.version,
+        prompt=review.full_prompt,
+        scope_hash=review.scope_hash,
+        permissions=ctx.effective_permissions,
+        settings={
+            "review_mode": review.review_mode,
+            "allow_paths": review.allow_paths,
+            "enforcement_mode": policy.enforcement_mode,
+            "enforce_findings_contract": policy.enforce_findings_contract,
+            "require_non_empty_findings": policy.require_non_empty_findings,
+            "include_token_usage": review.request.include_token_usage,
+        },
+    )
+
+
+def _cached_outcome(ctx: _ProviderContext, key: str) -> Optional[_ProviderExecutionOutcome]:
+    review = ctx.review
+    cache = review.result_cache
+    cached = cache.get(key) if cache is not None else None
+    if cached is None:
+        return None
+    try:
+        findings = [replace(item, task_id=review.task_id) for item in _deserialize_findings(cached["findings"])]
+        provider_result = dict(cached["provider_result"])  # type: ignore[arg-type]
+        outcome = _ProviderExecutionOutcome(
+            provider=ctx.provider,
+            success=bool(cached["success"]),
+            parse_ok=bool(cached["parse_ok"]),
+            schema_valid_count=int(cached["schema_valid_count"]),  # type: ignore[arg-type]
+            dropped_count=int(cached["dropped_count"]),  # type: ignore[arg-type]
+            findings=findings,
+            provider_result=provider_result,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    # The stored run's artifacts belong to another task; only the result is reused.
+    provider_result["output_path"] = None
+    provider_result["cache"] = {"hit": True, "key": key}
+    _ensure_artifacts_if_persisting(review, ctx.provider)
+    return outcome
+
+
+def _store_outcome(ctx: _ProviderContext, key: str, outcome: _ProviderExecutionOutcome) -> None:
+    cache = ctx.review.result_cache
+    # Only clean, first-hand successes are reusable; a hedged result came from another provider.
+    if cache is None or not outcome.success or "hedge" in outcome.provider_result:
+        return
+    try:
+        cache.put(
+            key,
+            {
+                "success": outcome.success,
+                "parse_ok": outcome.parse_ok,
+                "schema_valid_count": outcome.schema_valid_count,
+                "dropped_count": outcome.dropped_count,
+                "findings": [asdict(item) for item in outcome.findings],
+                "provider_result": outcome.provider_result,
+            },
+        )
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _unchanged_scope_outcome(review: _ReviewContext, provider: str) -> Optional[_ProviderExecutionOutcome]:
+    if review.incremental is None or not review.incremental.unchanged:
+        return None
+    _ensure_artifacts_if_persisting(review, provider)
+    return _ProviderExecutionOutcome(
+        provider=provider,
+        success=True,
+        parse_ok=True,
+        schema_valid_count=0,
+        dropped_count=0,
+        findings=[],
+        provider_result={"success": True, "reason": "no_changes", "findings_count": 0},
+    )
+
+
+def _early_exit_outcome(review: _ReviewContext, provider: str) -> Optional[_ProviderExecutionOutcome]:
+    reason = _early_exit_reason(review)
+    if not reason:
+        return None
+    # Same shape as a provider cancelled mid-run, so consumers need not care which side of the start it was on.
+    return _failed_outcome(
+        review,
+        provider,
+        {"success": False, "reason": "cancelled", "attempts": 0, "final_error": "cancelled", "cancel_reason": reason},
+    )
+
+
+def _optimistic_presence_check(review: _ReviewContext, adapter: ProviderAdapter) -> Optional[_PresenceCheck]:
+    """
+    Background detection when the provider may start before it has been validated, otherwise None and the
+    caller detects up front. A cached presence or a missing binary is answered immediately, and the result
+    cache needs the detected version before it can look anything up.
+    """
+    if not review.request.policy.optimistic_detect or review.result_cache is not None:
+        return None
+    if cached_presence(adapter, review.detection_cache) is not None:
+        return None
+    resolve_binary = getattr(adapter, "resolve_binary", None)
+    if resolve_binary is not None and not resolve_binary():
+        return None
+    return _PresenceCheck(adapter, review.detection_cache)
+
+
+def _circuit_open_outcome(review: _ReviewContext, provider: str) -> Optional[_ProviderExecutionOutcome]:
+    if review.circuit_breaker is None:
+        return None
+    try:
+        blocked = review.circuit_breaker.allow(provider)
+    except OSError:
+        return None
+    if blocked is None:
+        return None
+    return _failed_outcome(review, provider, {"success": False, "reason": "circuit_open", "circuit": blocked})
+
+
+def _circuit_verdict(provider: str, provider_result: Mapping[str, object]) -> Optional[bool]:
+    """
+    True when the provider itself ran and succeeded, False for a failure that trips the breaker (auth, timeout),
+    None when the outcome says nothing about the provider: cancellations, cache hits, skips or a hedge backup's win.
+    """
+    if provider_result.get("reason") == "provider_unavailable":
+        return False if provider_result.get("detected") and not provider_result.get("auth_ok") else None
+    if "cache" in provider_result or provider_result.get("reason") in ("no_changes", "cancelled"):
+        return None
+    if provider_result.get("success"):
+        hedge = provider_result.get("hedge")
+        return None if isinstance(hedge, dict) and hedge.get("winner") not in (None, provider) else True
+    return False if provider_result.get("final_error") in _CIRCUIT_TRIPPING_ERRORS else None
+
+
+def _record_circuit(review: _ReviewContext, outcome: _ProviderExecutionOutcome) -> None:
+    result = outcome.provider_result
+    if review.circuit_breaker is None or result.get("reason") == "circuit_open":
+        return
+    if result.get("reason") == "provider_unavailable":
+        error = ErrorKind.NON_RETRYABLE_AUTH.value
+    else:
+        error = str(result.get("final_error") or "")
+    try:
+        review.circuit_breaker.record(outcome.provider, _circuit_verdict(outcome.provider, result), error)
+    except OSError:
+        pass
+
+
+def _forget_stale_presence(review: _ReviewContext, outcome: _ProviderExecutionOutcome) -> None:
+    """Drop the provider's cached detection after a failure that shows it is no longer ready, so the next run probes."""
+    if review.detection_cache is None or not outcome.presence_stale:
+        return
+    try:
+        review.detection_cache.invalidate(outcome.provider)
+    except OSError:
+        pass
+
+
+def _with_phase_timings(outcome: _ProviderExecutionOutcome, phases: PhaseRecorder) -> _ProviderExecutionOutcome:
+    if phases:
+        outcome.provider_result["phase_timings_ms"] = phases.as_dict()
+    return outcome
+
+
+def _traced_outcome(span: Span, outcome: _ProviderExecutionOutcome) -> _ProviderExecutionOutcome:
+    provider_result = outcome.provider_result
+    span.set(
+        success=outcome.success,
+        attempts=provider_result.get("attempts"),  # type: ignore[arg-type]
+        final_error=provider_result.get("final_error"),  # type: ignore[arg-type]
+        reason=provider_result.get("reason"),  # type: ignore[arg-type]
+        findings_count=len(outcome.findings),
+    )
+    if not outcome.success:
+        span.fail(str(provider_result.get("final_error") or provider_result.get("reason") or "failed"))
+    return outcome
+
+
+def _run_provider(review: _ReviewContext, provider: str) -> _ProviderExecutionOutcome:
+    phases = PhaseRecorder()
+    with review.tracer.span("mco.provider", review.trace_span, provider=provider) as span:
+        outcome = _with_phase_timings(_execute_provider(review, provider, phases, span), phases)
+        _record_circuit(review, outcome)
+        _forget_stale_presence(review, outcome)
+        return _traced_outcome(span, outcome)
+
+
+def _execute_provider(
+    review: _ReviewContext,
+    provider: str,
+    phases: PhaseRecorder,
+    span: Span,
+) -> _ProviderExecutionOutcome:
+    adapter = review.adapter_map.get(provider)
+    if adapter is None:
+        return _failed_outcome(review, provider, {"success": False, "reason": "adapter_not_implemented"})
+    skipped = _early_exit_outcome(review, provider) or _unchanged_scope_outcome(review, provider)
+    if skipped is not None:
+        return skipped
+    blocked = _circuit_open_outcome(review, provider)
+    if blocked is not None:
+        return blocked
+
+    with phases.span("detect"):
+        presence_check = _optimistic_presence_check(review, adapter)
+        presence: Optional[ProviderPresence] = None
+        if presence_check is None:
+            presence = detect_with_cache(adapter, review.detection_cache)
+    if presence is not None:
+        unavailable = _unavailable_outcome(review, provider, presence)
+        if unavailable is not None:
+            return unavailable
+
+    prepared = _prepare_provider(review, provider, adapter, asynchronous=False, phases=phases, trace_span=span)
+    if isinstance(prepared, _ProviderExecutionOutcome):
+        return prepared
+    if presence_check is not None:
+        prepared = replace(prepared, presence_check=presence_check)
+    cache_key = _result_cache_key(prepared, presence) if review.result_cache is not None and presence else ""
+    if cache_key:
+        with phases.span("result_cache"):
+            cached = _cached_outcome(prepared, cache_key)
+        if cached is not None:
+            return cached
+    hedge_plan = _hedge_plan(review, provider)
+    if hedge_plan is not None:
+        backup, backup_adapter = hedge_plan
+        with phases.span("detect"):
+            backup_presence = detect_with_cache(backup_adapter, review.detection_cache)
+        prepared = _attach_hedge(prepared, backup, backup_adapter, backup_presence, asynchronous=False)
+    run_result = review.runtime.run_with_retry(
+        review.task_id,
+        provider,
+        lambda attempt: _run_attempt(prepared, attempt),
+        phases=phases,
+        abort=lambda: _abort_reason(prepared),
+    )
+    if presence_check is not None:
+        # The run is discarded when validation fails, even if the provider already finished.
+        with phases.span("detect"):
+            late_presence = presence_check.wait()
+        unavailable = _unavailable_outcome(review, provider, late_presence)
+        if unavailable is not None:
+            return unavailable
+    outcome = _finalize_provider(prepared, run_result)
+    if cache_key:
+        with phases.span("result_cache"):
+            _store_outcome(prepared, cache_key, outcome)
+    return outcome
+
+
+async def _run_provider_async(review: _ReviewContext, provider: str) -> _ProviderExecutionOutcome:
+    phases = PhaseRecorder()
+    with review.tracer.span("mco.provider", review.trace_span, provider=provider) as span:
+        outcome = _with_phase_timings(await _execute_provider_async(review, provider, phases, span), phases)
+        await asyncio.to_thread(_record_circuit, review, outcome)
+        await asyncio.to_thread(_forget_stale_presence, review, outcome)
+        return _traced_outcome(span, outcome)
+
+
+async def _execute_provider_async(
+    review: _ReviewContext,
+    provider: str,
+    phases: PhaseRecorder,
+    span: Span,
+) -> _ProviderExecutionOutcome:
+    adapter = review.adapter_map.get(provider)
+    if adapter is None:
+        return _failed_outcome(review, provider, {"success": False, "reason": "adapter_not_implemented"})
+    skipped = _early_exit_outcome(review, provider) or _unchanged_scope_outcome(review, provider)
+    if skipped is not None:
+        return skipped
+    blocked = await asyncio.to_thread(_circuit_open_outcome, review, provider)
+    if blocked is not None:
+        return blocked
+
+    with phases.span("detect"):
+        presence_check = await asyncio.to_thread(_optimistic_presence_check, review, adapter)
+        presence: Optional[ProviderPresence] = None
+        if presence_check is None:
+            # Detection shells out to version/auth probes; keep it off the loop.
+            presence = await asyncio.to_thread(detect_with_cache, adapter, review.detection_cache)
+    if presence is not None:
+        unavailable = _unavailable_outcome(review, provider, presence)
+        if unavailable is not None:
+            return unavailable
+
+    prepared = _prepare_provider(review, provider, adapter, asynchronous=True, phases=phases, trace_span=span)
+    if isinstance(prepared, _ProviderExecutionOutcome):
+        return prepared
+    if presence_check is not None:
+        prepared = replace(prepared, presence_check=presence_check)
+    cache_key = _result_cache_key(prepared, presence) if review.result_cache is not None and presence else ""
+    if cache_key:
+        with phases.span("result_cache"):
+            # Cache reads and the eviction scan touch the filesystem.
+            cached = await asyncio.to_thread(_cached_outcome, prepared, cache_key)
+        if cached is not None:
+            return cached
+    hedge_plan = _hedge_plan(review, provider)
+    if hedge_plan is not None:
+        backup, backup_adapter = hedge_plan
+        with phases.span("detect"):
+            backup_presence = await asyncio.to_thread(detect_with_cache, backup_adapter, review.detection_cache)
+        prepared = _attach_hedge(prepared, backup, backup_adapter, backup_presence, asynchronous=True)
+
+    async def runner(attempt: int) -> AttemptResult:
+        return await _run_attempt_async(prepared, attempt)
+
+    run_result = await review.runtime.run_with_retry_async(
+        review.task_id, provider, runner, phases=phases, abort=lambda: _abort_reason(prepared)
+    )
+    if presence_check is not None:
+        with phases.span("detect"):
+            late_presence = await asyncio.to_thread(presence_check.wait)
+        unavailable = _unavailable_outcome(review, provider, late_presence)
+        if unavailable is not None:
+            return unavailable
+    outcome = _finalize_provider(prepared, run_result)
+    if cache_key:
+        with phases.span("result_cache"):
+            await asyncio.to_thread(_store_outcome, prepared, cache_key, outcome)
+    return outcome
+
+
+def _internal_error_outcome(review: _ReviewContext, provider: str, exc: BaseException) -> _ProviderExecutionOutcome:
+    return _failed_outcome(review, provider, {"success": False, "reason": "internal_error", "error": str(exc)})
+
+
+def _early_exit_trigger(review: _ReviewContext, early_exit: _EarlyExit, outcome: _ProviderExecutionOutcome) -> str:
+    """Name the rule that settles the outcome given this provider result, or an empty string."""
+    policy = review.request.policy
+    if review.review_mode and policy.fail_fast and any(item.severity == "critical" for item in outcome.findings):
+        # A critical finding makes the decision FAIL whatever the other providers report.
+        return "fail_fast"
+    if policy.quorum > 0 and outcome.success and early_exit.record_success() >= policy.quorum:
+        return "quorum"
+    return ""
+
+
+def _record_outcome(review: _ReviewContext, outcome: _ProviderExecutionOutcome) -> _ProviderExecutionOutcome:
+    if review.events is not None:
+        review.events.provider_finished(outcome)
+    if review.early_exit is not None:
+        reason = _early_exit_trigger(review, review.early_exit, outcome)
+        if reason and review.early_exit.trigger(reason, outcome.provider) and review.events is not None:
+            review.events.emit("early_exit", reason=reason, trigger_provider=outcome.provider)
+    return outcome
+
+
+def _early_exit_cancelled(review: _ReviewContext, provider_results: Mapping[str, Dict[str, object]]) -> List[str]:
+    reason = _early_exit_reason(review)
+    if not reason:
+        return []
+    return [
+        provider
+        for provider in review.provider_order
+        if provider_results.get(provider, {}).get("cancel_reason") == reason
+    ]
+
+
+def _early_exit_summary(
+    review: _ReviewContext,
+    provider_results: Mapping[str, Dict[str, object]],
+) -> Optional[Dict[str, object]]:
+    early_exit = review.early_exit
+    if early_exit is None or not early_exit.reason:
+        return None
+    return {
+        "reason": early_exit.reason,
+        "trigger_provider": early_exit.trigger_provider,
+        "cancelled_providers": _early_exit_cancelled(review, provider_results),
+    }
+
+
+def _prepare_review(
     request: ReviewRequest,
-    adapters: Optional[Mapping[str, ProviderAdapter]] = None,
-    review_mode: bool = True,
-    write_artifacts: bool = True,
-) -> ReviewResult:
-    temp_artifact_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    adapters: Optional[Mapping[str, ProviderAdapter]],
+    review_mode: bool,
+    write_artifacts: bool,
+    runtime_artifact_base: str,
+    on_event: Optional[ReviewEventCallback] = None,
+) -> _ReviewContext:
     adapter_map = dict(adapters or _adapter_registry())
-    task_id = request.task_id or _default_task_id(request.repo_root, request.prompt)
+    resolved_task_id = request.task_id or _default_task_id(request.repo_root, request.prompt)
     runtime = OrchestratorRuntime(
-        retry_policy=RetryPolicy(max_retries=request.policy.max_retries, base_delay_seconds=1.0, backoff_multiplier=2.0),
+        retry_policy=RetryPolicy(
+            max_retries=request.policy.max_retries,
+            base_delay_seconds=1.0,
+            backoff_multiplier=2.0,
+            max_delay_seconds=_MAX_RETRY_DELAY_SECONDS,
+            jitter=True,
+        ),
     )
-    resolved_task_id = task_id
     artifact_root = str(task_artifact_root(request.artifact_base, resolved_task_id)) if write_artifacts else None
-    runtime_artifact_base = request.artifact_base
-    if not write_artifacts:
-        temp_artifact_dir = tempfile.TemporaryDirectory(prefix="mco-stdout-")
-        runtime_artifact_base = temp_artifact_dir.name
-    root_path = Path(artifact_root) if artifact_root else None
-    if write_artifacts and root_path:
-        root_path.mkdir(parents=True, exist_ok=True)
+    if write_artifacts and artifact_root:
+        Path(artifact_root).mkdir(parents=True, exist_ok=True)
 
-    try:
-        normalized_targets, normalized_allow_paths = _normalize_scopes(
+    normalized_targets, normalized_allow_paths = _normalize_scopes(
+        request.repo_root,
+        request.target_paths or ["."],
+        request.policy.allow_paths or ["."],
+    )
+    provider_order: List[str] = []
+    provider_seen = set()
+    for provider in request.providers:
+        if provider in provider_seen:
+            continue
+        provider_seen.add(provider)
+        provider_order.append(provider)
+    incremental: Optional[IncrementalPlan] = None
+    if review_mode and request.policy.incremental:
+        incremental = plan_incremental(
+            incremental_index_path(
+                request.artifact_base, request.repo_root, request.prompt, provider_order, normalized_targets
+            ),
             request.repo_root,
-            request.target_paths or ["."],
-            request.policy.allow_paths or ["."],
+            normalized_targets,
+            exclude=[request.artifact_base],
         )
-        full_prompt = (
-            _build_prompt(request.prompt, normalized_targets)
-            if review_mode
-            else _build_run_prompt(request.prompt, normalized_targets, normalized_allow_paths)
+        if incremental.has_baseline and incremental.changed_files:
+            # Only files changed since the baseline are reviewed; findings elsewhere carry over.
+            normalized_targets = list(incremental.changed_files)
+    full_prompt = (
+        _build_prompt(request.prompt, normalized_targets)
+        if review_mode
+        else _build_run_prompt(request.prompt, normalized_targets, normalized_allow_paths)
+    )
+    if request.policy.warm_pool_idle_seconds > 0:
+        # Stop servers left idle by earlier runs before this one attaches to (or starts) its own.
+        WarmServerPool(_warm_pool_dir(request), request.policy.warm_pool_idle_seconds).reap()
+    detection_cache: Optional[DetectionCache] = None
+    if request.policy.detection_cache_ttl_seconds > 0:
+        detection_cache = DetectionCache(
+            state_dir(request.artifact_base) / "detection", request.policy.detection_cache_ttl_seconds
         )
-        provider_order: List[str] = []
-        provider_seen = set()
-        for provider in request.providers:
-            if provider in provider_seen:
-                continue
-            provider_seen.add(provider)
-            provider_order.append(provider)
-        provider_order = sorted(provider_order)
+    provider_slots: Optional[ProviderSlots] = None
+    if any(count > 0 for count in request.policy.provider_slots.values()):
+        provider_slots = ProviderSlots(state_dir(request.artifact_base) / "locks", request.policy.provider_slots)
+    result_cache: Optional[ResultCache] = None
+    scope_hash = ""
+    if request.policy.result_cache_ttl_seconds > 0:
+        result_cache = ResultCache(state_dir(request.artifact_base) / "results", request.policy.result_cache_ttl_seconds)
+        file_hashes = scope_file_hashes(request.repo_root, normalized_targets, exclude=[request.artifact_base])
+        scope_hash = scope_content_hash(file_hashes)
+    hedged_providers = [provider for provider in provider_order if provider in request.policy.hedge_providers]
+    hedge_after_seconds = (
+        provider_latency_percentiles(request.artifact_base, hedged_providers, _HEDGE_LATENCY_PERCENTILE)
+        if hedged_providers
+        else {}
+    )
+    adaptive_timeouts = (
+        _adaptive_timeouts(request.policy, request.artifact_base, provider_order, review_mode)
+        if request.policy.adaptive_timeouts
+        else {}
+    )
+    circuit_breaker = (
+        CircuitBreaker(
+            state_dir(request.artifact_base) / BREAKERS_FILE_NAME,
+            request.policy.circuit_breaker_threshold,
+            request.policy.circuit_breaker_cooldown_seconds,
+        )
+        if request.policy.circuit_breaker_threshold > 0
+        else None
+    )
 
-        if request.policy.max_provider_parallelism <= 0:
-            max_workers = max(1, len(provider_order))
-        else:
-            max_workers = max(1, min(len(provider_order), request.policy.max_provider_parallelism))
-        outcomes: Dict[str, _ProviderExecutionOutcome] = {}
-        if max_workers <= 1:
-            for provider in provider_order:
-                outcomes[provider] = _run_provider(
-                    request,
-                    runtime,
-                    adapter_map,
-                    resolved_task_id,
-                    runtime_artifact_base,
-                    write_artifacts,
-                    full_prompt,
-                    normalized_targets,
-                    normalized_allow_paths,
-                    review_mode,
-                    provider,
-                )
-        else:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(
-                        _run_provider,
-                        request,
-                        runtime,
-                        adapter_map,
-                        resolved_task_id,
-                        runtime_artifact_base,
-                        write_artifacts,
-                        full_prompt,
-                        normalized_targets,
-                        normalized_allow_paths,
-                        review_mode,
-                        provider,
-                    ): provider
-                    for provider in provider_order
-                }
-                for future in as_completed(futures):
-                    provider = futures[future]
-                    try:
-                        outcomes[provider] = future.result()
-                    except Exception as exc:  # pragma: no cover - protective guard
-                        if write_artifacts:
-                            _ensure_provider_artifacts(runtime_artifact_base, resolved_task_id, provider)
-                        outcomes[provider] = _ProviderExecutionOutcome(
-                            provider=provider,
-                            success=False,
-                            parse_ok=False,
-                            schema_valid_count=0,
-                            dropped_count=0,
-                            findings=[],
-                            provider_result={"success": False, "reason": "internal_error", "error": str(exc)},
-                        )
-
-        provider_results: Dict[str, Dict[str, object]] = {}
-        required_provider_success: Dict[str, bool] = {}
-        aggregated_findings: List[NormalizedFinding] = []
-        parse_success_count = 0
-        parse_failure_count = 0
-        schema_valid_count = 0
-        dropped_findings_count = 0
-
-        for provider in provider_order:
-            outcome = outcomes[provider]
-            provider_results[provider] = outcome.provider_result
-            required_provider_success[provider] = outcome.success
-            aggregated_findings.extend(outcome.findings)
-            if review_mode:
-                if outcome.parse_ok:
-                    parse_success_count += 1
-                else:
-                    parse_failure_count += 1
-                schema_valid_count += outcome.schema_valid_count
-                dropped_findings_count += outcome.dropped_count
-
-        token_usage_summary = _aggregate_token_usage_summary(provider_results) if request.include_token_usage else None
-
-        terminal_state = runtime.evaluate_terminal_state(required_provider_success)
-        aggregated_findings.sort(key=lambda item: (item.provider, item.finding_id, item.fingerprint))
-        merged_findings = _merge_findings_across_providers(aggregated_findings)
-
-        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        for finding in merged_findings:
-            severity = str(finding.get("severity", "")).lower()
-            if severity in counts:
-                counts[severity] = counts.get(severity, 0) + 1
-
-        if review_mode and counts.get("critical", 0) > 0:
-            decision = "FAIL"
-        elif review_mode and counts.get("high", 0) >= request.policy.high_escalation_threshold:
-            decision = "ESCALATE"
-        elif review_mode and request.policy.enforce_findings_contract and len(merged_findings) == 0:
-            decision = "INCONCLUSIVE"
-        elif review_mode and terminal_state == TaskState.FAILED:
-            decision = "FAIL"
-        elif review_mode and terminal_state == TaskState.PARTIAL_SUCCESS:
-            decision = "PARTIAL"
-        elif not review_mode and terminal_state == TaskState.FAILED:
-            decision = "FAIL"
-        elif not review_mode and terminal_state == TaskState.PARTIAL_SUCCESS:
-            decision = "PARTIAL"
-        else:
-            decision = "PASS"
-
-        findings_json = merged_findings
-        synthesis: Optional[Dict[str, object]] = None
-        if request.synthesize:
-            selected_synthesis_provider = _resolve_synthesis_provider(provider_order, request.synthesis_provider)
-            if selected_synthesis_provider is None:
-                synthesis = {
-                    "provider": request.synthesis_provider,
-                    "success": False,
-                    "reason": (
-                        "requested_provider_not_selected"
-                        if request.synthesis_provider
-                        else "no_provider_available"
-                    ),
-                    "text": "",
-                }
+    return _ReviewContext(
+        request=request,
+        adapter_map=adapter_map,
+        runtime=runtime,
+        task_id=resolved_task_id,
+        artifact_root=artifact_root,
+        runtime_artifact_base=runtime_artifact_base,
+        write_artifacts=write_artifacts,
+        full_prompt=full_prompt,
+        target_paths=normalized_targets,
+        allow_paths=normalized_allow_paths,
+        review_mode=review_mode,
+        provider_order=sorted(provider_order),
+        events=_ReviewEvents(resolved_task_id, on_event) if on_event is not None else None,
+        early_exit=(
+            _EarlyExit() if (review_mode and request.policy.fail_fast) or request.policy.quorum > 0 else None
+        ),
+        hedge_after_seconds=hedge_after_seconds,
+        result_cache=result_cache,
+        scope_hash=scope_hash,
+        incremental=incremental,
+        detection_cache=detection_cache,
+        provider_slots=provider_slots,
+        adaptive_timeouts=adaptive_timeouts,
+        circuit_breaker=circuit_breaker,
+    )
+
+
+def _max_provider_workers(review: _ReviewContext) -> int:
+    parallelism = review.request.policy.max_provider_parallelism
+    if parallelism <= 0:
+        return max(1, len(review.provider_order))
+    return max(1, min(len(review.provider_order), parallelism))
+
+
+def _carried_findings(
+    review: _ReviewContext,
+    fresh_findings: List[NormalizedFinding],
+) -> Dict[str, Tuple[NormalizedFinding, Dict[str, object]]]:
+    """Findings in untouched files from the incremental baseline that no provider reported again, by dedupe key."""
+    if review.incremental is None:
+        return {}
+    fresh_keys = {_finding_dedupe_key(item) for item in fresh_findings}
+    carried: Dict[str, Tuple[NormalizedFinding, Dict[str, object]]] = {}
+    for stored in review.incremental.carried_findings:
+        restored = _deserialize_findings([stored])
+        if not restored:
+            continue
+        finding = replace(restored[0], task_id=review.task_id)
+        key = _finding_dedupe_key(finding)
+        if key not in fresh_keys:
+            carried[key] = (finding, stored)
+    return carried
+
+
+def _mark_carried_findings(
+    merged_findings: List[Dict[str, object]],
+    carried: Mapping[str, Tuple[NormalizedFinding, Dict[str, object]]],
+) -> None:
+    if not carried:
+        return
+    for payload in merged_findings:
+        restored = _deserialize_findings([payload])
+        if not restored:
+            continue
+        entry = carried.get(_finding_dedupe_key(restored[0]))
+        if entry is None:
+            continue
+        stored_detected_by = entry[1].get("detected_by")
+        if isinstance(stored_detected_by, list) and stored_detected_by:
+            payload["detected_by"] = sorted({str(item) for item in stored_detected_by if str(item)})
+        payload["carried_over"] = True
+
+
+def _aggregate_outcomes(review: _ReviewContext, outcomes: Mapping[str, _ProviderExecutionOutcome]) -> _ReviewAggregate:
+    request = review.request
+    review_mode = review.review_mode
+    provider_results: Dict[str, Dict[str, object]] = {}
+    required_provider_success: Dict[str, bool] = {}
+    aggregated_findings: List[NormalizedFinding] = []
+    parse_success_count = 0
+    parse_failure_count = 0
+    schema_valid_count = 0
+    dropped_findings_count = 0
+    quorum_cancelled: List[str] = []
+
+    for provider in review.provider_order:
+        outcome = outcomes[provider]
+        provider_results[provider] = outcome.provider_result
+        required_provider_success[provider] = outcome.success
+        aggregated_findings.extend(outcome.findings)
+        if _early_exit_reason(review) == "quorum" and outcome.provider_result.get("cancel_reason") == "quorum":
+            # Not needed once the quorum was met: neither a failure nor a parse result.
+            quorum_cancelled.append(provider)
+            continue
+        if review_mode:
+            if outcome.parse_ok:
+                parse_success_count += 1
             else:
-                synthesis_prompt = _build_synthesis_prompt(
-                    review_mode,
-                    decision,
-                    terminal_state.value,
-                    provider_results,
-                    merged_findings,
-                )
-                with tempfile.TemporaryDirectory(prefix="mco-synthesis-") as synthesis_artifact_base:
-                    synthesis_request = ReviewRequest(
-                        repo_root=request.repo_root,
-                        prompt=synthesis_prompt,
-                        providers=[selected_synthesis_provider],  # type: ignore[list-item]
-                        artifact_base=synthesis_artifact_base,
-                        policy=request.policy,
-                        task_id=request.task_id,
-                        target_paths=request.target_paths,
-                        include_token_usage=request.include_token_usage,
-                        synthesize=False,
-                        synthesis_provider=None,
-                    )
-                    synthesis_outcome = _run_provider(
-                        synthesis_request,
-                        runtime,
-                        adapter_map,
-                        resolved_task_id,
-                        synthesis_artifact_base,
-                        False,
-                        synthesis_prompt,
-                        normalized_targets,
-                        normalized_allow_paths,
-                        False,
-                        selected_synthesis_provider,
-                    )
-                synthesis_provider_result = synthesis_outcome.provider_result
-                synthesis_text = str(synthesis_provider_result.get("final_text", "")) or str(
-                    synthesis_provider_result.get("output_text", "")
-                )
-                synthesis_success = bool(synthesis_provider_result.get("success")) and bool(synthesis_text.strip())
-                failure_reason = synthesis_provider_result.get("final_error")
-                if failure_reason is None:
-                    failure_reason = synthesis_provider_result.get("response_reason")
-                if failure_reason is None:
-                    failure_reason = synthesis_provider_result.get("reason")
-                synthesis_reason = "ok" if synthesis_success else (
-                    str(failure_reason) if failure_reason not in (None, "") else "synthesis_failed"
-                )
-                synthesis = {
-                    "provider": selected_synthesis_provider,
-                    "success": synthesis_success,
-                    "reason": synthesis_reason,
-                    "text": synthesis_text,
-                    "attempts": synthesis_provider_result.get("attempts"),
-                    "final_error": synthesis_provider_result.get("final_error"),
-                    "wall_clock_seconds": synthesis_provider_result.get("wall_clock_seconds"),
-                    "response_ok": synthesis_provider_result.get("response_ok"),
-                    "response_reason": synthesis_provider_result.get("response_reason"),
-                }
-                if request.include_token_usage:
-                    synthesis["token_usage"] = synthesis_provider_result.get("token_usage")
-                    synthesis["token_usage_completeness"] = synthesis_provider_result.get(
-                        "token_usage_completeness",
-                    )
-
-        if review_mode and write_artifacts and root_path:
-            _write_json(root_path / "findings.json", findings_json)
-
-        summary = [
-            f"# {'Review' if review_mode else 'Run'} Summary ({resolved_task_id})",
-            "",
-            f"- Decision: {decision}",
-            f"- Terminal state: {terminal_state.value}",
-            f"- Providers: {', '.join(provider_order)}",
-            f"- Findings total: {len(merged_findings)}",
-            f"- Parse success count: {parse_success_count}",
-            f"- Parse failure count: {parse_failure_count}",
-            f"- Schema valid finding count: {schema_valid_count}",
-            f"- Dropped finding count: {dropped_findings_count}",
-            f"- Allow paths: {', '.join(normalized_allow_paths)}",
-            f"- Enforcement mode: {request.policy.enforcement_mode}",
-            f"- Strict contract: {request.policy.enforce_findings_contract}",
-            "",
-            "## Severity Counts",
-            f"- critical: {counts['critical']}",
-            f"- high: {counts['high']}",
-            f"- medium: {counts['medium']}",
-            f"- low: {counts['low']}",
-            "",
-            "## Provider Results",
-        ]
-        for provider in provider_order:
-            details = provider_results.get(provider, {})
-            success = bool(details.get("success"))
-            parse_reason = str(details.get("parse_reason", ""))
-            cancel_reason = str(details.get("cancel_reason", ""))
-            summary.append(
-                f"- {provider}: success={success}, final_error={details.get('final_error')}, parse_reason={parse_reason or '-'}, cancel_reason={cancel_reason or '-'}"
+                parse_failure_count += 1
+            schema_valid_count += outcome.schema_valid_count
+            dropped_findings_count += outcome.dropped_count
+
+    token_usage_summary = _aggregate_token_usage_summary(provider_results) if request.include_token_usage else None
+
+    terminal_state = review.runtime.evaluate_terminal_state(required_provider_success, quorum_cancelled)
+    carried = _carried_findings(review, aggregated_findings)
+    aggregated_findings.extend(finding for finding, _ in carried.values())
+    aggregated_findings.sort(key=lambda item: (item.provider, item.finding_id, item.fingerprint))
+    merged_findings = _merge_findings_across_providers(aggregated_findings)
+    _mark_carried_findings(merged_findings, carried)
+
+    counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    for finding in merged_findings:
+        severity = str(finding.get("severity", "")).lower()
+        if severity in counts:
+            counts[severity] = counts.get(severity, 0) + 1
+
+    if review_mode and counts.get("critical", 0) > 0:
+        decision = "FAIL"
+    elif review_mode and counts.get("high", 0) >= request.policy.high_escalation_threshold:
+        decision = "ESCALATE"
+    elif review_mode and request.policy.enforce_findings_contract and len(merged_findings) == 0:
+        decision = "INCONCLUSIVE"
+    elif review_mode and terminal_state == TaskState.FAILED:
+        decision = "FAIL"
+    elif review_mode and terminal_state == TaskState.PARTIAL_SUCCESS:
+        decision = "PARTIAL"
+    elif not review_mode and terminal_state == TaskState.FAILED:
+        decision = "FAIL"
+    elif not review_mode and terminal_state == TaskState.PARTIAL_SUCCESS:
+        decision = "PARTIAL"
+    else:
+        decision = "PASS"
+
+    return _ReviewAggregate(
+        provider_results=provider_results,
+        required_provider_success=required_provider_success,
+        merged_findings=merged_findings,
+        parse_success_count=parse_success_count,
+        parse_failure_count=parse_failure_count,
+        schema_valid_count=schema_valid_count,
+        dropped_findings_count=dropped_findings_count,
+        token_usage_summary=token_usage_summary,
+        terminal_state=terminal_state,
+        severity_counts=counts,
+        decision=decision,
+    )
+
+
+def _synthesis_skipped(request: ReviewRequest) -> Dict[str, object]:
+    return {
+        "provider": request.synthesis_provider,
+        "success": False,
+        "reason": "requested_provider_not_selected" if request.synthesis_provider else "no_provider_available",
+        "text": "",
+    }
+
+
+def _synthesis_review(
+    review: _ReviewContext,
+    aggregate: _ReviewAggregate,
+    synthesis_provider: str,
+    synthesis_artifact_base: str,
+) -> _ReviewContext:
+    request = review.request
+    synthesis_prompt = _build_synthesis_prompt(
+        review.review_mode,
+        aggregate.decision,
+        aggregate.terminal_state.value,
+        aggregate.provider_results,
+        aggregate.merged_findings,
+    )
+    synthesis_request = ReviewRequest(
+        repo_root=request.repo_root,
+        prompt=synthesis_prompt,
+        providers=[synthesis_provider],  # type: ignore[list-item]
+        artifact_base=synthesis_artifact_base,
+        policy=request.policy,
+        task_id=request.task_id,
+        target_paths=request.target_paths,
+        include_token_usage=request.include_token_usage,
+        synthesize=False,
+        synthesis_provider=None,
+    )
+    return replace(
+        review,
+        request=synthesis_request,
+        artifact_root=None,
+        runtime_artifact_base=synthesis_artifact_base,
+        write_artifacts=False,
+        full_prompt=synthesis_prompt,
+        review_mode=False,
+        provider_order=[synthesis_provider],
+        events=None,
+        early_exit=None,
+        hedge_after_seconds={},
+        adaptive_timeouts={},
+        result_cache=None,
+        incremental=None,
+    )
+
+
+def _synthesis_result(
+    request: ReviewRequest,
+    synthesis_provider: str,
+    synthesis_outcome: _ProviderExecutionOutcome,
+) -> Dict[str, object]:
+    synthesis_provider_result = synthesis_outcome.provider_result
+    synthesis_text = str(synthesis_provider_result.get("final_text", "")) or str(
+        synthesis_provider_result.get("output_text", "")
+    )
+    synthesis_success = bool(synthesis_provider_result.get("success")) and bool(synthesis_text.strip())
+    failure_reason = synthesis_provider_result.get("final_error")
+    if failure_reason is None:
+        failure_reason = synthesis_provider_result.get("response_reason")
+    if failure_reason is None:
+        failure_reason = synthesis_provider_result.get("reason")
+    synthesis_reason = "ok" if synthesis_success else (
+        str(failure_reason) if failure_reason not in (None, "") else "synthesis_failed"
+    )
+    synthesis: Dict[str, object] = {
+        "provider": synthesis_provider,
+        "success": synthesis_success,
+        "reason": synthesis_reason,
+        "text": synthesis_text,
+        "attempts": synthesis_provider_result.get("attempts"),
+        "final_error": synthesis_provider_result.get("final_error"),
+        "wall_clock_seconds": synthesis_provider_result.get("wall_clock_seconds"),
+        "response_ok": synthesis_provider_result.get("response_ok"),
+        "response_reason": synthesis_provider_result.get("response_reason"),
+    }
+    if "phase_timings_ms" in synthesis_provider_result:
+        synthesis["phase_timings_ms"] = synthesis_provider_result["phase_timings_ms"]
+    if request.include_token_usage:
+        synthesis["token_usage"] = synthesis_provider_result.get("token_usage")
+        synthesis["token_usage_completeness"] = synthesis_provider_result.get(
+            "token_usage_completeness",
+        )
+    return synthesis
+
+
+def _run_synthesis(review: _ReviewContext, aggregate: _ReviewAggregate) -> Optional[Dict[str, object]]:
+    request = review.request
+    if not request.synthesize:
+        return None
+    synthesis_provider = _resolve_synthesis_provider(review.provider_order, request.synthesis_provider)
+    if synthesis_provider is None:
+        return _synthesis_skipped(request)
+    with tempfile.TemporaryDirectory(prefix="mco-synthesis-") as synthesis_artifact_base:
+        synthesis_review = _synthesis_review(review, aggregate, synthesis_provider, synthesis_artifact_base)
+        synthesis_outcome = _run_provider(synthesis_review, synthesis_provider)
+    return _synthesis_result(request, synthesis_provider, synthesis_outcome)
+
+
+async def _run_synthesis_async(review: _ReviewContext, aggregate: _ReviewAggregate) -> Optional[Dict[str, object]]:
+    request = review.request
+    if not request.synthesize:
+        return None
+    synthesis_provider = _resolve_synthesis_provider(review.provider_order, request.synthesis_provider)
+    if synthesis_provider is None:
+        return _synthesis_skipped(request)
+    with tempfile.TemporaryDirectory(prefix="mco-synthesis-") as synthesis_artifact_base:
+        synthesis_review = _synthesis_review(review, aggregate, synthesis_provider, synthesis_artifact_base)
+        synthesis_outcome = await _run_provider_async(synthesis_review, synthesis_provider)
+    return _synthesis_result(request, synthesis_provider, synthesis_outcome)
+
+
+def _finalize_review(
+    review: _ReviewContext,
+    aggregate: _ReviewAggregate,
+    synthesis: Optional[Dict[str, object]],
+    phases: Optional[PhaseRecorder] = None,
+) -> ReviewResult:
+    finalize_started = phases.now() if phases is not None else 0.0
+    request = review.request
+    review_mode = review.review_mode
+    resolved_task_id = review.task_id
+    root_path = review.root_path
+    write_artifacts = review.write_artifacts
+    provider_order = review.provider_order
+    provider_results = aggregate.provider_results
+    merged_findings = aggregate.merged_findings
+    counts = aggregate.severity_counts
+    decision = aggregate.decision
+    terminal_state = aggregate.terminal_state
+    early_exit = _early_exit_summary(review, provider_results)
+    incremental = review.incremental.summary() if review.incremental is not None else None
+    if review.incremental is not None and terminal_state == TaskState.COMPLETED and not aggregate.parse_failure_count:
+        # A partial or unparsed review must not become the baseline, or its missing findings would be lost.
+        try:
+            save_incremental_index(
+                review.incremental,
+                [{key: value for key, value in item.items() if key != "carried_over"} for item in merged_findings],
             )
-            output_text = str(details.get("output_text", ""))
-            if output_text:
-                summary.append("  output:")
-                for raw_line in output_text.splitlines():
-                    summary.append(f"    {raw_line}")
-        if synthesis is not None:
-            summary.append("")
-            summary.append("## Synthesis")
-            summary.append(f"- provider: {synthesis.get('provider')}")
-            summary.append(f"- success: {synthesis.get('success')}")
-            summary.append(f"- reason: {synthesis.get('reason')}")
-            text = str(synthesis.get("text", ""))
-            if text:
-                summary.append("  output:")
-                for raw_line in text.splitlines():
-                    summary.append(f"    {raw_line}")
-        if write_artifacts and root_path:
-            _write_text(root_path / "summary.md", "\n".join(summary))
-
-        decision_lines = [f"# {'Review' if review_mode else 'Run'} Decision ({resolved_task_id})", ""]
-        decision_lines.append(f"- decision: {decision}")
-        decision_lines.append(f"- terminal_state: {terminal_state.value}")
-        if review_mode:
-            decision_lines.append(
-                f"- rule_trace: critical={counts['critical']}, high={counts['high']}, findings={len(merged_findings)}"
+        except OSError:
+            pass
+
+    findings_json = merged_findings
+    if review_mode and write_artifacts and root_path:
+        _write_json(root_path / "findings.json", findings_json)
+
+    summary = [
+        f"# {'Review' if review_mode else 'Run'} Summary ({resolved_task_id})",
+        "",
+        f"- Decision: {decision}",
+        f"- Terminal state: {terminal_state.value}",
+        f"- Providers: {', '.join(provider_order)}",
+        f"- Findings total: {len(merged_findings)}",
+        f"- Parse success count: {aggregate.parse_success_count}",
+        f"- Parse failure count: {aggregate.parse_failure_count}",
+        f"- Schema valid finding count: {aggregate.schema_valid_count}",
+        f"- Dropped finding count: {aggregate.dropped_findings_count}",
+        f"- Allow paths: {', '.join(review.allow_paths)}",
+        f"- Enforcement mode: {request.policy.enforcement_mode}",
+        f"- Strict contract: {request.policy.enforce_findings_contract}",
+    ]
+    if early_exit is not None:
+        cancelled = ", ".join(early_exit["cancelled_providers"]) or "-"  # type: ignore[arg-type]
+        summary.append(
+            f"- Early exit: {early_exit['reason']} (trigger={early_exit['trigger_provider']}, cancelled={cancelled})"
+        )
+    summary += [
+        "",
+        "## Severity Counts",
+        f"- critical: {counts['critical']}",
+        f"- high: {counts['high']}",
+        f"- medium: {counts['medium']}",
+        f"- low: {counts['low']}",
+        "",
+        "## Provider Results",
+    ]
+    for provider in provider_order:
+        details = provider_results.get(provider, {})
+        success = bool(details.get("success"))
+        parse_reason = str(details.get("parse_reason", ""))
+        cancel_reason = str(details.get("cancel_reason", ""))
+        summary.append(
+            f"- {provider}: success={success}, final_error={details.get('final_error')}, parse_reason={parse_reason or '-'}, cancel_reason={cancel_reason or '-'}"
+        )
+        output_text = str(details.get("output_text", ""))
+        if output_text:
+            summary.append("  output:")
+            for raw_line in output_text.splitlines():
+                summary.append(f"    {raw_line}")
+    if synthesis is not None:
+        summary.append("")
+        summary.append("## Synthesis")
+        summary.append(f"- provider: {synthesis.get('provider')}")
+        summary.append(f"- success: {synthesis.get('success')}")
+        summary.append(f"- reason: {synthesis.get('reason')}")
+        text = str(synthesis.get("text", ""))
+        if text:
+            summary.append("  output:")
+            for raw_line in text.splitlines():
+                summary.append(f"    {raw_line}")
+    if write_artifacts and root_path:
+        _write_text(root_path / "summary.md", "\n".join(summary))
+
+    required_provider_success = aggregate.required_provider_success
+    decision_lines = [f"# {'Review' if review_mode else 'Run'} Decision ({resolved_task_id})", ""]
+    decision_lines.append(f"- decision: {decision}")
+    decision_lines.append(f"- terminal_state: {terminal_state.value}")
+    if review_mode:
+        decision_lines.append(
+            f"- rule_trace: critical={counts['critical']}, high={counts['high']}, findings={len(merged_findings)}"
+        )
+    else:
+        success_count = sum(1 for value in required_provider_success.values() if value)
+        decision_lines.append(
+            f"- run_trace: providers={len(required_provider_success)}, success={success_count}, failed={len(required_provider_success) - success_count}"
+        )
+    if write_artifacts and root_path:
+        _write_text(root_path / "decision.md", "\n".join(decision_lines))
+    phase_timings_ms: Optional[Dict[str, int]] = None
+    if phases is not None:
+        # run.json itself is written after the snapshot, so its write is not included.
+        phases.add("finalize", phases.now() - finalize_started)
+        phase_timings_ms = phases.as_dict()
+
+    run_payload = {
+        "task_id": resolved_task_id,
+        "mode": "review" if review_mode else "run",
+        "terminal_state": terminal_state.value,
+        "decision": decision,
+        "effective_cwd": str(Path(request.repo_root).resolve(strict=False)),
+        "allow_paths": review.allow_paths,
+        "allow_paths_hash": _stable_payload_hash(review.allow_paths),
+        "target_paths": review.target_paths,
+        "enforcement_mode": request.policy.enforcement_mode,
+        "enforce_findings_contract": request.policy.enforce_findings_contract,
+        "provider_permissions": request.policy.provider_permissions,
+        "permissions_hash": _stable_payload_hash(request.policy.provider_permissions),
+        "provider_results": provider_results,
+        "findings_count": len(merged_findings),
+        "parse_success_count": aggregate.parse_success_count,
+        "parse_failure_count": aggregate.parse_failure_count,
+        "schema_valid_count": aggregate.schema_valid_count,
+        "dropped_findings_count": aggregate.dropped_findings_count,
+    }
+    if aggregate.token_usage_summary is not None:
+        run_payload["token_usage_summary"] = aggregate.token_usage_summary
+    if synthesis is not None:
+        run_payload["synthesis"] = synthesis
+    if early_exit is not None:
+        run_payload["early_exit"] = early_exit
+    if incremental is not None:
+        run_payload["incremental"] = incremental
+    if phase_timings_ms is not None:
+        run_payload["phase_timings_ms"] = phase_timings_ms
+    if write_artifacts and root_path:
+        _write_json(root_path / "run.json", run_payload)
+    if request.policy.record_history:
+        try:
+            HistoryStore(state_dir(request.artifact_base) / HISTORY_FILE_NAME).record(
+                resolved_task_id, "review" if review_mode else "run", provider_results
             )
-        else:
-            success_count = sum(1 for value in required_provider_success.values() if value)
-            decision_lines.append(
-                f"- run_trace: providers={len(required_provider_success)}, success={success_count}, failed={len(required_provider_success) - success_count}"
+        except (OSError, sqlite3.Error):
+            pass
+
+    return ReviewResult(
+        task_id=resolved_task_id,
+        artifact_root=review.artifact_root,
+        decision=decision,
+        terminal_state=terminal_state.value,
+        provider_results=provider_results,
+        findings_count=len(merged_findings),
+        parse_success_count=aggregate.parse_success_count,
+        parse_failure_count=aggregate.parse_failure_count,
+        schema_valid_count=aggregate.schema_valid_count,
+        dropped_findings_count=aggregate.dropped_findings_count,
+        findings=findings_json,
+        token_usage_summary=aggregate.token_usage_summary,
+        synthesis=synthesis,
+        early_exit=early_exit,
+        incremental=incremental,
+        phase_timings_ms=phase_timings_ms,
+    )
+
+
+def _traced_review(span: Span, result: ReviewResult) -> ReviewResult:
+    span.set(
+        task_id=result.task_id,
+        decision=result.decision,
+        terminal_state=result.terminal_state,
+        findings_count=result.findings_count,
+    )
+    return result
+
+
+def _stdout_artifact_dir(write_artifacts: bool) -> Optional[tempfile.TemporaryDirectory[str]]:
+    return None if write_artifacts else tempfile.TemporaryDirectory(prefix="mco-stdout-")
+
+
+def run_review(
+    request: ReviewRequest,
+    adapters: Optional[Mapping[str, ProviderAdapter]] = None,
+    review_mode: bool = True,
+    write_artifacts: bool = True,
+    on_event: Optional[ReviewEventCallback] = None,
+) -> ReviewResult:
+    """
+    Run the prompt on every selected provider and aggregate the results.
+    `on_event`, when given, receives provider_started/provider_progress/provider_finished,
+    finding and decision events while the review is running.
+    """
+    temp_artifact_dir = _stdout_artifact_dir(write_artifacts)
+    runtime_artifact_base = temp_artifact_dir.name if temp_artifact_dir is not None else request.artifact_base
+    phases = PhaseRecorder()
+    tracer = build_tracer(request.policy.trace_export)
+    review_span = tracer.start_span("mco.review", mode="review" if review_mode else "run")
+    try:
+        with phases.span("prepare"), tracer.span("mco.prepare", review_span):
+            review = _prepare_review(request, adapters, review_mode, write_artifacts, runtime_artifact_base, on_event)
+            review = replace(review, tracer=tracer, trace_span=review_span)
+        max_workers = _max_provider_workers(review)
+        outcomes: Dict[str, _ProviderExecutionOutcome] = {}
+        with phases.span("providers"):
+            if max_workers <= 1:
+                for provider in review.provider_order:
+                    outcomes[provider] = _record_outcome(review, _run_provider(review, provider))
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(_run_provider, review, provider): provider for provider in review.provider_order
+                    }
+                    for future in as_completed(futures):
+                        provider = futures[future]
+                        try:
+                            outcome = future.result()
+                        except Exception as exc:  # pragma: no cover - protective guard
+                            outcome = _internal_error_outcome(review, provider, exc)
+                        outcomes[provider] = _record_outcome(review, outcome)
+
+        with phases.span("aggregate"), tracer.span("mco.merge", review_span) as merge_span:
+            aggregate = _aggregate_outcomes(review, outcomes)
+            merge_span.set(findings_count=len(aggregate.merged_findings))
+            if review.events is not None:
+                review.events.decision(aggregate)
+        with phases.span("synthesis"):
+            synthesis = _run_synthesis(review, aggregate)
+        return _traced_review(review_span, _finalize_review(review, aggregate, synthesis, phases))
+    except BaseException as exc:
+        review_span.fail(exc.__class__.__name__)
+        raise
+    finally:
+        review_span.end()
+        tracer.flush(__version__)
+        if temp_artifact_dir is not None:
+            temp_artifact_dir.cleanup()
+
+
+async def run_review_async(
+    request: ReviewRequest,
+    adapters: Optional[Mapping[str, ProviderAdapter]] = None,
+    review_mode: bool = True,
+    write_artifacts: bool = True,
+    on_event: Optional[ReviewEventCallback] = None,
+) -> ReviewResult:
+    """
+    Asyncio counterpart of `run_review` with identical results and artifacts.
+    Providers run as tasks on the calling event loop, bounded by `max_provider_parallelism`,
+    so many concurrent reviews can share one loop instead of holding a thread per provider.
+    """
+    temp_artifact_dir = _stdout_artifact_dir(write_artifacts)
+    runtime_artifact_base = temp_artifact_dir.name if temp_artifact_dir is not None else request.artifact_base
+    phases = PhaseRecorder()
+    tracer = build_tracer(request.policy.trace_export)
+    review_span = tracer.start_span("mco.review", mode="review" if review_mode else "run")
+    try:
+        # Preparation hashes the scope and mines earlier runs, and finalizing writes artifacts and history;
+        # both run in a worker thread so other reviews on the loop keep going.
+        with phases.span("prepare"), tracer.span("mco.prepare", review_span):
+            review = await asyncio.to_thread(
+                _prepare_review, request, adapters, review_mode, write_artifacts, runtime_artifact_base, on_event
             )
-        if write_artifacts and root_path:
-            _write_text(root_path / "decision.md", "\n".join(decision_lines))
-
-        run_payload = {
-            "task_id": resolved_task_id,
-            "mode": "review" if review_mode else "run",
-            "terminal_state": terminal_state.value,
-            "decision": decision,
-            "effective_cwd": str(Path(request.repo_root).resolve(strict=False)),
-            "allow_paths": normalized_allow_paths,
-            "allow_paths_hash": _stable_payload_hash(normalized_allow_paths),
-            "target_paths": normalized_targets,
-            "enforcement_mode": request.policy.enforcement_mode,
-            "enforce_findings_contract": request.policy.enforce_findings_contract,
-            "provider_permissions": request.policy.provider_permissions,
-            "permissions_hash": _stable_payload_hash(request.policy.provider_permissions),
-            "provider_results": provider_results,
-            "findings_count": len(merged_findings),
-            "parse_success_count": parse_success_count,
-            "parse_failure_count": parse_failure_count,
-            "schema_valid_count": schema_valid_count,
-            "dropped_findings_count": dropped_findings_count,
-        }
-        if token_usage_summary is not None:
-            run_payload["token_usage_summary"] = token_usage_summary
-        if synthesis is not None:
-            run_payload["synthesis"] = synthesis
-        if write_artifacts and root_path:
-            _write_json(root_path / "run.json", run_payload)
-
-        return ReviewResult(
-            task_id=resolved_task_id,
-            artifact_root=artifact_root,
-            decision=decision,
-            terminal_state=terminal_state.value,
-            provider_results=provider_results,
-            findings_count=len(merged_findings),
-            parse_success_count=parse_success_count,
-            parse_failure_count=parse_failure_count,
-            schema_valid_count=schema_valid_count,
-            dropped_findings_count=dropped_findings_count,
-            findings=findings_json,
-            token_usage_summary=token_usage_summary,
-            synthesis=synthesis,
-        )
+            review = replace(review, tracer=tracer, trace_span=review_span)
+        semaphore = asyncio.Semaphore(_max_provider_workers(review))
+
+        async def _bounded(provider: str) -> _ProviderExecutionOutcome:
+            async with semaphore:
+                try:
+                    outcome = await _run_provider_async(review, provider)
+                except Exception as exc:  # pragma: no cover - protective guard
+                    outcome = _internal_error_outcome(review, provider, exc)
+                return _record_outcome(review, outcome)
+
+        with phases.span("providers"):
+            results = await asyncio.gather(
+                *(_bounded(provider) for provider in review.provider_order),
+                return_exceptions=True,
+            )
+        outcomes: Dict[str, _ProviderExecutionOutcome] = {}
+        for provider, result in zip(review.provider_order, results):
+            if isinstance(result, Exception):  # pragma: no cover - protective guard
+                outcomes[provider] = _internal_error_outcome(review, provider, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                outcomes[provider] = result
+
+        with phases.span("aggregate"), tracer.span("mco.merge", review_span) as merge_span:
+            aggregate = _aggregate_outcomes(review, outcomes)
+            merge_span.set(findings_count=len(aggregate.merged_findings))
+            if review.events is not None:
+                review.events.decision(aggregate)
+        with phases.span("synthesis"):
+            synthesis = await _run_synthesis_async(review, aggregate)
+        result = await asyncio.to_thread(_finalize_review, review, aggregate, synthesis, phases)
+        return _traced_review(review_span, result)
+    except BaseException as exc:
+        review_span.fail(exc.__class__.__name__)
+        raise
     finally:
+        review_span.end()
+        # Exporting may post to a collector, so keep it off the event loop like the other blocking steps.
+        await asyncio.to_thread(tracer.flush, __version__)
         if temp_artifact_dir is not None:
             temp_artifact_dir.cleanup()
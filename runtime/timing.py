@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+# Provider phases, in the order they usually happen:
+#   detect         version/auth detection, including waiting on an optimistic check and a hedge backup's detect
+#   result_cache   result cache lookup and store
+#   queue          waiting for a host-wide provider slot (`ReviewPolicy.provider_slots`)
+#   spawn          adapter.run(), i.e. starting the CLI process (or attaching to a warm server)
+#   model          provider running, from spawn until its exit was observed, minus poll_slack
+#   poll_slack     estimated time between provider exit and the orchestrator noticing it
+#   parse          reading stdout/stderr and normalizing findings
+#   cancel         cancelling a run that hit a deadline, an early exit or lost to a hedge backup
+#   retry_backoff  sleeping between attempts
+#   artifacts      provider artifact directory writes
+# Review phases: prepare, providers, aggregate, synthesis, finalize.
+
+
+class PhaseRecorder:
+    """
+    Wall time per named phase on the monotonic clock. Repeated spans of one phase (retries, polls)
+    accumulate; `as_dict` reports milliseconds in the order phases were first recorded.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._seconds: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self._seconds[phase] = self._seconds.get(phase, 0.0) + max(0.0, seconds)
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.add(phase, self._clock() - started)
+
+    def now(self) -> float:
+        return self._clock()
+
+    def __bool__(self) -> bool:
+        return bool(self._seconds)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {phase: int(round(seconds * 1000)) for phase, seconds in self._seconds.items()}
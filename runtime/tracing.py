@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Protocol, Tuple, Union
+
+AttributeValue = Union[str, int, float, bool]
+
+DEFAULT_EXPORT_TIMEOUT_SECONDS = 5.0
+_SERVICE_NAME = "mco"
+_SPAN_KIND_INTERNAL = 1
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+_TRACEPARENT_RE = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+def _attribute(key: str, value: AttributeValue) -> Dict[str, object]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        # OTLP/JSON carries 64-bit integers as strings.
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def parse_traceparent(value: str) -> Optional[Tuple[str, str]]:
+    """(trace_id, parent_span_id) from a W3C `traceparent` header value, or None when it is malformed."""
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+class Span:
+    """One timed operation; `end` is idempotent and attributes may be added until then."""
+
+    def __init__(self, tracer: Tracer, name: str, trace_id: str, parent_span_id: str) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, AttributeValue] = {}
+        self.error = ""
+
+    def set(self, **attributes: Optional[AttributeValue]) -> None:
+        for key, value in attributes.items():
+            if value is not None:
+                self.attributes[f"mco.{key}"] = value
+
+    def fail(self, message: str) -> None:
+        self.error = message or "error"
+
+    def end(self) -> None:
+        if self.end_ns:
+            return
+        self.end_ns = time.time_ns()
+        self._tracer._finished(self)
+
+    def to_otlp(self) -> Dict[str, object]:
+        payload: Dict[str, object] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": _STATUS_ERROR, "message": self.error} if self.error else {"code": _STATUS_OK},
+        }
+        if self.parent_span_id:
+            payload["parentSpanId"] = self.parent_span_id
+        return payload
+
+
+class _NoopSpan(Span):
+    def __init__(self) -> None:
+        self.name = ""
+        self.trace_id = ""
+        self.span_id = ""
+        self.parent_span_id = ""
+
+    def set(self, **attributes: Optional[AttributeValue]) -> None:
+        pass
+
+    def fail(self, message: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN: Span = _NoopSpan()
+
+
+class SpanExporter(Protocol):
+    def export(self, payload: Mapping[str, object]) -> None:
+        ...
+
+
+class FileSpanExporter:
+    """Appends one OTLP/JSON `ExportTraceServiceRequest` per review as a line of `path`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def export(self, payload: Mapping[str, object]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(payload, ensure_ascii=True, separators=(",", ":")) + "\n")
+
+
+class HttpSpanExporter:
+    """POSTs OTLP/JSON to a collector; `endpoint` is the collector base URL or its `/v1/traces` URL."""
+
+    def __init__(self, endpoint: str, timeout_seconds: float = DEFAULT_EXPORT_TIMEOUT_SECONDS) -> None:
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.timeout_seconds = timeout_seconds
+
+    def export(self, payload: Mapping[str, object]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload, ensure_ascii=True).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            response.read()
+
+
+class Tracer:
+    """
+    Collects the spans of one review and hands them to `exporter` in a single OTLP request on `flush`.
+    A W3C `traceparent` (as set by CI tracing integrations) makes the review span a child of the caller's span.
+    """
+
+    enabled = True
+
+    def __init__(self, exporter: SpanExporter, traceparent: str = "") -> None:
+        self.exporter = exporter
+        parent = parse_traceparent(traceparent) if traceparent else None
+        self.trace_id, self._root_parent_id = parent if parent is not None else (os.urandom(16).hex(), "")
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes: Optional[AttributeValue]) -> Span:
+        parent_id = parent.span_id if parent is not None and parent.span_id else self._root_parent_id
+        span = Span(self, name, self.trace_id, parent_id)
+        span.set(**attributes)
+        return span
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes: Optional[AttributeValue]) -> Iterator[Span]:
+        span = self.start_span(name, parent, **attributes)
+        try:
+            yield span
+        except BaseException as exc:
+            span.fail(exc.__class__.__name__)
+            raise
+        finally:
+            span.end()
+
+    def _finished(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def flush(self, version: str = "") -> None:
+        """Export the finished spans; export failures are only reported on stderr so tracing never fails a review."""
+        with self._lock:
+            spans, self._spans = self._spans, []
+        if not spans:
+            return
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", _SERVICE_NAME)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": _SERVICE_NAME, "version": version},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        try:
+            self.exporter.export(payload)
+        except Exception as exc:  # any exporter failure, e.g. http.client.RemoteDisconnected
+            print(f"Trace export error: {exc.__class__.__name__}: {exc}", file=sys.stderr)
+
+
+class NoopTracer(Tracer):
+    """Tracing disabled: every span is the shared no-op span and nothing is recorded or exported."""
+
+    enabled = False
+
+    def __init__(self) -> None:
+        pass
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes: Optional[AttributeValue]) -> Span:
+        return NOOP_SPAN
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes: Optional[AttributeValue]) -> Iterator[Span]:
+        yield NOOP_SPAN
+
+    def flush(self, version: str = "") -> None:
+        pass
+
+
+NOOP_TRACER: Tracer = NoopTracer()
+
+
+def build_tracer(trace_export: str, traceparent: Optional[str] = None) -> Tracer:
+    """
+    Tracer for `trace_export`: an `http(s)://` collector endpoint, a file path for JSON lines, or "" to disable.
+    `traceparent` defaults to the `TRACEPARENT` environment variable.
+    """
+    target = trace_export.strip()
+    if not target:
+        return NOOP_TRACER
+    if traceparent is None:
+        traceparent = os.environ.get("TRACEPARENT", "")
+    exporter: SpanExporter
+    if target.startswith(("http://", "https://")):
+        exporter = HttpSpanExporter(target)
+    else:
+        exporter = FileSpanExporter(Path(target))
+    return Tracer(exporter, traceparent)
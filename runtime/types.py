@@ -13,6 +13,7 @@ class ErrorKind(str, Enum):
     NON_RETRYABLE_INVALID_INPUT = "non_retryable_invalid_input"
     NON_RETRYABLE_UNSUPPORTED_CAPABILITY = "non_retryable_unsupported_capability"
     NORMALIZATION_ERROR = "normalization_error"
+    CANCELLED = "cancelled"
 
 
 class WarningKind(str, Enum):
@@ -53,6 +54,8 @@ class AttemptResult:
     error_kind: Optional[ErrorKind] = None
     stderr: str = ""
     warnings: List[WarningKind] = field(default_factory=list)
+    # Provider hint for when a rate limit resets (see `errors.parse_retry_after`).
+    retry_after_seconds: Optional[float] = None
 
 
 @dataclass
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Compare the JSON fragment scanner against the previous slice-and-retry decoder.
+
+Runs both over recorded provider stdout logs (default: reports/**/raw/*.stdout.log) and a
+few synthetic codex-style streams, checks they yield identical fragments, and prints timings.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from runtime.adapters.parsing import iter_json_fragments
+
+
+def legacy_decode_json_fragments(text: str) -> List[Any]:
+    decoder = json.JSONDecoder()
+    payloads: List[Any] = []
+    index = 0
+    while index < len(text):
+        match = re.search(r"[\{\[]", text[index:])
+        if not match:
+            break
+        start = index + match.start()
+        try:
+            payload, end = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            index = start + 1
+            continue
+        payloads.append(payload)
+        index = end
+    return payloads
+
+
+def scanner_decode_json_fragments(text: str) -> List[Any]:
+    return [fragment.value for fragment in iter_json_fragments(text)]
+
+
+def synthetic_corpus(events: int) -> Dict[str, str]:
+    event = json.dumps(
+        {
+            "type": "item.completed",
+            "item": {"type": "command_execution", "command": "rg -n '{' runtime", "aggregated_output": "if x: {\n}"},
+        }
+    )
+    stream = "\n".join(event for _ in range(events))
+    return {
+        "synthetic/codex-stream": stream,
+        # A stream cut off mid-event: every open brace of the tail event used to re-parse to EOF.
+        "synthetic/truncated-tail": stream + "\n" + ('{"type":"item.completed","item":{"text":"' + "{[" * 2000),
+        "synthetic/brace-noise": "log line { with [ unmatched { braces\n" * events,
+    }
+
+
+def _time(fn: Callable[[str], List[Any]], text: str, repeat: int) -> Tuple[float, List[Any]]:
+    best = float("inf")
+    result: List[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="stdout logs to benchmark (default: recorded reports)")
+    parser.add_argument("--synthetic-events", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="emit results as JSON")
+    args = parser.parse_args()
+
+    paths = [Path(item) for item in args.paths] or sorted(ROOT_DIR.glob("reports/**/raw/*.stdout.log"))
+    corpus: Dict[str, str] = {}
+    for path in paths:
+        corpus[str(path.relative_to(ROOT_DIR) if path.is_relative_to(ROOT_DIR) else path)] = path.read_text(
+            encoding="utf-8", errors="replace"
+        )
+    corpus.update(synthetic_corpus(args.synthetic_events))
+
+    rows: List[Dict[str, object]] = []
+    mismatches = 0
+    for name, text in corpus.items():
+        legacy_seconds, legacy_result = _time(legacy_decode_json_fragments, text, args.repeat)
+        scanner_seconds, scanner_result = _time(scanner_decode_json_fragments, text, args.repeat)
+        identical = legacy_result == scanner_result
+        mismatches += 0 if identical else 1
+        rows.append(
+            {
+                "name": name,
+                "bytes": len(text.encode("utf-8")),
+                "fragments": len(scanner_result),
+                "legacy_ms": round(legacy_seconds * 1000, 3),
+                "scanner_ms": round(scanner_seconds * 1000, 3),
+                "speedup": round(legacy_seconds / scanner_seconds, 2) if scanner_seconds > 0 else None,
+                "identical": identical,
+            }
+        )
+
+    totals = {
+        "inputs": len(rows),
+        "legacy_ms": round(sum(float(row["legacy_ms"]) for row in rows), 3),
+        "scanner_ms": round(sum(float(row["scanner_ms"]) for row in rows), 3),
+        "mismatches": mismatches,
+    }
+    if args.json:
+        print(json.dumps({"results": rows, "totals": totals}, indent=2))
+    else:
+        for row in rows:
+            print(
+                f"{row['name']}: {row['bytes']}B fragments={row['fragments']} "
+                f"legacy={row['legacy_ms']}ms scanner={row['scanner_ms']}ms x{row['speedup']} identical={row['identical']}"
+            )
+        print(
+            f"total: legacy={totals['legacy_ms']}ms scanner={totals['scanner_ms']}ms "
+            f"inputs={totals['inputs']} mismatches={mismatches}"
+        )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
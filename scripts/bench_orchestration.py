@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Benchmark the orchestration hot paths on synthetic inputs and compare against stored baselines.
+
+Covers fragment decoding (on noisy output, a clean event stream and a single findings envelope), payload
+extraction, contract inspection, cross-provider finding merge, SARIF formatting and a full `run_review` over
+replay adapters, at input sizes from 1KB up to 50MB. Timings are the best of several repeats; `--baseline`
+fails the run when a case regresses past the threshold, and `--write-baseline` records the current machine's
+numbers.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from runtime.adapters.parsing import _decode_json_fragments, extract_json_payloads, inspect_contract_output
+from runtime.adapters.replay import ReplayProfile, ReplayRecording, replay_adapters
+from runtime.config import ReviewPolicy
+from runtime.contracts import Evidence, NormalizedFinding
+from runtime.formatters import format_sarif
+from runtime.review_engine import ReviewRequest, _merge_findings_across_providers, run_review
+
+DEFAULT_BASELINE_PATH = ROOT_DIR / "scripts" / "bench_baselines.json"
+DEFAULT_THRESHOLD = 0.5
+SIZES: Dict[str, int] = {
+    "1KB": 1024,
+    "64KB": 64 * 1024,
+    "1MB": 1024 * 1024,
+    "10MB": 10 * 1024 * 1024,
+    "50MB": 50 * 1024 * 1024,
+}
+PROVIDERS = ("claude", "codex", "gemini", "opencode", "qwen")
+_MIN_SAMPLE_SECONDS = 0.01
+_MAX_NUMBER = 1000
+_BYTES_PER_FINDING = 512
+
+
+def _finding_payload(index: int) -> Dict[str, object]:
+    return {
+        "finding_id": f"f{index}",
+        "severity": ("critical", "high", "medium", "low")[index % 4],
+        "category": "bug",
+        "title": f"Synthetic issue {index}",
+        "evidence": {"file": f"src/module_{index % 97}.py", "line": index % 500 + 1, "snippet": "x = {}"},
+        "recommendation": "fix it",
+        "confidence": 0.8,
+        "fingerprint": f"fp-{index}",
+    }
+
+
+def synthetic_stdout(size: int) -> str:
+    """Provider-like stdout of roughly `size` bytes: codex-style events, brace-heavy log noise, a findings envelope."""
+    findings = [_finding_payload(index) for index in range(max(1, size // (_BYTES_PER_FINDING * 4)))]
+    envelope = json.dumps({"findings": findings})
+    event = json.dumps(
+        {
+            "type": "item.completed",
+            "item": {"type": "command_execution", "command": "rg -n '{' runtime", "aggregated_output": "if x: {\n}"},
+        }
+    )
+    noise = "log line { with [ unmatched { braces\n"
+    filler: List[str] = []
+    remaining = size - len(envelope)
+    while remaining > 0:
+        filler.append(event + "\n" + noise)
+        remaining -= len(event) + len(noise) + 1
+    return "".join(filler) + envelope
+
+
+def synthetic_event_stream(size: int) -> str:
+    """Well-formed provider stdout of roughly `size` bytes: one codex-style event per line, then a findings envelope."""
+    findings = [_finding_payload(index) for index in range(max(1, size // (_BYTES_PER_FINDING * 4)))]
+    envelope = json.dumps({"type": "item.completed", "item": {"type": "agent_message", "text": {"findings": findings}}})
+    lines: List[str] = []
+    remaining = size - len(envelope)
+    index = 0
+    while remaining > 0:
+        item = {"id": f"item_{index}", "type": "reasoning", "text": "ok"}
+        line = json.dumps({"type": "item.completed", "item": item})
+        lines.append(line + "\n")
+        remaining -= len(line) + 1
+        index += 1
+    return "".join(lines) + envelope
+
+
+def synthetic_envelope(size: int) -> str:
+    """A single findings envelope of roughly `size` bytes after a line of prose, as qwen and gemini emit it."""
+    findings = [_finding_payload(index) for index in range(max(1, size * 3 // (_BYTES_PER_FINDING * 2)))]
+    return "Review complete.\n" + json.dumps({"findings": findings}, indent=2)
+
+
+def synthetic_findings(size: int) -> List[NormalizedFinding]:
+    """Normalized findings for `size` bytes of provider output, spread over five providers with half of them shared."""
+    count = max(1, size // _BYTES_PER_FINDING)
+    findings: List[NormalizedFinding] = []
+    for index in range(count):
+        payload = _finding_payload(index // 2 if index % 2 else index)
+        evidence = payload["evidence"]
+        assert isinstance(evidence, dict)
+        findings.append(
+            NormalizedFinding(
+                task_id="bench",
+                provider=PROVIDERS[index % len(PROVIDERS)],  # type: ignore[arg-type]
+                finding_id=str(payload["finding_id"]),
+                severity=str(payload["severity"]),  # type: ignore[arg-type]
+                category=str(payload["category"]),  # type: ignore[arg-type]
+                title=str(payload["title"]),
+                evidence=Evidence(
+                    file=str(evidence["file"]), line=int(evidence["line"]), snippet=str(evidence["snippet"])
+                ),
+                recommendation=str(payload["recommendation"]),
+                confidence=float(payload["confidence"]),  # type: ignore[arg-type]
+                fingerprint=str(payload["fingerprint"]),
+                raw_ref="raw/bench.stdout.log",
+            )
+        )
+    return findings
+
+
+def _run_review_case(size: int, workdir: str) -> Callable[[], Any]:
+    profile = ReplayProfile(recordings=(ReplayRecording(stdout=synthetic_stdout(size)),), stream_chunks=1, seed=1)
+    counter = iter(range(1 << 30))
+
+    def run() -> Any:
+        request = ReviewRequest(
+            repo_root=workdir,
+            prompt="benchmark",
+            providers=list(PROVIDERS),  # type: ignore[arg-type]
+            artifact_base=f"{workdir}/artifacts",
+            task_id=f"bench-{next(counter)}",
+            policy=ReviewPolicy(timeout_seconds=60, max_retries=0),
+        )
+        return run_review(request, adapters=replay_adapters(PROVIDERS, profile))
+
+    return run
+
+
+def build_cases(size: int, workdir: str) -> Dict[str, Callable[[], Any]]:
+    """Zero-argument callables per benchmark case, with their inputs built once up front."""
+    stdout = synthetic_stdout(size)
+    event_stream = synthetic_event_stream(size)
+    envelope = synthetic_envelope(size)
+    payloads = extract_json_payloads(stdout)
+    findings = synthetic_findings(size)
+    merged = _merge_findings_across_providers(findings)
+    sarif_payload = {"task_id": "bench", "decision": "FAIL", "terminal_state": "COMPLETED", "provider_results": {}}
+    return {
+        "decode_json_fragments": lambda: _decode_json_fragments(stdout),
+        "decode_event_stream": lambda: _decode_json_fragments(event_stream),
+        "decode_findings_envelope": lambda: _decode_json_fragments(envelope),
+        "extract_json_payloads": lambda: extract_json_payloads(stdout),
+        "inspect_contract_output": lambda: inspect_contract_output(stdout, payloads=payloads),
+        "merge_findings": lambda: _merge_findings_across_providers(findings),
+        "format_sarif": lambda: format_sarif(sarif_payload, merged),
+        "run_review": _run_review_case(size, workdir),
+    }
+
+
+@dataclass
+class BenchResult:
+    name: str
+    size: str
+    bytes: int
+    seconds: float
+    number: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}/{self.size}"
+
+
+def time_case(fn: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Best per-call seconds over `repeat` samples; fast cases are looped so one sample spans at least 10ms."""
+    started = time.perf_counter()
+    fn()
+    single = time.perf_counter() - started
+    number = 1 if single >= _MIN_SAMPLE_SECONDS else min(_MAX_NUMBER, int(_MIN_SAMPLE_SECONDS / max(single, 1e-9)) + 1)
+    best = single if number == 1 else float("inf")
+    for _ in range(max(1, repeat) - (1 if number == 1 else 0)):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best, number
+
+
+def run_benchmarks(sizes: List[str], repeat: int, only: Optional[List[str]] = None) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for size_label in sizes:
+        size = SIZES[size_label]
+        with tempfile.TemporaryDirectory(prefix="mco-bench-") as workdir:
+            for name, fn in build_cases(size, workdir).items():
+                if only and name not in only:
+                    continue
+                seconds, number = time_case(fn, repeat)
+                results.append(BenchResult(name=name, size=size_label, bytes=size, seconds=seconds, number=number))
+    return results
+
+
+def compare_to_baseline(
+    results: List[BenchResult],
+    baseline: Dict[str, Any],
+    threshold: Optional[float] = None,
+) -> List[Dict[str, object]]:
+    """Cases slower than `baseline * (1 + threshold)`; cases missing from the baseline are not judged."""
+    limit = float(threshold if threshold is not None else baseline.get("threshold", DEFAULT_THRESHOLD))
+    recorded = baseline.get("cases", {})
+    regressions: List[Dict[str, object]] = []
+    for result in results:
+        reference = recorded.get(result.key) if isinstance(recorded, dict) else None
+        if not isinstance(reference, (int, float)) or reference <= 0:
+            continue
+        ratio = result.seconds / float(reference)
+        if ratio > 1.0 + limit:
+            regressions.append(
+                {"case": result.key, "baseline_seconds": reference, "seconds": result.seconds, "ratio": round(ratio, 2)}
+            )
+    return regressions
+
+
+def baseline_payload(results: List[BenchResult], threshold: float) -> Dict[str, object]:
+    return {
+        "threshold": threshold,
+        "python": sys.version.split()[0],
+        "cases": {result.key: round(result.seconds, 9) for result in results},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", choices=tuple(SIZES), default="1MB", help="largest input size to run")
+    parser.add_argument("--case", action="append", default=[], help="only run the named case (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default="", help=f"baseline JSON to compare, e.g. {DEFAULT_BASELINE_PATH.name}")
+    parser.add_argument("--threshold", type=float, default=None, help="allowed slowdown ratio over baseline, e.g. 0.5")
+    parser.add_argument("--write-baseline", default="", help="write the results as a baseline JSON to this path")
+    parser.add_argument("--json", action="store_true", help="emit results as JSON")
+    args = parser.parse_args(argv)
+
+    labels = list(SIZES)
+    sizes = labels[: labels.index(args.max_size) + 1]
+    results = run_benchmarks(sizes, args.repeat, args.case or None)
+
+    regressions: List[Dict[str, object]] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+    if args.write_baseline:
+        threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+        Path(args.write_baseline).write_text(
+            json.dumps(baseline_payload(results, threshold), indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+    if args.json:
+        print(json.dumps({"results": [asdict(item) for item in results], "regressions": regressions}, indent=2))
+    else:
+        for item in results:
+            print(f"{item.key}: {item.seconds * 1000:.3f}ms (x{item.number})")
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']}: {float(regression['seconds']) * 1000:.3f}ms "
+                f"vs baseline {float(regression['baseline_seconds']) * 1000:.3f}ms (x{regression['ratio']})"
+            )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import subprocess
 import tempfile
+import threading
 import time
 import unittest
 
@@ -121,6 +123,70 @@ class AdapterContractTests(unittest.TestCase):
             self.assertTrue(status.completed)
             self.assertIn(status.attempt_state, ("FAILED", "SUCCEEDED", "EXPIRED"))
 
+    def test_wait_returns_when_process_exits(self) -> None:
+        adapter = ClaudeAdapter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task = TaskInput(
+                task_id="task-wait-exit",
+                prompt="ignored",
+                repo_root=tmpdir,
+                target_paths=["."],
+                metadata={
+                    "artifact_root": tmpdir,
+                    "command_override": ["python3", "-c", "print('ok')"],
+                },
+            )
+            ref = adapter.run(task)
+            started = time.time()
+            self.assertTrue(adapter.wait(ref, 10.0))
+            self.assertLess(time.time() - started, 5.0)
+            status = adapter.poll(ref)
+            self.assertTrue(status.completed)
+
+    def test_wait_times_out_while_process_runs(self) -> None:
+        adapter = ClaudeAdapter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task = TaskInput(
+                task_id="task-wait-timeout",
+                prompt="ignored",
+                repo_root=tmpdir,
+                target_paths=["."],
+                metadata={
+                    "artifact_root": tmpdir,
+                    "command_override": ["python3", "-c", "import time; time.sleep(10)"],
+                },
+            )
+            ref = adapter.run(task)
+            self.assertFalse(adapter.wait(ref, 0.2))
+            adapter.cancel(ref)
+            self.assertTrue(adapter.wait(ref, 5.0))
+
+    def test_wait_async_and_cancel_async(self) -> None:
+        adapter = ClaudeAdapter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task = TaskInput(
+                task_id="task-wait-async",
+                prompt="ignored",
+                repo_root=tmpdir,
+                target_paths=["."],
+                metadata={
+                    "artifact_root": tmpdir,
+                    "command_override": ["python3", "-c", "import time; time.sleep(10)"],
+                },
+            )
+
+            async def scenario() -> tuple[bool, bool]:
+                ref = adapter.run(task)
+                timed_out = await adapter.wait_async(ref, 0.2)
+                await adapter.cancel_async(ref)
+                exited = await adapter.wait_async(ref, 5.0)
+                return timed_out, exited
+
+            timed_out, exited = asyncio.run(scenario())
+            self.assertFalse(timed_out)
+            self.assertTrue(exited)
+            self.assertEqual(adapter._runs, {})  # type: ignore[attr-defined]
+
     def test_run_handle_is_released_after_terminal_poll(self) -> None:
         adapter = ClaudeAdapter()
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -277,6 +343,35 @@ class AdapterContractTests(unittest.TestCase):
         self.assertFalse(presence.auth_ok)
         self.assertEqual(presence.reason, "probe_config_error")
 
+    def test_detect_runs_probes_concurrently_and_reports_latency(self) -> None:
+        adapter = CodexAdapter()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def probe_version(_binary: str) -> str:
+            barrier.wait()
+            return "codex-cli 0.105.0"
+
+        def probe_auth(_binary: str) -> tuple[bool, str]:
+            barrier.wait()
+            return True, "ok"
+
+        with patch("runtime.adapters.shim.shutil.which", return_value="/mock/bin/codex"):
+            with patch.object(adapter, "_probe_version", side_effect=probe_version):
+                with patch.object(adapter, "_probe_auth", side_effect=probe_auth):
+                    presence = adapter.detect()
+        self.assertTrue(presence.auth_ok)
+        self.assertEqual(sorted(presence.probe_latency_ms), ["auth", "version"])
+
+    def test_probe_timeout_is_reported(self) -> None:
+        adapter = CodexAdapter()
+        adapter.probe_timeout_seconds = 1.5
+        with patch("runtime.adapters.shim.subprocess.run") as mocked_run:
+            mocked_run.side_effect = subprocess.TimeoutExpired(cmd=["codex", "login", "status"], timeout=1.5)
+            ok, reason = adapter._probe_auth("/mock/bin/codex")  # type: ignore[attr-defined]
+            self.assertEqual((ok, reason), (False, "probe_timeout"))
+            self.assertIsNone(adapter._probe_version("/mock/bin/codex"))  # type: ignore[attr-defined]
+        self.assertEqual(mocked_run.call_args.kwargs["timeout"], 1.5)
+
     def test_probe_version_uses_sanitized_env(self) -> None:
         adapter = CodexAdapter()
         with patch.dict("os.environ", {"CLAUDECODE": "1", "PATH": "/tmp/bin"}):
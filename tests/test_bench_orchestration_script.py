@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class BenchOrchestrationScriptTests(unittest.TestCase):
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        repo_root = Path(__file__).resolve().parents[1]
+        script_path = repo_root / "scripts" / "bench_orchestration.py"
+        return subprocess.run(
+            [sys.executable, str(script_path), "--max-size", "1KB", "--repeat", "1", *args],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    def test_writes_baseline_and_flags_regressions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline_path = Path(tmpdir) / "baseline.json"
+            completed = self._run("--json", "--write-baseline", str(baseline_path))
+            self.assertEqual(completed.returncode, 0, completed.stderr)
+            names = {item["name"] for item in json.loads(completed.stdout)["results"]}
+            self.assertEqual(
+                names,
+                {
+                    "decode_json_fragments",
+                    "decode_event_stream",
+                    "decode_findings_envelope",
+                    "extract_json_payloads",
+                    "inspect_contract_output",
+                    "merge_findings",
+                    "format_sarif",
+                    "run_review",
+                },
+            )
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+            self.assertIn("run_review/1KB", baseline["cases"])
+
+            baseline["cases"]["merge_findings/1KB"] = 1e-12
+            baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+            completed = self._run("--json", "--case", "merge_findings", "--baseline", str(baseline_path))
+            self.assertEqual(completed.returncode, 1, completed.stderr)
+            regressions = json.loads(completed.stdout)["regressions"]
+            self.assertEqual([item["case"] for item in regressions], ["merge_findings/1KB"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from runtime.circuit_breaker import BREAKERS_FILE_NAME, CircuitBreaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def test_opens_after_threshold_and_closes_after_successful_probe(self) -> None:
+        clock = _Clock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / BREAKERS_FILE_NAME
+            breaker = CircuitBreaker(path, threshold=2, cooldown_seconds=60, clock=clock)
+            self.assertIsNone(breaker.allow("codex"))
+            breaker.record("codex", False, "retryable_timeout")
+            self.assertIsNone(breaker.allow("codex"))
+            breaker.record("codex", None)
+            breaker.record("codex", False, "retryable_timeout")
+
+            blocked = breaker.allow("codex")
+            assert blocked is not None
+            self.assertEqual(blocked["state"], "open")
+            self.assertEqual(blocked["consecutive_failures"], 2)
+            self.assertEqual(blocked["last_error"], "retryable_timeout")
+            self.assertEqual(blocked["retry_after_seconds"], 60)
+            # Another process sharing the file sees the same breaker.
+            self.assertIsNotNone(CircuitBreaker(path, 2, 60, clock=clock).allow("codex"))
+            self.assertIsNone(breaker.allow("claude"))
+
+            clock.now += 61
+            self.assertIsNone(breaker.allow("codex"))
+            probing = breaker.allow("codex")
+            assert probing is not None
+            self.assertEqual(probing["state"], "half_open")
+            breaker.record("codex", False, "non_retryable_auth")
+            self.assertEqual(breaker.allow("codex")["state"], "open")  # type: ignore[index]
+
+            clock.now += 61
+            self.assertIsNone(breaker.allow("codex"))
+            breaker.record("codex", None)  # a cancelled probe hands the probe to the next caller
+            self.assertIsNone(breaker.allow("codex"))
+            breaker.record("codex", True)
+            self.assertIsNone(breaker.allow("codex"))
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["codex"]["state"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import contextlib
 import io
+import json
 import unittest
+from unittest.mock import patch
 
 from runtime.cli import (
+    _parse_hedge_providers,
     _parse_paths,
     _parse_provider_permissions_json,
+    _parse_provider_slots,
     _parse_provider_timeouts,
     _parse_providers,
     build_parser,
+    main,
     _resolve_config,
 )
+from runtime.review_engine import ReviewResult
 
 
 class CliTests(unittest.TestCase):
@@ -31,6 +37,20 @@ class CliTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             _parse_provider_timeouts("codex=0")
 
+    def test_parse_hedge_providers(self) -> None:
+        self.assertEqual(_parse_hedge_providers("claude=gemini, codex=qwen"), {"claude": "gemini", "codex": "qwen"})
+        self.assertEqual(_parse_hedge_providers(""), {})
+        for raw in ("claude", "claude=unknown", "claude=claude"):
+            with self.assertRaises(ValueError):
+                _parse_hedge_providers(raw)
+
+    def test_parse_provider_slots(self) -> None:
+        self.assertEqual(_parse_provider_slots("claude=2, codex=1"), {"claude": 2, "codex": 1})
+        self.assertEqual(_parse_provider_slots(""), {})
+        for raw in ("claude", "unknown=1", "claude=two", "claude=0"):
+            with self.assertRaises(ValueError):
+                _parse_provider_slots(raw)
+
     def test_parse_paths_defaults_to_dot(self) -> None:
         self.assertEqual(_parse_paths(""), ["."])
         self.assertEqual(_parse_paths("src, tests"), ["src", "tests"])
@@ -77,6 +97,28 @@ class CliTests(unittest.TestCase):
                 "--provider-permissions-json",
                 '{"claude":{"permission_mode":"accept-edits"},"codex":{"sandbox":"read-only"}}',
                 "--strict-contract",
+                "--stream-parse",
+                "--fail-fast",
+                "--quorum",
+                "2",
+                "--result-cache-ttl",
+                "3600",
+                "--incremental",
+                "--detect-cache-ttl",
+                "600",
+                "--optimistic-detect",
+                "--warm-pool-idle",
+                "900",
+                "--trace-export",
+                "http://127.0.0.1:4318",
+                "--provider-slots",
+                "claude=2",
+                "--record-history",
+                "--adaptive-timeouts",
+                "--circuit-breaker",
+                "3",
+                "--circuit-breaker-cooldown",
+                "120",
             ]
         )
         resolved = _resolve_config(args)
@@ -97,6 +139,57 @@ class CliTests(unittest.TestCase):
             {"permission_mode": "accept-edits"},
         )
         self.assertTrue(resolved.policy.enforce_findings_contract)
+        self.assertTrue(resolved.policy.stream_parse)
+        self.assertTrue(resolved.policy.fail_fast)
+        self.assertEqual(resolved.policy.quorum, 2)
+        self.assertEqual(resolved.policy.result_cache_ttl_seconds, 3600)
+        self.assertTrue(resolved.policy.incremental)
+        self.assertEqual(resolved.policy.detection_cache_ttl_seconds, 600)
+        self.assertTrue(resolved.policy.optimistic_detect)
+        self.assertEqual(resolved.policy.warm_pool_idle_seconds, 900)
+        self.assertEqual(resolved.policy.trace_export, "http://127.0.0.1:4318")
+        self.assertEqual(resolved.policy.provider_slots, {"claude": 2})
+        self.assertTrue(resolved.policy.record_history)
+        self.assertTrue(resolved.policy.adaptive_timeouts)
+        self.assertEqual(resolved.policy.circuit_breaker_threshold, 3)
+        self.assertEqual(resolved.policy.circuit_breaker_cooldown_seconds, 120)
+
+    def test_resolve_config_rejects_negative_quorum(self) -> None:
+        args = build_parser().parse_args(["review", "--prompt", "x", "--quorum", "-1"])
+        with self.assertRaises(ValueError):
+            _resolve_config(args)
+
+    def test_resolve_config_rejects_quorum_above_provider_count(self) -> None:
+        args = build_parser().parse_args(["review", "--prompt", "x", "--providers", "claude,codex", "--quorum", "3"])
+        with self.assertRaisesRegex(ValueError, r"--quorum must be <= the number of providers \(2\), got 3"):
+            _resolve_config(args)
+
+    def test_stream_prints_ndjson_events_then_result(self) -> None:
+        def fake_run_review(req, review_mode=True, write_artifacts=True, on_event=None):
+            on_event({"event": "provider_started", "task_id": "t1", "provider": "claude"})
+            on_event({"event": "decision", "task_id": "t1", "decision": "PASS"})
+            return ReviewResult(
+                task_id="t1",
+                artifact_root=None,
+                decision="PASS",
+                terminal_state="COMPLETED",
+                provider_results={"claude": {"success": True}},
+                findings_count=0,
+                parse_success_count=1,
+                parse_failure_count=0,
+                schema_valid_count=0,
+                dropped_findings_count=0,
+            )
+
+        output = io.StringIO()
+        with patch("runtime.cli.run_review", side_effect=fake_run_review):
+            with contextlib.redirect_stdout(output):
+                exit_code = main(["review", "--providers", "claude", "--prompt", "review", "--stream"])
+        events = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([event["event"] for event in events], ["provider_started", "decision", "result"])
+        self.assertEqual(events[-1]["decision"], "PASS")
+        self.assertEqual(events[-1]["provider_results"], {"claude": {"success": True}})
 
     def test_resolve_config_allows_cli_zero_to_force_full_parallel(self) -> None:
         parser = build_parser()
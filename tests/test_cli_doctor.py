@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import json
+import threading
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from unittest.mock import patch
@@ -51,12 +52,44 @@ class CliDoctorTests(unittest.TestCase):
         self.assertEqual(payload["provider_count"], 2)
         self.assertEqual(
             tuple(payload["providers"]["claude"].keys()),
-            ("detected", "binary_path", "version", "auth_ok", "reason", "ready"),
+            ("detected", "binary_path", "version", "auth_ok", "reason", "ready", "probe_latency_ms"),
         )
         self.assertEqual(payload["providers"]["claude"]["ready"], True)
         self.assertEqual(payload["providers"]["codex"]["ready"], False)
         self.assertEqual(payload["providers"]["codex"]["reason"], "auth_check_failed")
 
+    def test_doctor_probes_providers_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _BlockingAdapter:
+            def __init__(self, provider: str) -> None:
+                self.id = provider
+                self.probe_timeout_seconds = 60.0
+
+            def detect(self) -> ProviderPresence:
+                barrier.wait()
+                return ProviderPresence(
+                    provider=self.id,  # type: ignore[arg-type]
+                    detected=True,
+                    binary_path=f"/usr/local/bin/{self.id}",
+                    version="1.0.0",
+                    auth_ok=True,
+                    reason="ok",
+                    probe_latency_ms={"version": 5, "auth": 7},
+                )
+
+        adapters = {"claude": _BlockingAdapter("claude"), "codex": _BlockingAdapter("codex")}
+        output = io.StringIO()
+        with patch("runtime.cli._doctor_adapter_registry", return_value=adapters):
+            with redirect_stdout(output):
+                exit_code = main(["doctor", "--providers", "claude,codex", "--probe-timeout", "2", "--json"])
+
+        payload = json.loads(output.getvalue())
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(payload["overall_ok"])
+        self.assertEqual(payload["providers"]["codex"]["probe_latency_ms"], {"version": 5, "auth": 7})
+        self.assertEqual(adapters["claude"].probe_timeout_seconds, 2.0)
+
     def test_doctor_rejects_invalid_provider_set(self) -> None:
         with redirect_stderr(io.StringIO()):
             exit_code = main(["doctor", "--providers", "unknown"])
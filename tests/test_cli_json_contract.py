@@ -379,6 +379,29 @@ class CliJsonContractTests(unittest.TestCase):
             self.assertEqual(payload["synthesis"]["provider"], "codex")
             self.assertEqual(payload["synthesis"]["success"], True)
 
+    def test_json_output_includes_phase_timings_when_recorded(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = ReviewResult(
+                task_id="task-run-phases-1",
+                artifact_root=None,
+                decision="PASS",
+                terminal_state="COMPLETED",
+                provider_results={"codex": {"success": True}},
+                findings_count=0,
+                parse_success_count=0,
+                parse_failure_count=0,
+                schema_valid_count=0,
+                dropped_findings_count=0,
+                phase_timings_ms={"prepare": 3, "providers": 120, "aggregate": 1, "finalize": 2},
+            )
+            exit_code, payload = self._invoke_json(
+                ["run", "--repo", tmpdir, "--prompt", "run", "--providers", "codex", "--json"],
+                result,
+            )
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(set(payload) - set(EXPECTED_DETAILED_JSON_KEYS), {"phase_timings_ms"})
+            self.assertEqual(payload["phase_timings_ms"]["providers"], 120)
+
     def test_invalid_synth_provider_is_rejected(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             stderr = io.StringIO()
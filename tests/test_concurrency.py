@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import List
+
+from runtime.adapters.replay import ReplayProfile, ReplayRecording, replay_adapters
+from runtime.concurrency import ProviderSlots
+from runtime.config import ReviewPolicy
+from runtime.review_engine import ReviewRequest, ReviewResult, run_review
+
+_FINDING_OUTPUT = (
+    '{"findings":[{"finding_id":"f1","severity":"low","category":"bug","title":"Slot issue",'
+    '"evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+    '"confidence":0.8,"fingerprint":"fp-slot"}]}'
+)
+
+
+class ProviderSlotsTests(unittest.TestCase):
+    def test_slots_cap_holders_until_released(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            slots = ProviderSlots(Path(tmpdir), {"claude": 2, "codex": 0})
+            first = slots.try_acquire("claude")
+            second = slots.try_acquire("claude")
+            self.assertIsNotNone(first)
+            self.assertIsNotNone(second)
+            # Each lock file is opened afresh, so a third holder is refused even within one process.
+            self.assertIsNone(slots.try_acquire("claude"))
+            assert first is not None
+            first.release()
+            first.release()
+            third = slots.try_acquire("claude")
+            self.assertIsNotNone(third)
+            for lease in (second, third):
+                assert lease is not None
+                lease.release()
+
+            self.assertFalse(slots.limited("codex"))
+            self.assertIsNone(slots.acquire("codex"))
+
+    def test_acquire_gives_up_when_aborted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            slots = ProviderSlots(Path(tmpdir), {"claude": 1}, poll_seconds=0.01)
+            held = slots.try_acquire("claude")
+            assert held is not None
+            checks: List[int] = []
+
+            def abort() -> str:
+                checks.append(1)
+                return "deadline_reached" if len(checks) >= 3 else ""
+
+            self.assertIsNone(slots.acquire("claude", abort=abort))
+            self.assertEqual(len(checks), 3)
+            held.release()
+
+    def test_reviews_sharing_an_artifact_base_queue_for_a_single_slot(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), latency_seconds=0.4, seed=1)
+        results: List[ReviewResult] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            def review(task_id: str) -> None:
+                request = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude"],  # type: ignore[list-item]
+                    artifact_base=f"{tmpdir}/artifacts",
+                    task_id=task_id,
+                    policy=ReviewPolicy(timeout_seconds=5, max_retries=0, provider_slots={"claude": 1}),
+                )
+                results.append(run_review(request, adapters=replay_adapters(["claude"], profile)))
+
+            threads = [threading.Thread(target=review, args=(f"task-{index}",)) for index in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            lock_files = sorted(path.name for path in (Path(tmpdir) / "artifacts" / ".mco" / "locks").iterdir())
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result.provider_results["claude"]["success"] for result in results))
+        queued = sorted(result.provider_results["claude"]["phase_timings_ms"]["queue"] for result in results)
+        self.assertLess(queued[0], 200)
+        self.assertGreaterEqual(queued[1], 300)
+        self.assertEqual(lock_files, ["claude.0.lock"])
+
+
+if __name__ == "__main__":
+    unittest.main()
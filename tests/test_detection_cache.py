@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runtime.adapters import GeminiAdapter
+from runtime.artifacts import state_dir
+from runtime.config import ReviewPolicy
+from runtime.detection_cache import DetectionCache, detect_with_cache
+from runtime.review_engine import ReviewRequest, run_review
+
+
+class DetectionCacheTests(unittest.TestCase):
+    def _adapter(self, binary: Path) -> GeminiAdapter:
+        adapter = GeminiAdapter()
+        adapter.resolve_binary = lambda: str(binary)  # type: ignore[method-assign]
+        return adapter
+
+    def test_ready_probe_is_reused_until_binary_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            binary = Path(tmpdir) / "gemini"
+            binary.write_text("#!/bin/sh\n", encoding="utf-8")
+            cache = DetectionCache(Path(tmpdir) / "detection", ttl_seconds=3600)
+            adapter = self._adapter(binary)
+            with patch.object(adapter, "_probe_version", return_value="0.1.0") as version_probe:
+                with patch.object(adapter, "_probe_auth", return_value=(True, "ok")) as auth_probe:
+                    first = detect_with_cache(adapter, cache)
+                    second = detect_with_cache(adapter, cache)
+                    self.assertEqual(auth_probe.call_count, 1)
+                    self.assertEqual(first, second)
+                    self.assertEqual(second.version, "0.1.0")
+
+                    stat = binary.stat()
+                    os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                    detect_with_cache(adapter, cache)
+                    self.assertEqual(auth_probe.call_count, 2)
+                    self.assertEqual(version_probe.call_count, 2)
+
+    def test_failed_probe_is_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            binary = Path(tmpdir) / "gemini"
+            binary.write_text("#!/bin/sh\n", encoding="utf-8")
+            cache = DetectionCache(Path(tmpdir) / "detection", ttl_seconds=3600)
+            adapter = self._adapter(binary)
+            with patch.object(adapter, "_probe_version", return_value="0.1.0"):
+                with patch.object(adapter, "_probe_auth", return_value=(False, "auth_check_failed")) as auth_probe:
+                    detect_with_cache(adapter, cache)
+                    presence = detect_with_cache(adapter, cache)
+            self.assertEqual(auth_probe.call_count, 2)
+            self.assertFalse(presence.auth_ok)
+            self.assertFalse((Path(tmpdir) / "detection" / "gemini.json").exists())
+
+    def test_expired_entry_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            binary = Path(tmpdir) / "gemini"
+            binary.write_text("#!/bin/sh\n", encoding="utf-8")
+            cache = DetectionCache(Path(tmpdir) / "detection", ttl_seconds=60)
+            adapter = self._adapter(binary)
+            with patch.object(adapter, "_probe_version", return_value="0.1.0"):
+                with patch.object(adapter, "_probe_auth", return_value=(True, "ok")):
+                    detect_with_cache(adapter, cache)
+            entry_path = Path(tmpdir) / "detection" / "gemini.json"
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            entry["stored_at"] -= 120
+            entry_path.write_text(json.dumps(entry), encoding="utf-8")
+            self.assertIsNone(cache.get("gemini", str(binary)))
+
+    def test_run_failing_on_auth_or_a_missing_binary_drops_the_entry(self) -> None:
+        scripts = {
+            "auth": "#!/bin/sh\necho 'Error: 401 Unauthorized' >&2\nexit 1\n",
+            "not_found": "#!/bin/sh\necho 'env: node: No such file or directory' >&2\nexit 127\n",
+            "missing": None,
+            "other_failure": "#!/bin/sh\necho 'boom' >&2\nexit 1\n",
+        }
+        for case, script in scripts.items():
+            with self.subTest(case=case), tempfile.TemporaryDirectory() as tmpdir:
+                binary = Path(tmpdir) / "gemini"
+                binary.write_text("#!/bin/sh\n", encoding="utf-8")
+                artifact_base = f"{tmpdir}/artifacts"
+                cache = DetectionCache(state_dir(artifact_base) / "detection", ttl_seconds=3600)
+                adapter = self._adapter(binary)
+                with patch.object(adapter, "_probe_version", return_value="0.1.0"):
+                    with patch.object(adapter, "_probe_auth", return_value=(True, "ok")):
+                        detect_with_cache(adapter, cache)
+                command = Path(tmpdir) / "gemini-run"
+                if script is not None:
+                    command.write_text(script, encoding="utf-8")
+                    command.chmod(0o755)
+                adapter._build_command = lambda input_task: [str(command)]  # type: ignore[method-assign]
+                request = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["gemini"],  # type: ignore[list-item]
+                    artifact_base=artifact_base,
+                    policy=ReviewPolicy(
+                        timeout_seconds=10, poll_interval_seconds=0.05, max_retries=0, detection_cache_ttl_seconds=3600
+                    ),
+                )
+                result = run_review(request, adapters={"gemini": adapter})
+
+                self.assertFalse(result.provider_results["gemini"]["success"])
+                cached = cache.get("gemini", str(binary))
+                if case == "other_failure":
+                    self.assertIsNotNone(cached)
+                else:
+                    self.assertIsNone(cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import unittest
 
-from runtime.errors import classify_error, detect_warnings
+from runtime.errors import classify_error, detect_warnings, parse_retry_after
 from runtime.types import ErrorKind, WarningKind
 
 
@@ -32,6 +32,24 @@ class ErrorTaxonomyTests(unittest.TestCase):
         warnings = detect_warnings("MCP client failed to start: Auth required")
         self.assertIn(WarningKind.PROVIDER_WARNING_MCP_STARTUP, warnings)
 
+    def test_retry_after_hints(self) -> None:
+        now = 1_700_000_000.0
+        cases = {
+            "HTTP 429 Too Many Requests\nRetry-After: 30": 30.0,
+            "retry-after: Tue, 14 Nov 2023 22:14:50 GMT": 90.0,
+            '{"error":{"code":429,"details":[{"retryDelay":"39s"}]}}': 39.0,
+            "Quota exceeded. Please retry in 12.5s.": 12.5,
+            "Rate limit reached; try again in 1m30s": 90.0,
+            "retry after 500ms": 0.5,
+            "usage limit resets at 2023-11-14T22:23:20Z": 600.0,
+            "Claude AI usage limit reached|1700000600": 600.0,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertAlmostEqual(parse_retry_after(text, now=now), expected)
+        self.assertIsNone(parse_retry_after("Rate limit exceeded (429)", now=now))
+        self.assertIsNone(parse_retry_after("retry in 5 attempts", now=now))
+
 
 if __name__ == "__main__":
     unittest.main()
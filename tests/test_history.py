@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from runtime.history import percentile, provider_latency_percentiles, provider_latency_samples
+
+
+def _write_run(base: Path, task_id: str, provider_results: dict, mtime: float) -> None:
+    path = base / task_id / "run.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"task_id": task_id, "provider_results": provider_results}), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+class HistoryTests(unittest.TestCase):
+    def test_percentile_uses_nearest_rank(self) -> None:
+        values = [float(value) for value in range(1, 11)]
+        self.assertEqual(percentile(values, 0.9), 9.0)
+        self.assertEqual(percentile(values, 0.5), 5.0)
+        self.assertEqual(percentile([3.0], 0.9), 3.0)
+        with self.assertRaises(ValueError):
+            percentile([], 0.9)
+
+    def test_samples_only_count_successful_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            now = time.time()
+            _write_run(base, "t1", {"claude": {"success": True, "wall_clock_seconds": 12.5}}, now - 2)
+            _write_run(base, "t2", {"claude": {"success": False, "wall_clock_seconds": 900.0}}, now - 1)
+            _write_run(base, "t3", {"codex": {"success": True, "wall_clock_seconds": 30.0}}, now)
+            (base / "broken").mkdir()
+            (base / "broken" / "run.json").write_text("{not json", encoding="utf-8")
+
+            samples = provider_latency_samples(tmpdir)
+            self.assertEqual(samples, {"codex": [30.0], "claude": [12.5]})
+            self.assertEqual(provider_latency_samples(tmpdir, ["claude"]), {"claude": [12.5]})
+            self.assertEqual(provider_latency_samples(f"{tmpdir}/missing"), {})
+
+    def test_samples_skip_cache_hits_skips_and_hedge_wins(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            now = time.time()
+            _write_run(base, "t1", {"claude": {"success": True, "wall_clock_seconds": 12.5}}, now - 4)
+            cached = {"success": True, "wall_clock_seconds": 12.5, "cache": {"hit": True, "key": "k"}}
+            _write_run(base, "t2", {"claude": cached}, now - 3)
+            skipped = {"success": True, "reason": "no_changes", "wall_clock_seconds": 1.0}
+            _write_run(base, "t3", {"claude": skipped}, now - 2)
+            hedged = {"success": True, "wall_clock_seconds": 40.0, "hedge": {"winner": "codex"}}
+            _write_run(base, "t4", {"claude": hedged}, now - 1)
+            kept = {"success": True, "wall_clock_seconds": 20.0, "hedge": {"winner": "claude"}}
+            _write_run(base, "t5", {"claude": kept}, now)
+
+            self.assertEqual(provider_latency_samples(tmpdir), {"claude": [20.0, 12.5]})
+
+    def test_percentiles_require_min_samples(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            now = time.time()
+            for index in range(5):
+                _write_run(base, f"t{index}", {"claude": {"success": True, "wall_clock_seconds": 10.0 + index}}, now + index)
+            _write_run(base, "q", {"qwen": {"success": True, "wall_clock_seconds": 5.0}}, now)
+            result = provider_latency_percentiles(tmpdir, ["claude", "qwen"], 0.9, min_samples=5)
+            self.assertEqual(result, {"claude": 14.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from runtime.adapters.replay import ReplayProfile, ReplayRecording, replay_adapters
+from runtime.cli import main
+from runtime.config import ReviewPolicy
+from runtime.history_store import HISTORY_FILE_NAME, HistoryStore
+from runtime.review_engine import ReviewRequest, run_review
+
+
+def _result(success: bool, seconds: float, final_error: str | None = None, **extra: object) -> dict:
+    return {
+        "success": success,
+        "attempts": 1 if success else 3,
+        "final_error": final_error,
+        "cancel_reason": "",
+        "wall_clock_seconds": seconds,
+        "output_text": "x" * 10,
+        **extra,
+    }
+
+
+class HistoryStoreTests(unittest.TestCase):
+    def test_stats_report_percentiles_of_successful_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = HistoryStore(Path(tmpdir) / ".mco" / HISTORY_FILE_NAME)
+            self.assertEqual(store.provider_stats(), {})
+            for index in range(1, 101):
+                store.record(
+                    f"task-{index}",
+                    "review",
+                    {
+                        "codex": _result(True, float(index), token_usage={"total_tokens": 1000 + index}),
+                        "gemini": _result(index % 4 != 0, 20.0, None if index % 4 else "retryable_timeout"),
+                    },
+                    recorded_at=1000.0 + index,
+                )
+            stats = store.provider_stats()
+            recent = store.provider_stats(["codex"], window=10)
+            since = store.provider_stats(["gemini"], since=1091.0)
+
+        codex = stats["codex"]
+        self.assertEqual(codex["runs"], 100)
+        self.assertEqual(codex["wall_clock_seconds"], {"p50": 50.0, "p95": 95.0, "p99": 99.0})
+        self.assertEqual(codex["output_bytes_p50"], 10)
+        self.assertEqual(codex["total_tokens_p50"], 1050)
+        gemini = stats["gemini"]
+        self.assertEqual((gemini["runs"], gemini["successes"], gemini["success_rate"]), (100, 75, 0.75))
+        self.assertEqual(gemini["mean_attempts"], 1.5)
+        self.assertEqual(gemini["errors"], {"retryable_timeout": 25})
+        self.assertIsNone(gemini["total_tokens_p50"])
+        self.assertEqual(list(recent), ["codex"])
+        self.assertEqual(recent["codex"]["wall_clock_seconds"]["p50"], 95.0)
+        self.assertEqual(since["gemini"]["runs"], 10)
+
+    def test_review_records_history_and_stats_command_reports_it(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout='{"findings":[]}'),), seed=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            for record_history in (True, True, False):
+                request = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude", "codex"],  # type: ignore[list-item]
+                    artifact_base=artifact_base,
+                    policy=ReviewPolicy(timeout_seconds=3, max_retries=0, record_history=record_history),
+                )
+                run_review(request, adapters=replay_adapters(["claude", "codex"], profile))
+
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                exit_code = main(["stats", "--artifact-base", artifact_base, "--json"])
+            payload = json.loads(stdout.getvalue())
+            text = io.StringIO()
+            with contextlib.redirect_stdout(text):
+                main(["stats", "--artifact-base", artifact_base, "--providers", "codex"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(payload["command"], "stats")
+        self.assertEqual(sorted(payload["providers"]), ["claude", "codex"])
+        self.assertEqual(payload["providers"]["claude"]["runs"], 2)
+        self.assertEqual(payload["providers"]["claude"]["success_rate"], 1.0)
+        self.assertIn("- codex: runs=2", text.getvalue())
+        self.assertNotIn("claude", text.getvalue())
+
+    def test_cache_hits_and_skipped_providers_are_not_recorded(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout='{"findings":[]}'),), seed=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            store = HistoryStore(Path(artifact_base) / ".mco" / HISTORY_FILE_NAME)
+            request = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=artifact_base,
+                policy=ReviewPolicy(
+                    timeout_seconds=3, max_retries=0, record_history=True, result_cache_ttl_seconds=3600
+                ),
+            )
+            run_review(request, adapters=replay_adapters(["claude"], profile))
+            before = store.provider_stats()
+            cached = run_review(request, adapters=replay_adapters(["claude"], profile))
+            after = store.provider_stats()
+            skipped = store.record(
+                "task-skipped",
+                "review",
+                {
+                    "claude": {"success": False, "reason": "circuit_open"},
+                    "codex": {"success": True, "reason": "no_changes", "findings_count": 0},
+                },
+            )
+
+        self.assertIn("cache", cached.provider_results["claude"])
+        self.assertEqual(before["claude"]["runs"], 1)
+        self.assertEqual(after, before)
+        self.assertEqual(skipped, 0)
+
+    def test_runs_cancelled_by_an_early_exit_are_not_recorded(self) -> None:
+        fast = ReplayProfile(recordings=(ReplayRecording(stdout='{"findings":[]}'),), seed=1)
+        slow = ReplayProfile(recordings=(ReplayRecording(stdout='{"findings":[]}'),), latency_seconds=30.0, seed=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            store = HistoryStore(Path(artifact_base) / ".mco" / HISTORY_FILE_NAME)
+            request = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "codex"],  # type: ignore[list-item]
+                artifact_base=artifact_base,
+                policy=ReviewPolicy(timeout_seconds=60, max_retries=0, record_history=True, quorum=1),
+            )
+            adapters = {**replay_adapters(["claude"], fast), **replay_adapters(["codex"], slow)}
+            result = run_review(request, adapters=adapters)
+            stats = store.provider_stats()
+            recorded = store.record(
+                "task-fail-fast",
+                "review",
+                {"claude": _result(False, 2.0, "cancelled", cancel_reason="fail_fast")},
+            )
+
+        self.assertEqual(result.provider_results["codex"].get("cancel_reason"), "quorum")
+        self.assertEqual(sorted(stats), ["claude"])
+        self.assertEqual(stats["claude"]["success_rate"], 1.0)
+        self.assertEqual(recorded, 0)
+
+    def test_stats_command_rejects_bad_window(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["stats", "--window", "0"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
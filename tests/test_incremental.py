@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from runtime.incremental import finding_file, incremental_index_path, plan_incremental, save_incremental_index
+
+
+def _finding(file_name: str) -> dict:
+    return {"title": f"issue in {file_name}", "evidence": {"file": file_name, "line": 1, "snippet": "x"}}
+
+
+class IncrementalTests(unittest.TestCase):
+    def test_finding_file_is_repo_relative(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual(finding_file(_finding("./src/a.py"), tmpdir), "src/a.py")
+            self.assertEqual(finding_file(_finding(f"{tmpdir}/src/a.py"), tmpdir), "src/a.py")
+            self.assertEqual(finding_file(_finding("/elsewhere/a.py"), tmpdir), "")
+            self.assertEqual(finding_file({"title": "no evidence"}, tmpdir), "")
+
+    def test_plan_tracks_changed_deleted_and_carried_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ("a.py", "b.py", "c.py"):
+                (root / name).write_text(f"{name}\n", encoding="utf-8")
+            index_path = incremental_index_path(f"{tmpdir}/artifacts", tmpdir, "review", ["claude"], ["."])
+
+            first = plan_incremental(index_path, tmpdir, ["."], exclude=[f"{tmpdir}/artifacts"])
+            self.assertFalse(first.has_baseline)
+            self.assertEqual(first.changed_files, ["a.py", "b.py", "c.py"])
+            save_incremental_index(first, [_finding("a.py"), _finding("b.py"), _finding("c.py")])
+
+            (root / "b.py").write_text("changed\n", encoding="utf-8")
+            (root / "c.py").unlink()
+            second = plan_incremental(index_path, tmpdir, ["."], exclude=[f"{tmpdir}/artifacts"])
+            self.assertTrue(second.has_baseline)
+            self.assertEqual(second.changed_files, ["b.py"])
+            self.assertEqual(second.deleted_files, ["c.py"])
+            self.assertEqual([item["evidence"]["file"] for item in second.carried_findings], ["a.py"])
+            self.assertFalse(second.unchanged)
+
+    def test_index_path_depends_on_review_identity(self) -> None:
+        def path(prompt: str, providers: list) -> Path:
+            return incremental_index_path("/tmp/artifacts", "/repo", prompt, providers, ["src"])
+
+        base = path("review", ["claude", "codex"])
+        self.assertEqual(base, path("review", ["codex", "claude"]))
+        self.assertNotEqual(base, path("other", ["claude", "codex"]))
+        self.assertNotEqual(base, path("review", ["claude"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import unittest
+from unittest.mock import patch
 
 from runtime.adapters.parsing import (
+    JsonFragmentScanner,
+    ParsedOutput,
+    StreamingOutputParser,
+    _FAST_PATH_FAILURE_BUDGET,
     _append_text_candidate,
+    _decode_json_fragments,
+    extract_json_payloads,
     extract_final_text_from_output,
     extract_token_usage_from_output,
     inspect_contract_output,
+    normalize_findings_from_text,
 )
+from runtime.contracts import NormalizeContext
 
 
 class ParsingContractTests(unittest.TestCase):
@@ -29,6 +38,126 @@ class ParsingContractTests(unittest.TestCase):
         _append_text_candidate(candidates, seen, "最终回答")
         self.assertEqual(candidates, ["最终回答"])
 
+    def test_decode_json_fragments_skips_invalid_and_truncated_candidates(self) -> None:
+        text = 'noise { not json [1, 2] {"a": {"b": [3]}} trailing {"cut": "{[{['
+        self.assertEqual(_decode_json_fragments(text), [[1, 2], {"a": {"b": [3]}}])
+
+    def test_decode_json_fragments_recovers_nested_value_from_broken_envelope(self) -> None:
+        text = '{"event": {"findings": []}, oops}'
+        self.assertEqual(_decode_json_fragments(text), [{"findings": []}])
+
+    def test_scanner_holds_back_value_split_across_chunks(self) -> None:
+        scanner = JsonFragmentScanner()
+        self.assertEqual(scanner.feed('log {"type":"res'), [])
+        self.assertEqual(scanner.feed('ult","text":"a\\'), [])
+        fragments = scanner.feed('n"}\n[1]')
+        self.assertEqual([item.value for item in fragments], [{"type": "result", "text": "a\n"}, [1]])
+        self.assertEqual((fragments[0].start, fragments[0].end), (4, 34))
+        self.assertEqual(scanner.close(), [])
+
+    def test_scanner_decodes_only_each_candidates_own_span(self) -> None:
+        # Every line holds candidates that never decode (an unterminated string, a missing colon);
+        # decoding them against the whole buffer made this quadratic, so count the decoder's input.
+        # In-place decodes are only tried until the fast-path failure budget runs out.
+        def decoded_chars(text: str) -> int:
+            scanner = JsonFragmentScanner()
+            decode = scanner._decoder.raw_decode
+            decode_in_place = scanner._decode_in_place
+            seen = []
+            in_place = []
+            inside = [False]
+
+            def counting(doc: str, idx: int = 0):  # type: ignore[no-untyped-def]
+                if not inside[0]:
+                    seen.append(len(doc) - idx)
+                return decode(doc, idx)
+
+            def counting_in_place(doc: str, start: int):  # type: ignore[no-untyped-def]
+                inside[0] = True
+                try:
+                    fragment = decode_in_place(doc, start)
+                finally:
+                    inside[0] = False
+                in_place.append(fragment)
+                return fragment
+
+            with patch.object(scanner._decoder, "raw_decode", counting), patch.object(
+                scanner, "_decode_in_place", counting_in_place
+            ):
+                self.assertEqual(scanner.feed(text, final=True), [])
+            self.assertEqual(in_place, [None] * _FAST_PATH_FAILURE_BUDGET)
+            return sum(seen)
+
+        line = '{"a": [1, {"b": "x}\n{"c" 1}\n'
+        small, large = decoded_chars(line * 2000), decoded_chars(line * 8000)
+        self.assertLessEqual(large, 4 * small + len(line))
+        self.assertLessEqual(large, 2 * len(line) * 8000)
+
+    def test_scanner_decodes_well_formed_candidates_without_bracket_matching(self) -> None:
+        scanner = JsonFragmentScanner()
+        text = 'Done.\n{"type": "event", "text": "{["}\n[1, {"a": null}]\n'
+        with patch.object(scanner, "_match_span", side_effect=AssertionError("bracket matched")):
+            fragments = scanner.feed(text, final=True)
+        self.assertEqual(
+            [fragment.value for fragment in fragments], [{"type": "event", "text": "{["}, [1, {"a": None}]]
+        )
+        self.assertEqual(text[fragments[1].start : fragments[1].end], '[1, {"a": null}]')
+
+    def test_extract_json_payloads_orders_whole_text_before_line_recovery(self) -> None:
+        text = '[\n{"a": 1}\n]\n```json\n{"b": [2]\n```\n{"type": "done"}\n{"type": "done"}'
+        self.assertEqual(
+            extract_json_payloads(text),
+            [[{"a": 1}], [2], {"type": "done"}, {"a": 1}],
+        )
+
+    def test_extract_json_payloads_merges_equal_values_spelled_differently(self) -> None:
+        text = '{"a":1,"b":2}\n{"b": 2, "a": 1}\n```json\n{ "a" : 1, "b" : 2 }\n```'
+        self.assertEqual(extract_json_payloads(text), [{"a": 1, "b": 2}])
+        self.assertEqual(inspect_contract_output('{"findings":[]}\n{"findings": []}')["candidate_count"], 1)
+
+    def test_contract_inspection_reuses_supplied_payloads(self) -> None:
+        text = '{"findings":[]}'
+        self.assertTrue(inspect_contract_output(text)["has_contract_envelope"])
+        self.assertFalse(inspect_contract_output(text, payloads=[])["has_contract_envelope"])
+        self.assertEqual(extract_final_text_from_output("raw answer", payloads=[{"type": "result", "result": "Shared parse result."}]), "Shared parse result.")
+
+    def test_parsed_output_parses_once_for_all_consumers(self) -> None:
+        text = ParsedOutput(
+            '{"type":"result","result":"Reviewed the module.","usage":{"input_tokens":10,"output_tokens":5}}\n'
+            '{"findings":[]}'
+        )
+        with patch("runtime.adapters.parsing.extract_json_payloads", wraps=extract_json_payloads) as spy:
+            info = inspect_contract_output(text)
+            final_text = extract_final_text_from_output(text)
+            usage = extract_token_usage_from_output(text)
+            findings = normalize_findings_from_text(
+                text,
+                NormalizeContext(task_id="t", provider="claude", repo_root=".", raw_ref="raw/claude.stdout.log"),
+                "claude",
+            )
+        self.assertEqual(spy.call_count, 1)
+        self.assertTrue(info["parse_ok"])
+        self.assertEqual(final_text, "Reviewed the module.")
+        self.assertEqual(usage, {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15})
+        self.assertEqual(findings, [])
+        self.assertEqual(text, str(text))
+
+    def test_streaming_parser_matches_full_parse(self) -> None:
+        text = (
+            '{"type":"item.completed","item":{"type":"agent_message","text":"```json\\n{\\"findings\\":[]}\\n```"}}\n'
+            'progress { not json\n'
+            '{"type":"turn.completed","usage":{"input_tokens":3,"output_tokens":2}}'
+        )
+        parser = StreamingOutputParser()
+        completed = []
+        for index in range(0, len(text), 7):
+            completed.extend(parser.feed(text[index:index + 7]))
+        output = parser.finish()
+        self.assertEqual(str(output), text)
+        self.assertEqual(completed[0].value["type"], "item.completed")
+        self.assertEqual(output.payloads, extract_json_payloads(text))
+        self.assertTrue(output.contract_info["parse_ok"])
+
     def test_extract_final_text_from_plain_text(self) -> None:
         text = "This is the final answer."
         self.assertEqual(extract_final_text_from_output(text), text)
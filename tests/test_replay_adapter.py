@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from runtime.adapters.replay import ReplayAdapter, ReplayProfile, ReplayRecording, load_replay_corpus, replay_adapters
+from runtime.config import ReviewPolicy
+from runtime.review_engine import ReviewRequest, run_review, run_review_async
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+_FINDING_OUTPUT = (
+    '{"findings":[{"finding_id":"f1","severity":"high","category":"bug","title":"Replayed issue",'
+    '"evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+    '"confidence":0.8,"fingerprint":"fp-replay"}]}'
+)
+
+
+def _request(tmpdir: str, providers: list, **policy: object) -> ReviewRequest:
+    return ReviewRequest(
+        repo_root=tmpdir,
+        prompt="review",
+        providers=providers,  # type: ignore[arg-type]
+        artifact_base=f"{tmpdir}/artifacts",
+        policy=ReviewPolicy(timeout_seconds=3, max_retries=0, **policy),  # type: ignore[arg-type]
+    )
+
+
+class ReplayAdapterTests(unittest.TestCase):
+    def test_replayed_output_is_reviewed_like_provider_output(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), latency_seconds=0.05, seed=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapters = replay_adapters(["claude", "codex"], profile)
+            result = run_review(_request(tmpdir, ["claude", "codex"]), adapters=adapters)
+            stdout_log = Path(result.artifact_root or "") / "raw" / "claude.stdout.log"
+            self.assertEqual(stdout_log.read_text(encoding="utf-8"), _FINDING_OUTPUT)
+        self.assertEqual(result.decision, "ESCALATE")
+        self.assertEqual(len(result.findings), 1)
+        self.assertEqual(sorted(result.findings[0]["detected_by"]), ["claude", "codex"])
+
+    def test_injected_failure_maps_to_error_kind(self) -> None:
+        profile = ReplayProfile(failure_rates={"retryable_rate_limit": 1.0})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = run_review(_request(tmpdir, ["claude"]), adapters={"claude": ReplayAdapter("claude", profile)})
+        details = result.provider_results["claude"]
+        self.assertFalse(details["success"])
+        self.assertEqual(details["final_error"], "retryable_rate_limit")
+
+    def test_stalled_run_is_cancelled_by_stall_timeout(self) -> None:
+        profile = ReplayProfile(
+            recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), latency_seconds=0.2, stall_rate=1.0
+        )
+        adapter = ReplayAdapter("claude", profile)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            started = time.time()
+            result = run_review(_request(tmpdir, ["claude"], stall_timeout_seconds=1), adapters={"claude": adapter})
+        self.assertLess(time.time() - started, 5.0)
+        self.assertEqual(result.provider_results["claude"]["cancel_reason"], "stall_timeout")
+
+    def test_many_concurrent_async_reviews(self) -> None:
+        profile = ReplayProfile(
+            recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),),
+            latency="lognormal",
+            latency_seconds=0.05,
+            latency_spread=0.5,
+            stdout_padding_bytes=4096,
+            seed=7,
+        )
+
+        async def run_all(tmpdir: str) -> list:
+            reviews = []
+            for index in range(40):
+                req = replace(_request(tmpdir, ["claude", "codex"]), artifact_base=f"{tmpdir}/artifacts-{index}")
+                reviews.append(run_review_async(req, adapters=replay_adapters(["claude", "codex"], profile)))
+            return await asyncio.gather(*reviews)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = asyncio.run(run_all(tmpdir))
+        self.assertEqual(len(results), 40)
+        self.assertTrue(all(len(result.findings) == 1 for result in results))
+
+    def test_profile_rejects_impossible_rates(self) -> None:
+        with self.assertRaises(ValueError):
+            ReplayProfile(failure_rates={"not_a_kind": 0.1})
+        with self.assertRaises(ValueError):
+            ReplayProfile(failure_rates={"retryable_timeout": 0.7}, stall_rate=0.5)
+
+    def test_corpus_loads_probe_captures(self) -> None:
+        recordings = load_replay_corpus([str(REPO_ROOT / "docs" / "probes")])
+        self.assertGreater(len(recordings), 0)
+        self.assertTrue(all(item.source.endswith("stdout.log") for item in recordings))
+
+
+if __name__ == "__main__":
+    unittest.main()
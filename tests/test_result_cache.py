@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runtime.fingerprint import scope_content_hash, scope_file_hashes
+from runtime.result_cache import ResultCache, result_cache_key
+
+
+class ResultCacheTests(unittest.TestCase):
+    def test_put_then_get_round_trips(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(Path(tmpdir) / "results", ttl_seconds=60)
+            self.assertIsNone(cache.get("k1"))
+            cache.put("k1", {"success": True, "findings": []})
+            self.assertEqual(cache.get("k1"), {"success": True, "findings": []})
+
+    def test_expired_entries_are_dropped(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(Path(tmpdir), ttl_seconds=10)
+            cache.put("k1", {"success": True})
+            with patch("runtime.result_cache.time.time", return_value=time.time() + 11):
+                self.assertIsNone(cache.get("k1"))
+            self.assertFalse((Path(tmpdir) / "k1.json").exists())
+
+    def test_size_limit_evicts_least_recently_read(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            cache = ResultCache(root, ttl_seconds=3600, max_bytes=10_000)
+            payload = {"blob": "x" * 3000}
+            for index, key in enumerate(("a", "b", "c")):
+                cache.put(key, payload)
+                stamp = time.time() - 100 + index
+                os.utime(root / f"{key}.json", (stamp, stamp))
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("d", payload)
+            self.assertEqual(sorted(path.stem for path in root.glob("*.json")), ["a", "c", "d"])
+
+    def test_key_changes_with_each_component(self) -> None:
+        base = dict(provider="claude", provider_version="1.0", prompt="p", scope_hash="s", permissions={}, settings={})
+        keys = {
+            result_cache_key(**base),
+            result_cache_key(**dict(base, provider="codex")),
+            result_cache_key(**dict(base, provider_version="1.1")),
+            result_cache_key(**dict(base, prompt="q")),
+            result_cache_key(**dict(base, scope_hash="t")),
+            result_cache_key(**dict(base, permissions={"sandbox": "read-only"})),
+            result_cache_key(**dict(base, settings={"review_mode": False})),
+        }
+        self.assertEqual(len(keys), 7)
+        self.assertEqual(result_cache_key(**base), result_cache_key(**dict(base)))
+
+
+class FingerprintTests(unittest.TestCase):
+    def test_scope_hash_tracks_content_and_skips_excluded_dirs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "src").mkdir()
+            (root / "src" / "a.py").write_text("print(1)\n", encoding="utf-8")
+            (root / ".git").mkdir()
+            (root / ".git" / "HEAD").write_text("ref", encoding="utf-8")
+            (root / "reports").mkdir()
+            (root / "reports" / "run.json").write_text("{}", encoding="utf-8")
+
+            hashes = scope_file_hashes(tmpdir, ["."], exclude=[str(root / "reports")])
+            self.assertEqual(list(hashes), ["src/a.py"])
+            first = scope_content_hash(hashes)
+
+            (root / "reports" / "run.json").write_text('{"changed": true}', encoding="utf-8")
+            self.assertEqual(scope_content_hash(scope_file_hashes(tmpdir, ["."], exclude=[str(root / "reports")])), first)
+
+            (root / "src" / "a.py").write_text("print(2)\n", encoding="utf-8")
+            self.assertNotEqual(scope_content_hash(scope_file_hashes(tmpdir, ["."], exclude=[str(root / "reports")])), first)
+
+    def test_previous_entries_are_reused_when_stat_matches(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.txt"
+            path.write_text("one", encoding="utf-8")
+            first = scope_file_hashes(tmpdir, ["a.txt"])
+            stale = {"a.txt": dict(first["a.txt"], sha256="stale")}
+            self.assertEqual(scope_file_hashes(tmpdir, ["a.txt"], previous=stale)["a.txt"]["sha256"], "stale")
+
+
+if __name__ == "__main__":
+    unittest.main()
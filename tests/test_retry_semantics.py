@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import random
 import tempfile
 import unittest
 
 from runtime.orchestrator import OrchestratorRuntime, TaskStateMachine
 from runtime.retry import RetryPolicy
+from runtime.timing import PhaseRecorder
 from runtime.types import AttemptResult, ErrorKind, TaskState, WarningKind
 
 
@@ -27,6 +30,69 @@ class RetrySemanticsTests(unittest.TestCase):
         self.assertEqual(result.delays_seconds, [1.0])
         self.assertEqual(slept, [1.0])
 
+    def test_retry_backoff_is_recorded_as_a_phase(self) -> None:
+        ticks = iter([0.0, 1.5, 10.0, 12.5])
+        phases = PhaseRecorder(clock=lambda: next(ticks))
+        runtime = OrchestratorRuntime(
+            RetryPolicy(max_retries=2, base_delay_seconds=1.0, backoff_multiplier=2.0),
+            sleep_fn=lambda _delay: None,
+        )
+
+        def runner(attempt: int) -> AttemptResult:
+            if attempt < 3:
+                return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_RATE_LIMIT)
+            return AttemptResult(success=True, output={"ok": True})
+
+        result = runtime.run_with_retry("task-phases", "claude", runner, phases=phases)
+        self.assertTrue(result.success)
+        self.assertEqual(phases.as_dict(), {"retry_backoff": 4000})
+
+    def test_decorrelated_jitter_stays_within_bounds_and_cap(self) -> None:
+        slept: list[float] = []
+        runtime = OrchestratorRuntime(
+            RetryPolicy(max_retries=6, base_delay_seconds=1.0, max_delay_seconds=5.0, jitter=True),
+            sleep_fn=slept.append,
+            rng=random.Random(7),
+        )
+
+        def runner(_attempt: int) -> AttemptResult:
+            return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_TRANSIENT_NETWORK)
+
+        result = runtime.run_with_retry("task-jitter", "gemini", runner)
+        self.assertEqual(result.attempts, 7)
+        self.assertEqual(slept, result.delays_seconds)
+        previous = 1.0
+        for delay in slept:
+            self.assertGreaterEqual(delay, 1.0)
+            self.assertLessEqual(delay, min(5.0, previous * 3))
+            previous = delay
+        self.assertGreater(len(set(slept)), 1)
+
+    def test_retry_after_hint_replaces_backoff(self) -> None:
+        slept: list[float] = []
+        runtime = OrchestratorRuntime(RetryPolicy(max_retries=1, max_delay_seconds=60.0), sleep_fn=slept.append)
+
+        def runner(attempt: int) -> AttemptResult:
+            if attempt == 1:
+                return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_RATE_LIMIT, retry_after_seconds=42.0)
+            return AttemptResult(success=True, output={"ok": True})
+
+        result = runtime.run_with_retry("task-hint", "claude", runner)
+        self.assertTrue(result.success)
+        self.assertEqual(slept, [42.0])
+
+    def test_retry_after_beyond_cap_stops_retrying(self) -> None:
+        slept: list[float] = []
+        runtime = OrchestratorRuntime(RetryPolicy(max_retries=2, max_delay_seconds=60.0), sleep_fn=slept.append)
+
+        def runner(_attempt: int) -> AttemptResult:
+            return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_RATE_LIMIT, retry_after_seconds=3600.0)
+
+        result = runtime.run_with_retry("task-hint-cap", "codex", runner)
+        self.assertFalse(result.success)
+        self.assertEqual(result.attempts, 1)
+        self.assertEqual(slept, [])
+
     def test_retry_exhaustion(self) -> None:
         slept: list[float] = []
         runtime = OrchestratorRuntime(
@@ -44,6 +110,48 @@ class RetrySemanticsTests(unittest.TestCase):
         self.assertEqual(result.delays_seconds, [1.0, 2.0])
         self.assertEqual(slept, [1.0, 2.0])
 
+    def test_async_retry_then_success(self) -> None:
+        slept: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            slept.append(delay)
+
+        runtime = OrchestratorRuntime(
+            RetryPolicy(max_retries=2, base_delay_seconds=1.0, backoff_multiplier=2.0),
+            async_sleep_fn=record_sleep,
+        )
+
+        async def runner(attempt: int) -> AttemptResult:
+            if attempt < 3:
+                return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_TIMEOUT)
+            return AttemptResult(success=True, output={"ok": True})
+
+        result = asyncio.run(runtime.run_with_retry_async("task-async", "claude", runner))
+        self.assertTrue(result.success)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(result.delays_seconds, [1.0, 2.0])
+        self.assertEqual(slept, [1.0, 2.0])
+
+    def test_abort_ends_backoff_early_as_a_cancelled_run(self) -> None:
+        slept: list[float] = []
+        runtime = OrchestratorRuntime(
+            RetryPolicy(max_retries=2, base_delay_seconds=1.0, backoff_multiplier=2.0),
+            sleep_fn=slept.append,
+        )
+
+        def runner(_attempt: int) -> AttemptResult:
+            return AttemptResult(success=False, error_kind=ErrorKind.RETRYABLE_TIMEOUT)
+
+        def abort() -> str:
+            return "quorum" if len(slept) >= 3 else ""
+
+        result = runtime.run_with_retry("task-abort", "claude", runner, abort=abort)
+        self.assertFalse(result.success)
+        self.assertEqual(result.attempts, 1)
+        self.assertEqual(result.final_error, ErrorKind.CANCELLED)
+        self.assertEqual(result.output, {"cancel_reason": "quorum", "findings": []})
+        self.assertEqual(slept, [0.05, 0.05, 0.05])
+
     def test_non_retryable_no_retry(self) -> None:
         runtime = OrchestratorRuntime()
 
@@ -73,6 +181,14 @@ class RetrySemanticsTests(unittest.TestCase):
         self.assertEqual(runtime.evaluate_terminal_state({"claude": True, "codex": True}), TaskState.COMPLETED)
         self.assertEqual(runtime.evaluate_terminal_state({"claude": True, "codex": False}), TaskState.PARTIAL_SUCCESS)
         self.assertEqual(runtime.evaluate_terminal_state({"claude": False, "codex": False}), TaskState.FAILED)
+        self.assertEqual(
+            runtime.evaluate_terminal_state({"claude": True, "codex": False}, cancelled_providers=["codex"]),
+            TaskState.COMPLETED,
+        )
+        self.assertEqual(
+            runtime.evaluate_terminal_state({"claude": False, "codex": False}, cancelled_providers=["codex"]),
+            TaskState.FAILED,
+        )
 
     def test_expire_trigger(self) -> None:
         self.assertTrue(
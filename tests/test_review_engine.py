@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import tempfile
+import threading
 import time
 import unittest
+from unittest.mock import patch
 from dataclasses import dataclass
 from pathlib import Path
 
+from runtime import review_engine
+from runtime.adapters import parsing
 from runtime.adapters.parsing import normalize_findings_from_text
 from runtime.config import ReviewPolicy
 from runtime.contracts import CapabilitySet, NormalizeContext, ProviderPresence, TaskInput, TaskRunRef, TaskStatus
-from runtime.review_engine import ReviewRequest, run_review
+from runtime.orchestrator import ABORT_POLL_SECONDS
+from runtime.review_engine import ReviewRequest, run_review, run_review_async
+from runtime.types import ErrorKind
 
 
 @dataclass
@@ -98,6 +105,37 @@ class SequencedFakeAdapter(FakeAdapter):
         return super().run(input_task)
 
 
+class RateLimitedFakeAdapter(FakeAdapter):
+    """Fails its first run with a rate limit and a reset hint on stderr, then succeeds."""
+
+    def __init__(self, provider: str, raw_stdout: str, stderr: str) -> None:
+        super().__init__(provider, raw_stdout)
+        self._stderr = stderr
+
+    def run(self, input_task: TaskInput) -> TaskRunRef:
+        ref = super().run(input_task)
+        if self.runs == 1:
+            Path(ref.artifact_path, "raw", f"{self.id}.stderr.log").write_text(self._stderr, encoding="utf-8")
+        return ref
+
+    def poll(self, ref: TaskRunRef) -> TaskStatus:
+        status = super().poll(ref)
+        if self.runs > 1:
+            return status
+        return TaskStatus(
+            task_id=status.task_id,
+            provider=status.provider,
+            run_id=status.run_id,
+            attempt_state="FAILED",
+            completed=True,
+            heartbeat_at=status.heartbeat_at,
+            output_path=status.output_path,
+            error_kind=ErrorKind.RETRYABLE_RATE_LIMIT,
+            exit_code=1,
+            message="failed",
+        )
+
+
 class TimedFakeAdapter(FakeAdapter):
     def __init__(self, provider: str, raw_stdout: str, complete_after_seconds: float) -> None:
         super().__init__(provider, raw_stdout)
@@ -152,6 +190,22 @@ class ProgressTimedFakeAdapter(TimedFakeAdapter):
         return status
 
 
+class WaitableTimedFakeAdapter(TimedFakeAdapter):
+    def __init__(self, provider: str, raw_stdout: str, complete_after_seconds: float) -> None:
+        super().__init__(provider, raw_stdout, complete_after_seconds)
+        self.wait_calls = 0
+
+    def wait(self, ref: TaskRunRef, timeout_seconds: float) -> bool:
+        _ = ref
+        self.wait_calls += 1
+        remaining = self.complete_after_seconds - (time.time() - self.run_started_at)
+        if remaining <= timeout_seconds:
+            time.sleep(max(0.0, remaining))
+            return True
+        time.sleep(timeout_seconds)
+        return False
+
+
 class PermissionAwareFakeAdapter(FakeAdapter):
     def __init__(self, provider: str, raw_stdout: str, supported_keys: list[str]) -> None:
         super().__init__(provider, raw_stdout)
@@ -184,6 +238,30 @@ class UnavailableFakeAdapter(FakeAdapter):
         )
 
 
+class SlowDetectFakeAdapter(TimedFakeAdapter):
+    def __init__(self, provider: str, raw_stdout: str, complete_after_seconds: float, auth_ok: bool) -> None:
+        super().__init__(provider, raw_stdout, complete_after_seconds)
+        self.auth_ok = auth_ok
+        self.run_started = threading.Event()
+        self.started_before_detect_finished = False
+
+    def detect(self) -> ProviderPresence:
+        self.started_before_detect_finished = self.run_started.wait(timeout=5)
+        return ProviderPresence(
+            provider=self.id,
+            detected=True,
+            binary_path="/bin/fake",
+            version="1.0",
+            auth_ok=self.auth_ok,
+            reason="ok" if self.auth_ok else "auth_check_failed",
+        )
+
+    def run(self, input_task: TaskInput) -> TaskRunRef:
+        ref = super().run(input_task)
+        self.run_started.set()
+        return ref
+
+
 class ReviewEngineTests(unittest.TestCase):
     def test_review_with_findings_pass(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -528,6 +606,684 @@ class ReviewEngineTests(unittest.TestCase):
             self.assertEqual(result.decision, "PARTIAL")
             self.assertGreaterEqual(slow.cancel_calls, 1)
 
+    def test_completion_wait_finishes_without_poll_interval_slack(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = WaitableTimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=0.3)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=3,
+                    stall_timeout_seconds=30,
+                    poll_interval_seconds=10.0,
+                    max_retries=0,
+                    require_non_empty_findings=False,
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters={"claude": adapter}, review_mode=False)
+            self.assertLess(time.time() - started, 3.0)
+            self.assertEqual(result.terminal_state, "COMPLETED")
+            self.assertEqual(adapter.wait_calls, 1)
+
+    def test_phase_timings_break_down_provider_and_review_time(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = TimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=0.3)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, poll_interval_seconds=0.5, max_retries=0),
+            )
+            result = run_review(req, adapters={"claude": adapter}, review_mode=False)
+            phases = result.provider_results["claude"]["phase_timings_ms"]
+            self.assertEqual(list(phases), ["detect", "spawn", "model", "poll_slack", "parse", "artifacts"])
+            # Completion is only seen at the next blind poll, 0.5s after spawn; no output was written after spawn.
+            self.assertGreaterEqual(phases["model"] + phases["poll_slack"], 450)
+            self.assertGreater(phases["poll_slack"], 0)
+            run_payload = json.loads(Path(result.artifact_root or "", "run.json").read_text(encoding="utf-8"))
+            self.assertEqual(run_payload["provider_results"]["claude"]["phase_timings_ms"], phases)
+            self.assertEqual(
+                list(run_payload["phase_timings_ms"]), ["prepare", "providers", "aggregate", "synthesis", "finalize"]
+            )
+            self.assertEqual(result.phase_timings_ms, run_payload["phase_timings_ms"])
+
+    def test_rate_limit_retry_waits_for_reset_hint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = RateLimitedFakeAdapter("gemini", '{"findings":[]}', "429 Too Many Requests. Please retry in 42s.")
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["gemini"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=1),
+            )
+            slept: list[float] = []
+            with patch("runtime.orchestrator.time.sleep", side_effect=slept.append):
+                result = run_review(req, adapters={"gemini": adapter}, review_mode=False)
+        self.assertTrue(result.provider_results["gemini"]["success"])
+        self.assertEqual(adapter.runs, 2)
+        # The hint plus at most one base delay of jitter, slept in slices so an early exit can cut it short.
+        self.assertTrue(all(pause <= ABORT_POLL_SECONDS for pause in slept))
+        self.assertGreaterEqual(sum(slept), 42.0 - 1e-6)
+        self.assertLessEqual(sum(slept), 43.0 + 1e-6)
+
+    def test_completion_wait_still_enforces_stall_timeout(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = WaitableTimedFakeAdapter("claude", "", complete_after_seconds=30.0)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=1,
+                    stall_timeout_seconds=1,
+                    poll_interval_seconds=10.0,
+                    max_retries=0,
+                    require_non_empty_findings=False,
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters={"claude": adapter}, review_mode=False)
+            self.assertLess(time.time() - started, 5.0)
+            self.assertEqual(result.provider_results["claude"].get("cancel_reason"), "stall_timeout")
+            self.assertGreaterEqual(adapter.cancel_calls, 1)
+
+    def test_stream_parse_keeps_findings_of_stalled_provider(self) -> None:
+        raw = (
+            '{"findings":[{"finding_id":"f1","severity":"medium","category":"bug","title":"Partial issue",'
+            '"evidence":{"file":"runtime/cli.py","line":7,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.6,"fingerprint":"fp-partial"}]}\n{"type":"item.started"'
+        )
+        for stream_parse, expected_findings in ((True, 1), (False, 0)):
+            with self.subTest(stream_parse=stream_parse), tempfile.TemporaryDirectory() as tmpdir:
+                adapter = TimedFakeAdapter("claude", raw, complete_after_seconds=30.0)
+                req = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude"],  # type: ignore[list-item]
+                    artifact_base=f"{tmpdir}/artifacts",
+                    policy=ReviewPolicy(
+                        timeout_seconds=1,
+                        stall_timeout_seconds=1,
+                        poll_interval_seconds=0.05,
+                        max_retries=0,
+                        stream_parse=stream_parse,
+                    ),
+                )
+                result = run_review(req, adapters={"claude": adapter})
+                provider_result = result.provider_results["claude"]
+                self.assertEqual(provider_result.get("cancel_reason"), "stall_timeout")
+                self.assertFalse(provider_result.get("success"))
+                self.assertEqual(result.findings_count, expected_findings)
+                self.assertEqual(provider_result.get("parse_ok"), stream_parse)
+
+    def test_stream_parse_reports_findings_before_the_provider_finishes(self) -> None:
+        raw = (
+            '{"type":"item.completed","item":{"type":"agent_message","text":"{\\"findings\\":[{\\"finding_id\\":'
+            '\\"f1\\",\\"severity\\":\\"high\\",\\"category\\":\\"bug\\",\\"title\\":\\"Early issue\\",'
+            '\\"evidence\\":{\\"file\\":\\"runtime/cli.py\\",\\"line\\":7,\\"snippet\\":\\"x\\"},'
+            '\\"recommendation\\":\\"fix\\",\\"confidence\\":0.6,\\"fingerprint\\":\\"fp-early\\"}]}"}}\n'
+        )
+        for stream_parse, expected_kinds in (
+            (True, ["provider_started", "finding", "provider_finished", "decision"]),
+            (False, ["provider_started", "provider_finished", "finding", "decision"]),
+        ):
+            with self.subTest(stream_parse=stream_parse), tempfile.TemporaryDirectory() as tmpdir:
+                adapter = ProgressTimedFakeAdapter("codex", raw, complete_after_seconds=0.5, progress_chunk="\n")
+                req = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["codex"],  # type: ignore[list-item]
+                    artifact_base=f"{tmpdir}/artifacts",
+                    policy=ReviewPolicy(
+                        timeout_seconds=5,
+                        poll_interval_seconds=0.05,
+                        max_retries=0,
+                        stream_parse=stream_parse,
+                    ),
+                )
+                events: list[dict] = []
+                result = run_review(req, adapters={"codex": adapter}, on_event=events.append)
+                kinds = [event["event"] for event in events if event["event"] != "provider_progress"]
+                self.assertEqual(kinds, expected_kinds)
+                finding_event = next(event for event in events if event["event"] == "finding")
+                self.assertEqual(finding_event["provider"], "codex")
+                self.assertEqual(finding_event["finding"]["title"], "Early issue")
+                self.assertEqual(result.findings_count, 1)
+
+    def test_fail_fast_cancels_running_providers_after_critical_finding(self) -> None:
+        critical = (
+            '{"findings":[{"finding_id":"f1","severity":"critical","category":"security","title":"Injection",'
+            '"evidence":{"file":"runtime/cli.py","line":3,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.9,"fingerprint":"fp-critical"}]}'
+        )
+        codex_started = threading.Event()
+
+        class GatedAdapter(FakeAdapter):
+            def run(self, input_task: TaskInput) -> TaskRunRef:
+                # Report the critical finding only once codex is running, so it is cancelled mid-run.
+                self.saw_codex_start = codex_started.wait(5.0)
+                return super().run(input_task)
+
+        class StartedAdapter(TimedFakeAdapter):
+            def run(self, input_task: TaskInput) -> TaskRunRef:
+                ref = super().run(input_task)
+                codex_started.set()
+                return ref
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast = GatedAdapter("claude", critical)
+            slow = StartedAdapter("codex", '{"findings":[]}', complete_after_seconds=30.0)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "codex"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    stall_timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=2,
+                    fail_fast=True,
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters={"claude": fast, "codex": slow})
+            self.assertLess(time.time() - started, 5.0)
+            self.assertEqual(result.decision, "FAIL")
+            self.assertEqual(
+                result.early_exit,
+                {"reason": "fail_fast", "trigger_provider": "claude", "cancelled_providers": ["codex"]},
+            )
+            codex_result = result.provider_results["codex"]
+            self.assertEqual(codex_result.get("cancel_reason"), "fail_fast")
+            self.assertEqual(codex_result.get("final_error"), "cancelled")
+            self.assertEqual(codex_result.get("attempts"), 1)
+            self.assertTrue(fast.saw_codex_start)
+            self.assertGreaterEqual(slow.cancel_calls, 1)
+            run_payload = json.loads(Path(result.artifact_root or "", "run.json").read_text(encoding="utf-8"))
+            self.assertEqual(run_payload["early_exit"]["cancelled_providers"], ["codex"])
+
+    def test_fail_fast_skips_queued_providers(self) -> None:
+        critical = (
+            '{"findings":[{"finding_id":"f1","severity":"critical","category":"bug","title":"Crash",'
+            '"evidence":{"file":"runtime/cli.py","line":3,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.9,"fingerprint":"fp-crash"}]}'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude = FakeAdapter("claude", critical)
+            qwen = FakeAdapter("qwen", '{"findings":[]}')
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, max_provider_parallelism=1, fail_fast=True),
+            )
+            result = run_review(req, adapters={"claude": claude, "qwen": qwen})
+        self.assertEqual(qwen.runs, 0)
+        qwen_result = result.provider_results["qwen"]
+        self.assertEqual(qwen_result.get("reason"), "cancelled")
+        self.assertEqual(
+            (qwen_result.get("final_error"), qwen_result.get("attempts"), qwen_result.get("cancel_reason")),
+            ("cancelled", 0, "fail_fast"),
+        )
+        self.assertEqual(result.early_exit["cancelled_providers"], ["qwen"])  # type: ignore[index]
+
+    def test_quorum_returns_after_k_successes_and_cancels_the_rest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapters = {
+                "claude": FakeAdapter("claude", '{"findings":[]}'),
+                "qwen": FakeAdapter("qwen", '{"findings":[]}'),
+                "codex": TimedFakeAdapter("codex", '{"findings":[]}', complete_after_seconds=30.0),
+            }
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude", "codex", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    stall_timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=1,
+                    require_non_empty_findings=False,
+                    quorum=2,
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters=adapters, review_mode=False)
+            self.assertLess(time.time() - started, 5.0)
+        self.assertEqual(result.terminal_state, "COMPLETED")
+        self.assertEqual(result.decision, "PASS")
+        self.assertEqual(result.early_exit["reason"], "quorum")  # type: ignore[index]
+        self.assertEqual(result.early_exit["cancelled_providers"], ["codex"])  # type: ignore[index]
+        self.assertEqual(result.provider_results["codex"].get("final_error"), "cancelled")
+        self.assertGreaterEqual(adapters["codex"].cancel_calls, 1)  # type: ignore[attr-defined]
+
+    def test_quorum_cuts_short_a_provider_backing_off_between_retries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude", "gemini"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=1,
+                    require_non_empty_findings=False,
+                    quorum=1,
+                ),
+            )
+            for name in ("sync", "async"):
+                with self.subTest(runner=name):
+                    # gemini is rate limited with a 60s reset hint, so it is backing off when claude meets the quorum.
+                    claude = TimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=0.3)
+                    gemini = RateLimitedFakeAdapter(
+                        "gemini", '{"findings":[]}', "429 Too Many Requests. Please retry in 60s."
+                    )
+                    adapters = {"claude": claude, "gemini": gemini}
+                    started = time.time()
+                    if name == "sync":
+                        result = run_review(req, adapters=adapters, review_mode=False)
+                    else:
+                        result = asyncio.run(run_review_async(req, adapters=adapters, review_mode=False))
+                    self.assertLess(time.time() - started, 5.0)
+                    details = result.provider_results["gemini"]
+                    self.assertEqual(result.terminal_state, "COMPLETED")
+                    self.assertEqual(result.early_exit["cancelled_providers"], ["gemini"])  # type: ignore[index]
+                    self.assertEqual((details["final_error"], details["cancel_reason"]), ("cancelled", "quorum"))
+                    self.assertEqual((details["attempts"], gemini.runs), (1, 1))
+
+    def test_quorum_larger_than_provider_count_waits_for_all(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, require_non_empty_findings=False, quorum=3),
+            )
+            adapters = {"claude": FakeAdapter("claude", '{"findings":[]}'), "qwen": FakeAdapter("qwen", '{"findings":[]}')}
+            result = run_review(req, adapters=adapters)
+        self.assertEqual(result.terminal_state, "COMPLETED")
+        self.assertEqual(result.parse_success_count, 2)
+        self.assertIsNone(result.early_exit)
+
+    def _seed_latency_history(
+        self, artifact_base: str, provider: str, seconds: float, runs: int = 5, mode: str = "review"
+    ) -> None:
+        for index in range(runs):
+            run_path = Path(artifact_base) / f"history-{provider}-{index}" / "run.json"
+            run_path.parent.mkdir(parents=True, exist_ok=True)
+            run_path.write_text(
+                json.dumps(
+                    {"mode": mode, "provider_results": {provider: {"success": True, "wall_clock_seconds": seconds}}}
+                ),
+                encoding="utf-8",
+            )
+
+    def test_hedge_takes_backup_result_when_primary_outlives_p90(self) -> None:
+        backup_raw = (
+            '{"findings":[{"finding_id":"f1","severity":"medium","category":"bug","title":"Backup issue",'
+            '"evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.5,"fingerprint":"fp-backup"}]}'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            self._seed_latency_history(artifact_base, "claude", 0.2)
+            primary = TimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=30.0)
+            backup = FakeAdapter("gemini", backup_raw)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=artifact_base,
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    stall_timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=0,
+                    hedge_providers={"claude": "gemini"},
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters={"claude": primary, "gemini": backup})
+            self.assertLess(time.time() - started, 5.0)
+            claude_result = result.provider_results["claude"]
+            self.assertTrue(claude_result.get("success"))
+            hedge = claude_result.get("hedge")
+            self.assertEqual(hedge["backup_provider"], "gemini")  # type: ignore[index]
+            self.assertEqual(hedge["winner"], "gemini")  # type: ignore[index]
+            self.assertEqual(hedge["threshold_seconds"], 0.2)  # type: ignore[index]
+            self.assertEqual(result.findings_count, 1)
+            self.assertGreaterEqual(primary.cancel_calls, 1)
+            self.assertTrue(Path(result.artifact_root or "", "hedge", "claude").is_dir())
+
+    def test_hedge_needs_latency_history(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            primary = TimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=0.3)
+            backup = FakeAdapter("gemini", '{"findings":[]}')
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=3,
+                    poll_interval_seconds=0.05,
+                    max_retries=0,
+                    require_non_empty_findings=False,
+                    hedge_providers={"claude": "gemini"},
+                ),
+            )
+            result = run_review(req, adapters={"claude": primary, "gemini": backup})
+        self.assertEqual(backup.runs, 0)
+        self.assertNotIn("hedge", result.provider_results["claude"])
+
+    def test_adaptive_timeouts_cancel_a_hung_provider_from_latency_history(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            self._seed_latency_history(artifact_base, "claude", 0.5, runs=10)
+            self._seed_latency_history(artifact_base, "codex", 0.5, runs=9)
+
+            def review(**policy: object) -> dict:
+                req = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude", "codex"],  # type: ignore[list-item]
+                    artifact_base=artifact_base,
+                    policy=ReviewPolicy(
+                        timeout_seconds=30,
+                        poll_interval_seconds=0.05,
+                        max_retries=0,
+                        adaptive_timeouts=True,
+                        adaptive_timeout_floor_seconds=1,
+                        **policy,  # type: ignore[arg-type]
+                    ),
+                )
+                adapters = {
+                    "claude": TimedFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=30.0),
+                    "codex": FakeAdapter("codex", '{"findings":[]}'),
+                }
+                return run_review(req, adapters=adapters).provider_results
+
+            started = time.time()
+            results = review()
+            self.assertLess(time.time() - started, 5.0)
+            overridden = review(provider_timeouts={"claude": 120})
+
+        claude = results["claude"]
+        self.assertFalse(claude["success"])
+        self.assertEqual(claude["cancel_reason"], "stall_timeout")
+        self.assertEqual(claude["adaptive_timeouts"], {"stall_timeout_seconds": 1, "hard_timeout_seconds": 2})
+        # Nine runs are below the minimum sample count, so codex keeps the static timeouts.
+        self.assertNotIn("adaptive_timeouts", results["codex"])
+        self.assertEqual(
+            overridden["claude"]["adaptive_timeouts"], {"stall_timeout_seconds": 120, "hard_timeout_seconds": 2}
+        )
+        self.assertEqual(overridden["claude"]["cancel_reason"], "hard_deadline_exceeded")
+
+    def test_adaptive_timeouts_add_no_hard_deadline_in_run_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            self._seed_latency_history(artifact_base, "claude", 0.5, runs=10, mode="run")
+            # Keeps writing, so only a hard deadline (learned: 2s) could cut the 2.5s run short.
+            adapter = ProgressTimedFakeAdapter("claude", "done", complete_after_seconds=2.5)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=artifact_base,
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=0,
+                    adaptive_timeouts=True,
+                    adaptive_timeout_floor_seconds=1,
+                ),
+            )
+            claude = run_review(req, adapters={"claude": adapter}, review_mode=False).provider_results["claude"]
+
+        self.assertTrue(claude["success"])
+        self.assertEqual(claude["adaptive_timeouts"], {"stall_timeout_seconds": 1, "hard_timeout_seconds": 0})
+
+    def test_synthesis_keeps_static_timeouts_under_adaptive_timeouts(self) -> None:
+        class SlowSynthesisAdapter(TimedFakeAdapter):
+            def run(self, input_task: TaskInput) -> TaskRunRef:
+                # The provider's own run matches its history; the longer synthesis prompt takes a while.
+                self.complete_after_seconds = 0.0 if self.runs == 0 else 1.5
+                return super().run(input_task)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+            self._seed_latency_history(artifact_base, "claude", 0.5, runs=10, mode="run")
+            claude = SlowSynthesisAdapter("claude", "## Consensus\nAligned.", complete_after_seconds=0.0)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="summarize",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=artifact_base,
+                policy=ReviewPolicy(
+                    timeout_seconds=30,
+                    poll_interval_seconds=0.05,
+                    max_retries=0,
+                    require_non_empty_findings=False,
+                    adaptive_timeouts=True,
+                    adaptive_timeout_floor_seconds=1,
+                ),
+                synthesize=True,
+            )
+            result = run_review(req, adapters={"claude": claude}, review_mode=False)
+
+        self.assertEqual(result.provider_results["claude"]["adaptive_timeouts"]["stall_timeout_seconds"], 1)
+        self.assertEqual(claude.runs, 2)
+        self.assertEqual((result.synthesis or {}).get("reason"), "ok")
+
+    def test_review_skips_provider_with_open_breaker(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_base = f"{tmpdir}/artifacts"
+
+            def review(adapter: FakeAdapter) -> dict:
+                req = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude"],  # type: ignore[list-item]
+                    artifact_base=artifact_base,
+                    policy=ReviewPolicy(
+                        timeout_seconds=3,
+                        max_retries=0,
+                        require_non_empty_findings=False,
+                        circuit_breaker_threshold=2,
+                        circuit_breaker_cooldown_seconds=300,
+                    ),
+                )
+                return run_review(req, adapters={"claude": adapter}).provider_results["claude"]
+
+            detect_calls = []
+
+            class BrokenAuthAdapter(UnavailableFakeAdapter):
+                def detect(self) -> ProviderPresence:
+                    detect_calls.append(1)
+                    return super().detect()
+
+            broken = BrokenAuthAdapter("claude", "auth_check_failed", "/bin/fake", "1.0")
+            reasons = [str(review(broken)["reason"]) for _ in range(3)]
+            skipped = review(broken)
+            self.assertEqual(len(detect_calls), 2)
+
+            breakers_path = Path(artifact_base) / ".mco" / "breakers.json"
+            breakers = json.loads(breakers_path.read_text(encoding="utf-8"))
+            breakers["claude"]["opened_at"] -= 301
+            breakers_path.write_text(json.dumps(breakers), encoding="utf-8")
+            healthy = FakeAdapter("claude", '{"findings":[]}')
+            probe = review(healthy)
+            after = json.loads(breakers_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(reasons, ["provider_unavailable", "provider_unavailable", "circuit_open"])
+        self.assertFalse(skipped["success"])
+        self.assertEqual(skipped["circuit"]["state"], "open")
+        self.assertEqual(skipped["circuit"]["last_error"], "non_retryable_auth")
+        self.assertGreater(skipped["circuit"]["retry_after_seconds"], 0)
+        self.assertTrue(probe["success"])
+        self.assertEqual(healthy.runs, 1)
+        self.assertEqual(after["claude"], {"state": "closed", "consecutive_failures": 0})
+
+    def test_result_cache_reuses_outcome_until_scope_changes(self) -> None:
+        raw = (
+            '{"findings":[{"finding_id":"f1","severity":"high","category":"bug","title":"Cached issue",'
+            '"evidence":{"file":"src/a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.8,"fingerprint":"fp-cached"}]}'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "src" / "a.py"
+            source.parent.mkdir()
+            source.write_text("x = 1\n", encoding="utf-8")
+            adapter = FakeAdapter("claude", raw)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, result_cache_ttl_seconds=3600),
+            )
+            first = run_review(req, adapters={"claude": adapter})
+            second = run_review(req, adapters={"claude": adapter})
+            self.assertEqual(adapter.runs, 1)
+            self.assertEqual(second.findings, first.findings)
+            self.assertEqual(second.decision, first.decision)
+            self.assertTrue(second.provider_results["claude"]["cache"]["hit"])  # type: ignore[index]
+            self.assertNotIn("cache", first.provider_results["claude"])
+
+            source.write_text("x = 2\n", encoding="utf-8")
+            run_review(req, adapters={"claude": adapter})
+            self.assertEqual(adapter.runs, 2)
+
+    def test_incremental_review_narrows_scope_and_carries_findings(self) -> None:
+        def finding(file_name: str, title: str) -> str:
+            return (
+                f'{{"finding_id":"{title}","severity":"high","category":"bug","title":"{title}",'
+                f'"evidence":{{"file":"{file_name}","line":1,"snippet":"x"}},"recommendation":"fix",'
+                f'"confidence":0.8,"fingerprint":"fp-{title}"}}'
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "src"
+            src.mkdir()
+            (src / "a.py").write_text("a = 1\n", encoding="utf-8")
+            (src / "b.py").write_text("b = 1\n", encoding="utf-8")
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                target_paths=["src"],
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, incremental=True),
+            )
+            full = FakeAdapter(
+                "claude", '{"findings":[' + finding("src/a.py", "Issue A") + "," + finding("src/b.py", "Issue B") + "]}"
+            )
+            first = run_review(req, adapters={"claude": full})
+            self.assertEqual(len(first.findings), 2)
+            self.assertFalse(first.incremental["baseline"])  # type: ignore[index]
+            self.assertIn("Scope: src\n", full.received_prompts[0])
+
+            (src / "b.py").write_text("b = 2\n", encoding="utf-8")
+            narrowed = FakeAdapter("claude", '{"findings":[' + finding("src/b.py", "Issue B2") + "]}")
+            second = run_review(req, adapters={"claude": narrowed})
+            self.assertIn("Scope: src/b.py\n", narrowed.received_prompts[0])
+            self.assertEqual(second.incremental["changed_files"], ["src/b.py"])  # type: ignore[index]
+            by_title = {item["title"]: item for item in second.findings}
+            self.assertEqual(sorted(by_title), ["Issue A", "Issue B2"])
+            self.assertTrue(by_title["Issue A"]["carried_over"])
+            self.assertNotIn("carried_over", by_title["Issue B2"])
+            findings_json = json.loads((Path(second.artifact_root or "") / "findings.json").read_text(encoding="utf-8"))
+            self.assertEqual(len(findings_json), 2)
+
+            idle = FakeAdapter("claude", '{"findings":[]}')
+            third = run_review(req, adapters={"claude": idle})
+            self.assertEqual(idle.runs, 0)
+            self.assertEqual(third.provider_results["claude"]["reason"], "no_changes")
+            self.assertEqual(sorted(item["title"] for item in third.findings), ["Issue A", "Issue B2"])
+
+    def test_incremental_baseline_not_updated_by_unparsed_review(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.py").write_text("a = 1\n", encoding="utf-8")
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, incremental=True),
+            )
+            run_review(req, adapters={"claude": FakeAdapter("claude", "not json")})
+            retry = FakeAdapter("claude", '{"findings":[]}')
+            result = run_review(req, adapters={"claude": retry})
+            self.assertEqual(retry.runs, 1)
+            self.assertFalse(result.incremental["baseline"])  # type: ignore[index]
+
+    def test_optimistic_detect_starts_provider_before_detection_finishes(self) -> None:
+        for runner in (run_review, lambda req, adapters: asyncio.run(run_review_async(req, adapters=adapters))):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                adapter = SlowDetectFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=0.0, auth_ok=True)
+                req = ReviewRequest(
+                    repo_root=tmpdir,
+                    prompt="review",
+                    providers=["claude"],  # type: ignore[list-item]
+                    artifact_base=f"{tmpdir}/artifacts",
+                    policy=ReviewPolicy(timeout_seconds=3, max_retries=0, optimistic_detect=True),
+                )
+                result = runner(req, adapters={"claude": adapter})
+            self.assertTrue(adapter.started_before_detect_finished)
+            self.assertTrue(result.provider_results["claude"]["success"])
+
+    def test_optimistic_detect_cancels_run_when_validation_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = SlowDetectFakeAdapter("claude", '{"findings":[]}', complete_after_seconds=30.0, auth_ok=False)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=3, max_retries=0, poll_interval_seconds=0.05, optimistic_detect=True
+                ),
+            )
+            started = time.time()
+            result = run_review(req, adapters={"claude": adapter})
+        self.assertLess(time.time() - started, 5.0)
+        self.assertEqual(adapter.cancel_calls, 1)
+        details = result.provider_results["claude"]
+        self.assertFalse(details["success"])
+        self.assertEqual(details["reason"], "provider_unavailable")
+        self.assertEqual(details["presence_reason"], "auth_check_failed")
+
+    def test_without_fail_fast_all_providers_finish(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            raw = (
+                '{"findings":[{"finding_id":"f1","severity":"critical","category":"bug","title":"Crash",'
+                '"evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+                '"confidence":0.9,"fingerprint":"fp"}]}'
+            )
+            claude = FakeAdapter("claude", raw)
+            qwen = FakeAdapter("qwen", '{"findings":[]}')
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, max_provider_parallelism=1),
+            )
+            result = run_review(req, adapters={"claude": claude, "qwen": qwen})
+        self.assertEqual(qwen.runs, 1)
+        self.assertIsNone(result.early_exit)
+
     def test_review_deduplicates_same_finding_across_providers(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             raw = (
@@ -561,6 +1317,67 @@ class ReviewEngineTests(unittest.TestCase):
             self.assertEqual(len(payload), 1)
             self.assertEqual(payload[0].get("detected_by"), ["claude", "qwen"])
 
+    def test_review_events_report_findings_once_per_dedupe_key(self) -> None:
+        finding = (
+            '{"finding_id":"%s","severity":"critical","category":"bug","title":"Shared issue",'
+            '"evidence":{"file":"runtime/cli.py","line":123,"snippet":"x"},"recommendation":"fix",'
+            '"confidence":0.7,"fingerprint":"%s"}'
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude = FakeAdapter("claude", '{"findings":[%s]}' % (finding % ("f1", "fp1")))
+            qwen = FakeAdapter("qwen", '{"findings":[%s]}' % (finding % ("f2", "fp2")))
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, max_provider_parallelism=1),
+            )
+            events: list[dict] = []
+            result = run_review(req, adapters={"claude": claude, "qwen": qwen}, on_event=events.append)
+
+        kinds = [event["event"] for event in events]
+        self.assertEqual(
+            kinds,
+            ["provider_started", "provider_finished", "finding", "provider_started", "provider_finished", "decision"],
+        )
+        self.assertTrue(all(event["task_id"] == result.task_id for event in events))
+        finding_event = events[2]
+        self.assertEqual(finding_event["provider"], "claude")
+        self.assertEqual(finding_event["finding"]["severity"], "critical")
+        self.assertEqual(finding_event["finding"]["detected_by"], ["claude"])
+        self.assertEqual(events[-1]["decision"], result.decision)
+        self.assertEqual(events[-1]["findings_count"], 1)
+
+    def test_review_events_match_between_sync_and_async(self) -> None:
+        raw = '{"findings":[]}'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "codex"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, require_non_empty_findings=False),
+            )
+            sync_events: list[dict] = []
+            async_events: list[dict] = []
+            run_review(
+                req,
+                adapters={"claude": FakeAdapter("claude", raw), "codex": FakeAdapter("codex", raw)},
+                on_event=sync_events.append,
+            )
+            asyncio.run(
+                run_review_async(
+                    req,
+                    adapters={"claude": FakeAdapter("claude", raw), "codex": FakeAdapter("codex", raw)},
+                    on_event=async_events.append,
+                )
+            )
+        for events in (sync_events, async_events):
+            kinds = sorted(event["event"] for event in events[:-1])
+            self.assertEqual(kinds, ["provider_finished", "provider_finished", "provider_started", "provider_started"])
+            self.assertEqual(events[-1]["event"], "decision")
+
     def test_progress_output_prevents_stall_timeout_in_run_mode(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             progressive = ProgressTimedFakeAdapter(
@@ -813,6 +1630,166 @@ class ReviewEngineTests(unittest.TestCase):
             self.assertEqual(details.get("binary_path"), "/opt/homebrew/bin/codex")
             self.assertEqual(details.get("version"), "codex-cli 0.46.0")
 
+    def test_completed_run_parses_provider_output_once(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FakeAdapter(
+                "claude",
+                '{"type":"result","usage":{"input_tokens":7,"output_tokens":3}}\n'
+                '{"findings":[{"finding_id":"f1","severity":"low","category":"bug","title":"t","evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"r","confidence":0.5,"fingerprint":"fp"}]}',
+            )
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, high_escalation_threshold=2),
+                include_token_usage=True,
+            )
+            with patch.object(parsing, "extract_json_payloads", wraps=parsing.extract_json_payloads) as spy:
+                result = run_review(req, adapters={"claude": adapter}, write_artifacts=False)
+            self.assertEqual(spy.call_count, 1)
+            self.assertEqual(result.findings_count, 1)
+            self.assertEqual(result.provider_results["claude"]["token_usage"]["total_tokens"], 10)
+
+    def test_async_review_matches_sync_result(self) -> None:
+        stdout = '{"findings":[{"finding_id":"f1","severity":"high","category":"bug","title":"Bug","evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix","confidence":0.8,"fingerprint":"fp"}]}'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["codex", "claude"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, high_escalation_threshold=2),
+            )
+            sync_result = run_review(req, adapters={"claude": FakeAdapter("claude", stdout), "codex": FakeAdapter("codex", stdout)})
+            async_result = asyncio.run(
+                run_review_async(req, adapters={"claude": FakeAdapter("claude", stdout), "codex": FakeAdapter("codex", stdout)})
+            )
+            self.assertEqual(async_result.decision, sync_result.decision)
+            self.assertEqual(async_result.terminal_state, sync_result.terminal_state)
+            self.assertEqual(async_result.findings, sync_result.findings)
+            self.assertEqual(list(async_result.provider_results.keys()), ["claude", "codex"])
+            self.assertTrue(Path(async_result.artifact_root or "", "run.json").exists())
+
+    def test_async_review_runs_providers_concurrently_and_times_out_slow_one(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast = TimedFakeAdapter("claude", "done", complete_after_seconds=0.3)
+            slow = TimedFakeAdapter("codex", "", complete_after_seconds=30.0)
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="run",
+                providers=["claude", "codex"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(
+                    timeout_seconds=1,
+                    stall_timeout_seconds=1,
+                    poll_interval_seconds=0.05,
+                    max_retries=0,
+                    require_non_empty_findings=False,
+                ),
+            )
+            started = time.time()
+            result = asyncio.run(run_review_async(req, adapters={"claude": fast, "codex": slow}, review_mode=False))
+            self.assertLess(time.time() - started, 5.0)
+            self.assertEqual(result.terminal_state, "PARTIAL_SUCCESS")
+            self.assertTrue(result.provider_results["claude"]["success"])
+            self.assertEqual(result.provider_results["codex"].get("cancel_reason"), "stall_timeout")
+            self.assertGreaterEqual(slow.cancel_calls, 1)
+
+    def test_async_review_keeps_other_reviews_running_during_prepare_and_finalize(self) -> None:
+        for stage in ("_prepare_review", "_finalize_review"):
+            with self.subTest(stage=stage), tempfile.TemporaryDirectory() as tmpdir:
+                release = threading.Event()
+                released: list[bool] = []
+                original = getattr(review_engine, stage)
+
+                def blocking(first: object, *args: object, _original=original, **kwargs: object) -> object:
+                    task_id = getattr(first, "task_id", None)
+                    if task_id == "slow-review":
+                        # Blocks until the other review has finished, which needs the event loop to be free.
+                        released.append(release.wait(5.0))
+                    return _original(first, *args, **kwargs)
+
+                def request(task_id: str) -> ReviewRequest:
+                    return ReviewRequest(
+                        repo_root=tmpdir,
+                        prompt="review",
+                        providers=["claude"],  # type: ignore[list-item]
+                        artifact_base=f"{tmpdir}/artifacts",
+                        task_id=task_id,
+                        policy=ReviewPolicy(timeout_seconds=3, max_retries=0, require_non_empty_findings=False),
+                    )
+
+                async def scenario() -> tuple:
+                    slow = asyncio.create_task(
+                        run_review_async(request("slow-review"), adapters={"claude": FakeAdapter("claude", "{}")})
+                    )
+                    await asyncio.sleep(0)
+                    fast = await run_review_async(
+                        request("fast-review"), adapters={"claude": FakeAdapter("claude", "{}")}
+                    )
+                    release.set()
+                    return fast, await slow
+
+                with patch.object(review_engine, stage, blocking):
+                    fast, slow = asyncio.run(scenario())
+                self.assertEqual(released, [True])
+                self.assertEqual((fast.task_id, slow.task_id), ("fast-review", "slow-review"))
+
+    def test_async_review_spawns_providers_off_the_event_loop(self) -> None:
+        fast_finished = threading.Event()
+        spawn_released: list[bool] = []
+
+        class SlowSpawnAdapter(FakeAdapter):
+            def run(self, input_task: TaskInput) -> TaskRunRef:
+                # A blocking spawn that only returns once the other provider has finished on the loop.
+                spawn_released.append(fast_finished.wait(5.0))
+                return super().run(input_task)
+
+        finished: list[str] = []
+
+        def on_event(event: dict) -> None:
+            if event.get("event") == "provider_finished":
+                finished.append(str(event.get("provider")))
+                if event.get("provider") == "qwen":
+                    fast_finished.set()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="review",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=10, max_retries=0, require_non_empty_findings=False),
+            )
+            adapters = {"claude": SlowSpawnAdapter("claude", "{}"), "qwen": FakeAdapter("qwen", "{}")}
+            result = asyncio.run(run_review_async(req, adapters=adapters, on_event=on_event))
+
+        self.assertEqual(spawn_released, [True])
+        self.assertEqual(finished, ["qwen", "claude"])
+        self.assertTrue(all(details["success"] for details in result.provider_results.values()))
+
+    def test_async_review_runs_synthesis_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            claude = SequencedFakeAdapter("claude", ["First response from claude", "## Consensus\nAgreed."])
+            qwen = FakeAdapter("qwen", "Response from qwen")
+            req = ReviewRequest(
+                repo_root=tmpdir,
+                prompt="summarize",
+                providers=["claude", "qwen"],  # type: ignore[list-item]
+                artifact_base=f"{tmpdir}/artifacts",
+                policy=ReviewPolicy(timeout_seconds=3, max_retries=0, require_non_empty_findings=False),
+                synthesize=True,
+            )
+            result = asyncio.run(
+                run_review_async(req, adapters={"claude": claude, "qwen": qwen}, review_mode=False, write_artifacts=False)
+            )
+            synthesis = result.synthesis or {}
+            self.assertEqual(synthesis.get("provider"), "claude")
+            self.assertEqual(synthesis.get("reason"), "ok")
+            self.assertEqual(claude.runs, 2)
+            self.assertIsNone(result.artifact_root)
+
 
 if __name__ == "__main__":
     unittest.main()
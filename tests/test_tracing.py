@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from runtime.adapters.replay import ReplayProfile, ReplayRecording, replay_adapters
+from runtime.config import ReviewPolicy
+from runtime.review_engine import ReviewRequest, run_review, run_review_async
+from runtime.tracing import NOOP_TRACER, FileSpanExporter, build_tracer, parse_traceparent
+
+_FINDING_OUTPUT = (
+    '{"findings":[{"finding_id":"f1","severity":"low","category":"bug","title":"Traced issue",'
+    '"evidence":{"file":"a.py","line":1,"snippet":"x"},"recommendation":"fix",'
+    '"confidence":0.8,"fingerprint":"fp-trace"}]}'
+)
+_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+_PARENT_SPAN_ID = "00f067aa0ba902b7"
+
+
+def _request(tmpdir: str, trace_export: str) -> ReviewRequest:
+    return ReviewRequest(
+        repo_root=tmpdir,
+        prompt="review",
+        providers=["claude", "codex"],  # type: ignore[list-item]
+        artifact_base=f"{tmpdir}/artifacts",
+        policy=ReviewPolicy(timeout_seconds=3, max_retries=0, trace_export=trace_export),
+    )
+
+
+def _spans(payload: dict) -> List[dict]:
+    return payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+class TracingTests(unittest.TestCase):
+    def test_review_spans_are_appended_to_file_under_ci_parent(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), seed=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace_path = Path(tmpdir) / "traces.jsonl"
+            with patch.dict(os.environ, {"TRACEPARENT": f"00-{_TRACE_ID}-{_PARENT_SPAN_ID}-01"}):
+                run_review(_request(tmpdir, str(trace_path)), adapters=replay_adapters(["claude", "codex"], profile))
+            lines = trace_path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(len(lines), 1)
+        spans = _spans(json.loads(lines[0]))
+        by_id = {span["spanId"]: span for span in spans}
+        self.assertTrue(all(span["traceId"] == _TRACE_ID for span in spans))
+        (review,) = [span for span in spans if span["name"] == "mco.review"]
+        self.assertEqual(review["parentSpanId"], _PARENT_SPAN_ID)
+
+        def parent_name(span: dict) -> str:
+            return by_id[span["parentSpanId"]]["name"]
+
+        providers = [span for span in spans if span["name"] == "mco.provider"]
+        self.assertEqual(len(providers), 2)
+        self.assertTrue(all(parent_name(span) == "mco.review" for span in providers))
+        for name, parent in (("mco.attempt", "mco.provider"), ("mco.parse", "mco.attempt")):
+            matching = [span for span in spans if span["name"] == name]
+            self.assertEqual(len(matching), 2)
+            self.assertTrue(all(parent_name(span) == parent for span in matching))
+        normalize = [span for span in spans if span["name"] == "mco.normalize"]
+        self.assertTrue(normalize and all(parent_name(span) == "mco.parse" for span in normalize))
+        self.assertEqual(
+            {parent_name(span) for span in spans if span["name"] in ("mco.prepare", "mco.merge")}, {"mco.review"}
+        )
+        attempt = next(span for span in spans if span["name"] == "mco.attempt")
+        attribute_keys = {item["key"] for item in attempt["attributes"]}
+        self.assertTrue({"mco.provider", "mco.attempt", "mco.run_id", "mco.success"} <= attribute_keys)
+
+    def test_async_review_exports_spans_off_the_event_loop(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), seed=1)
+        export = FileSpanExporter.export
+        exporting_threads: List[threading.Thread] = []
+
+        def recording_export(exporter: FileSpanExporter, payload: dict) -> None:
+            exporting_threads.append(threading.current_thread())
+            export(exporter, payload)
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(FileSpanExporter, "export", recording_export):
+            trace_path = Path(tmpdir) / "traces.jsonl"
+            request = _request(tmpdir, str(trace_path))
+            asyncio.run(run_review_async(request, adapters=replay_adapters(["claude", "codex"], profile)))
+            lines = trace_path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(len(exporting_threads), 1)
+        self.assertIsNot(exporting_threads[0], threading.main_thread())
+
+    def test_export_failure_is_reported_without_failing_the_review(self) -> None:
+        profile = ReplayProfile(recordings=(ReplayRecording(stdout=_FINDING_OUTPUT),), seed=1)
+        stderr = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+            FileSpanExporter, "export", side_effect=http.client.RemoteDisconnected("closed")
+        ), contextlib.redirect_stderr(stderr):
+            request = _request(tmpdir, f"{tmpdir}/traces.jsonl")
+            result = run_review(request, adapters=replay_adapters(["claude", "codex"], profile))
+
+        self.assertEqual(result.decision, "PASS")
+        self.assertIn("Trace export error: RemoteDisconnected: closed", stderr.getvalue())
+
+    def test_spans_are_posted_to_collector(self) -> None:
+        received: List[tuple] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received.append((self.path, json.loads(body)))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            tracer = build_tracer(f"http://127.0.0.1:{server.server_port}", traceparent="")
+            with tracer.span("mco.review") as review:
+                with tracer.span("mco.provider", review, provider="claude"):
+                    pass
+            tracer.flush("test")
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(len(received), 1)
+        path, payload = received[0]
+        self.assertEqual(path, "/v1/traces")
+        self.assertEqual([span["name"] for span in _spans(payload)], ["mco.provider", "mco.review"])
+
+    def test_disabled_export_is_noop_and_bad_traceparent_is_ignored(self) -> None:
+        self.assertIs(build_tracer(""), NOOP_TRACER)
+        with NOOP_TRACER.span("mco.review") as span:
+            span.set(task_id="x")
+        self.assertIsNone(parse_traceparent("00-not-a-trace-01"))
+        self.assertIsNone(parse_traceparent(f"00-{'0' * 32}-{_PARENT_SPAN_ID}-01"))
+        with tempfile.NamedTemporaryFile() as not_a_dir:
+            tracer = build_tracer(f"{not_a_dir.name}/traces.jsonl", traceparent="garbage")
+            self.assertEqual(len(tracer.trace_id), 32)
+            with tracer.span("mco.review"):
+                pass
+            tracer.flush()  # an unwritable file must not raise
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from runtime.adapters import ClaudeAdapter, OpenCodeAdapter
+from runtime.adapters.warm_pool import WarmServerPool, _pid_alive
+from runtime.contracts import TaskInput
+
+_LISTENER = (
+    "import socket, sys, time\n"
+    "s = socket.socket()\n"
+    "s.bind(('127.0.0.1', int(sys.argv[1])))\n"
+    "s.listen()\n"
+    "time.sleep(60)\n"
+)
+
+
+def _listener_command(port: int) -> list:
+    return [sys.executable, "-c", _LISTENER, str(port)]
+
+
+class WarmServerPoolTests(unittest.TestCase):
+    def _wait_dead(self, pid: int) -> bool:
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            try:
+                os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                pass
+            if not _pid_alive(pid):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def test_server_is_started_once_and_reused(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = WarmServerPool(Path(tmpdir) / "warm", idle_seconds=60)
+            first = pool.acquire("opencode", tmpdir, _listener_command)
+            second = pool.acquire("opencode", tmpdir, _listener_command)
+            self.assertIsNotNone(first)
+            self.assertEqual(first, second)
+            record = json.loads(next((Path(tmpdir) / "warm").glob("*.json")).read_text(encoding="utf-8"))
+            self.assertEqual(record["url"], first)
+
+            pool.idle_seconds = 0
+            time.sleep(0.01)
+            self.assertEqual(pool.reap(), ["opencode"])
+            self.assertTrue(self._wait_dead(record["pid"]))
+            self.assertEqual(list((Path(tmpdir) / "warm").glob("*.json")), [])
+
+    def test_reap_spares_a_server_with_an_attached_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = WarmServerPool(Path(tmpdir) / "warm", idle_seconds=60)
+            url = pool.acquire("opencode", tmpdir, _listener_command)
+            self.assertIsNotNone(url)
+            record_path = next((Path(tmpdir) / "warm").glob("*.json"))
+            server_pid = json.loads(record_path.read_text(encoding="utf-8"))["pid"]
+            client = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            try:
+                pool.attach("opencode", tmpdir, client.pid)
+                # A concurrent mco process with a short idle window must not stop the server mid-run.
+                impatient = WarmServerPool(Path(tmpdir) / "warm", idle_seconds=0)
+                time.sleep(0.01)
+                self.assertEqual(impatient.reap(), [])
+                self.assertEqual(pool.acquire("opencode", tmpdir, _listener_command), url)
+                self.assertTrue(_pid_alive(server_pid))
+            finally:
+                client.kill()
+                client.wait()
+
+            pool.detach("opencode", tmpdir, client.pid)
+            self.assertEqual(json.loads(record_path.read_text(encoding="utf-8"))["leases"], [])
+            self.assertEqual(pool.reap(), [])
+            time.sleep(0.01)
+            self.assertEqual(impatient.reap(), ["opencode"])
+            self.assertTrue(self._wait_dead(server_pid))
+
+    def test_server_that_never_listens_falls_back(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pool = WarmServerPool(Path(tmpdir) / "warm", idle_seconds=60, startup_timeout_seconds=0.5)
+            url = pool.acquire("opencode", tmpdir, lambda _port: [sys.executable, "-c", "import sys; sys.exit(1)"])
+            self.assertIsNone(url)
+
+
+class WarmServerAdapterTests(unittest.TestCase):
+    def _task(self, pool_dir: str) -> TaskInput:
+        return TaskInput(
+            task_id="task-1",
+            prompt="review",
+            repo_root=pool_dir,
+            target_paths=["."],
+            timeout_seconds=10,
+            metadata={"warm_pool_dir": pool_dir, "warm_pool_idle_seconds": 60},
+        )
+
+    def test_opencode_attaches_to_warm_server(self) -> None:
+        adapter = OpenCodeAdapter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task = self._task(tmpdir)
+            with patch.object(WarmServerPool, "acquire", return_value="http://127.0.0.1:4096") as acquire:
+                self.assertEqual(adapter._warm_server_url(task), "http://127.0.0.1:4096")  # type: ignore[attr-defined]
+            self.assertEqual(acquire.call_args.args[2](4096)[-4:], ["--hostname", "127.0.0.1", "--port", "4096"])
+            self.assertEqual(
+                adapter._build_attached_command(task, "http://127.0.0.1:4096"),  # type: ignore[attr-defined]
+                ["opencode", "run", "--attach", "http://127.0.0.1:4096", "review", "--format", "json"],
+            )
+
+    def test_attached_run_holds_a_lease_until_it_finishes(self) -> None:
+        adapter = OpenCodeAdapter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            task = self._task(tmpdir)
+            task.metadata["artifact_root"] = f"{tmpdir}/artifacts"
+            with patch.object(WarmServerPool, "acquire", return_value="http://127.0.0.1:4096"), patch.object(
+                WarmServerPool, "attach"
+            ) as attach, patch.object(WarmServerPool, "detach") as detach, patch.object(
+                adapter, "_build_attached_command", return_value=[sys.executable, "-c", "pass"]
+            ):
+                ref = adapter.run(task)
+                attach.assert_called_once_with("opencode", tmpdir, ref.pid)
+                self.assertTrue(adapter.wait(ref, 5.0))
+                self.assertTrue(adapter.poll(ref).completed)
+            detach.assert_called_once_with("opencode", tmpdir, ref.pid)
+
+    def test_providers_without_server_mode_are_not_pooled(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(WarmServerPool, "acquire") as acquire:
+                self.assertIsNone(ClaudeAdapter()._warm_server_url(self._task(tmpdir)))  # type: ignore[attr-defined]
+            acquire.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()